@@ -0,0 +1,112 @@
+"""Bytes on the wire and CPU per request for typical todo list pages.
+
+Usage: python benchmarks/compression.py [--requests 200]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from infrastructure.api.compression import (  # noqa: E402
+    CompressionMiddleware,
+    available_encodings,
+)
+
+WORDS = (
+    "review deploy write docs fix bug refactor meeting notes sprint planning "
+    "migrate database update dependencies customer feedback release checklist"
+).split()
+
+
+def make_todo(rng: random.Random, description_words: int) -> dict:
+    now = datetime(2025, 1, 1) + timedelta(minutes=rng.randint(0, 500_000))
+    return {
+        "id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "title": " ".join(rng.choices(WORDS, k=5)).capitalize(),
+        "description": " ".join(rng.choices(WORDS, k=description_words)),
+        "status": rng.choice(["pending", "in_progress", "completed"]),
+        "priority": rng.randint(1, 4),
+        "created_at": now.isoformat(),
+        "updated_at": now.isoformat(),
+        "completed_at": None,
+        "due_date": (now + timedelta(days=3)).isoformat(),
+        "tags": rng.sample(WORDS, k=3),
+        "is_overdue": False,
+    }
+
+
+def make_page(limit: int, description_words: int) -> bytes:
+    rng = random.Random(limit * 1000 + description_words)
+    items = [make_todo(rng, description_words) for _ in range(limit)]
+    payload = {"items": items, "total": 10_000, "limit": limit, "offset": 0}
+    return json.dumps(payload).encode()
+
+
+async def run_once(middleware: CompressionMiddleware, body: bytes, encoding: str, chunks: int):
+    sent = 0
+
+    async def app(scope, receive, send):
+        headers = [(b"content-type", b"application/json")]
+        if chunks == 1:
+            headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        step = max(1, len(body) // chunks)
+        for start in range(0, len(body), step):
+            part = body[start : start + step]
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": part,
+                    "more_body": start + step < len(body),
+                }
+            )
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal sent
+        if message["type"] == "http.response.body":
+            sent += len(message.get("body", b""))
+
+    middleware.app = app
+    scope = {
+        "type": "http",
+        "headers": [(b"accept-encoding", encoding.encode())],
+    }
+    await middleware(scope, receive, send)
+    return sent
+
+
+async def main(requests: int) -> None:
+    shapes = [(20, 0), (20, 40), (100, 40)]
+    encodings = ["identity"] + list(available_encodings())
+    print(f"{'page':>14} {'mode':>9} {'encoding':>9} {'bytes':>9} {'ratio':>6} {'cpu/req':>10}")
+    for limit, words in shapes:
+        body = make_page(limit, words)
+        for chunks, mode in ((1, "buffered"), (8, "streamed")):
+            for encoding in encodings:
+                middleware = CompressionMiddleware(None)
+                started = time.process_time()
+                for _ in range(requests):
+                    size = await run_once(middleware, body, encoding, chunks)
+                cpu = (time.process_time() - started) / requests
+                print(
+                    f"{f'{limit}x{words}w':>14} {mode:>9} {encoding:>9} {size:>9} "
+                    f"{size / len(body):>6.2f} {cpu * 1e6:>8.1f}us"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,134 @@
+"""Events/sec through the partitioned consumer, with ordering and failure checks.
+
+Usage: python benchmarks/event_consumer.py [--events 20000] [--users 200]
+                                           [--handler-ms 1] [--failure-rate 0.01]
+                                           [--poison-rate 0.001]
+
+Events are published to an InProcessBroker through BrokerEventBus and run
+by a PartitionedConsumer at concurrency 1 and at consumer_concurrency. The
+handler sleeps --handler-ms, fails once for --failure-rate of the events
+(they must succeed on retry) and always fails for --poison-rate of them
+(they must be dead-lettered). Each run checks that every user's events
+were handled in publish order, that nothing was lost, and that the
+committed offsets reached the end of every partition. Needs no database.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config.settings import get_settings  # noqa: E402
+from domain.events.todo_events import TodoCreated  # noqa: E402
+from domain.value_objects.todo_id import TodoId  # noqa: E402
+from infrastructure.events.broker import BrokerEventBus, InProcessBroker  # noqa: E402
+from infrastructure.events.consumer import PartitionedConsumer  # noqa: E402
+
+
+class Workload:
+    def __init__(self, args, seed: int = 7):
+        rng = random.Random(seed)
+        self.handler_seconds = args.handler_ms / 1000
+        self.events = []
+        self.flaky = set()
+        self.poison = set()
+        for i in range(args.events):
+            self.events.append(
+                TodoCreated(
+                    todo_id=TodoId.generate(),
+                    title=str(i),
+                    user_id=f"user-{rng.randrange(args.users)}",
+                )
+            )
+            draw = rng.random()
+            if draw < args.poison_rate:
+                self.poison.add(i)
+            elif draw < args.poison_rate + args.failure_rate:
+                self.flaky.add(i)
+        self.handled = defaultdict(list)
+        self.failed_once = set()
+
+    async def handle(self, event: TodoCreated) -> None:
+        index = int(event.title)
+        await asyncio.sleep(self.handler_seconds)
+        if index in self.poison:
+            raise RuntimeError("poison event")
+        if index in self.flaky and index not in self.failed_once:
+            self.failed_once.add(index)
+            raise RuntimeError("transient failure")
+        self.handled[event.user_id].append(index)
+
+
+async def run_once(args, concurrency: int) -> None:
+    workload = Workload(args)
+    bus = BrokerEventBus(InProcessBroker(partitions=args.partitions))
+    bus.subscribe(TodoCreated, workload.handle)
+    consumer = PartitionedConsumer(
+        bus.broker,
+        bus.dispatcher,
+        concurrency=concurrency,
+        retry_backoff_seconds=0.001,
+    )
+
+    started = time.perf_counter()
+    await consumer.start()
+    for event in workload.events:
+        await bus.publish(event)
+    expected = len(workload.events) - len(workload.poison)
+    while sum(map(len, workload.handled.values())) < expected or len(
+        bus.broker.dead_letters
+    ) < len(workload.poison):
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+    await consumer.stop()
+
+    published = defaultdict(list)
+    for index, event in enumerate(workload.events):
+        if index not in workload.poison:
+            published[event.user_id].append(index)
+    in_order = all(workload.handled[user] == indexes for user, indexes in published.items())
+    dead = sorted(int(letter.message.event.title) for letter in bus.broker.dead_letters)
+    fully_committed = bus.broker.committed_offsets() == await bus.broker.end_offsets()
+
+    print(
+        f"  concurrency {concurrency:<3} {len(workload.events) / elapsed:9.0f} events/s"
+        f"  in order: {in_order}"
+        f"  retried: {len(workload.failed_once)}"
+        f"  dead-lettered: {len(dead)} (expected {len(workload.poison)},"
+        f" match {dead == sorted(workload.poison)})"
+        f"  committed to end: {fully_committed}"
+    )
+
+
+async def run(args) -> None:
+    print(
+        f"{args.events} events, {args.users} users, {args.partitions} partitions,"
+        f" {args.handler_ms} ms handler"
+    )
+    for concurrency in dict.fromkeys((1, args.concurrency)):
+        await run_once(args, concurrency)
+
+
+def main() -> None:
+    # Poison events are dead-lettered on purpose; their tracebacks are noise here.
+    logging.getLogger("infrastructure.events.consumer").setLevel(logging.CRITICAL)
+    settings = get_settings()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--partitions", type=int, default=settings.consumer_partitions)
+    parser.add_argument("--concurrency", type=int, default=settings.consumer_concurrency)
+    parser.add_argument("--handler-ms", type=float, default=1.0)
+    parser.add_argument("--failure-rate", type=float, default=0.01)
+    parser.add_argument("--poison-rate", type=float, default=0.001)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Commits/sec and latency of concurrent creates, with and without group commit.
+
+Usage: python benchmarks/group_commit.py [--requests 5000] [--concurrency 64]
+                                         [--window-ms 2] [--max-batch 64]
+
+Runs against the database in settings.database_url (the schema must exist),
+first through CreateTodoHandler with one transaction per create, then
+through the WriteCoalescer.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from application.use_cases.commands.create_todo import (  # noqa: E402
+    CreateTodoCommand,
+    CreateTodoHandler,
+)
+from domain.value_objects.priority import Priority  # noqa: E402
+from infrastructure.events.event_bus import InMemoryEventBus  # noqa: E402
+from infrastructure.persistence.sqlalchemy.database import (  # noqa: E402
+    async_session_maker,
+    engine,
+)
+from infrastructure.persistence.sqlalchemy.group_commit import WriteCoalescer  # noqa: E402
+from infrastructure.persistence.sqlalchemy.unit_of_work import (  # noqa: E402
+    SQLAlchemyUnitOfWork,
+)
+
+
+def command(i: int) -> CreateTodoCommand:
+    return CreateTodoCommand(
+        title=f"Benchmark todo {i}",
+        description=None,
+        priority=Priority.MEDIUM,
+        due_date=None,
+        tags=["benchmark"],
+        user_id="bench-user",
+    )
+
+
+async def direct_create(i: int) -> None:
+    handler = CreateTodoHandler(SQLAlchemyUnitOfWork(async_session_maker), InMemoryEventBus())
+    await handler.handle(command(i))
+
+
+async def drive(create, requests: int, concurrency: int) -> dict:
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await create(i)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "p50": statistics.median(latencies),
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+
+async def run(args) -> None:
+    direct = await drive(direct_create, args.requests, args.concurrency)
+    print(
+        f"direct     {args.requests / direct['elapsed']:8.0f} commits/s"
+        f"  p50 {direct['p50']:6.1f} ms  p99 {direct['p99']:6.1f} ms"
+    )
+
+    coalescer = WriteCoalescer(
+        async_session_maker,
+        InMemoryEventBus(),
+        window_seconds=args.window_ms / 1000,
+        max_batch_size=args.max_batch,
+    )
+    grouped = await drive(
+        lambda i: coalescer.submit(command(i)), args.requests, args.concurrency
+    )
+    print(
+        f"coalesced  {coalescer.commits / grouped['elapsed']:8.0f} commits/s"
+        f"  {args.requests / grouped['elapsed']:8.0f} writes/s"
+        f"  p50 {grouped['p50']:6.1f} ms  p99 {grouped['p99']:6.1f} ms"
+        f"  ({coalescer.writes / max(coalescer.commits, 1):.1f} writes/commit)"
+    )
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--window-ms", type=float, default=2.0)
+    parser.add_argument("--max-batch", type=int, default=64)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Rows/sec of POST /todos:import's pipeline: streamed parsing, validation, staging.
+
+Usage: python benchmarks/import_todos.py [--rows 200000] [--format ndjson|csv]
+                                         [--batch-size 5000] [--postgres]
+
+Without --postgres the rows are loaded into the in-memory backend, which
+measures parsing and validation alone; with it they go through binary COPY
+into the database from settings.database_url.
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from application.use_cases.commands.import_todos import (  # noqa: E402
+    ImportTodosCommand,
+    ImportTodosHandler,
+)
+from infrastructure.api.imports import parse_csv, parse_ndjson  # noqa: E402
+from infrastructure.events.event_bus import InMemoryEventBus  # noqa: E402
+from infrastructure.persistence.memory.bulk_import import InMemoryTodoImporter  # noqa: E402
+from infrastructure.persistence.memory.store import InMemoryTodoStore  # noqa: E402
+
+WORDS = (
+    "review deploy write docs fix bug refactor meeting notes sprint planning "
+    "migrate database update dependencies customer feedback release checklist"
+).split()
+FIELDS = ["title", "description", "priority", "status", "due_date", "tags"]
+CHUNK_SIZE = 64 * 1024
+
+
+def make_row(rng: random.Random) -> dict:
+    due = datetime(2025, 1, 1) + timedelta(hours=rng.randint(0, 20_000))
+    return {
+        "title": " ".join(rng.choices(WORDS, k=5)).capitalize(),
+        "description": " ".join(rng.choices(WORDS, k=12)),
+        "priority": rng.randint(1, 4),
+        "status": rng.choice(["pending", "in_progress", "completed"]),
+        "due_date": due.isoformat(),
+        "tags": rng.sample(WORDS, k=3),
+    }
+
+
+def make_upload(rows: int, fmt: str) -> bytes:
+    rng = random.Random(rows)
+    if fmt == "ndjson":
+        return "".join(json.dumps(make_row(rng)) + "\n" for _ in range(rows)).encode()
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=FIELDS)
+    writer.writeheader()
+    for _ in range(rows):
+        row = make_row(rng)
+        row["tags"] = ";".join(row["tags"])
+        writer.writerow(row)
+    return out.getvalue().encode()
+
+
+async def chunks(body: bytes):
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start : start + CHUNK_SIZE]
+
+
+async def run(body: bytes, fmt: str, batch_size: int, postgres: bool) -> dict:
+    if postgres:
+        from infrastructure.persistence.sqlalchemy.bulk_import import CopyTodoImporter
+        from infrastructure.persistence.sqlalchemy.database import engine
+
+        importer = CopyTodoImporter(engine)
+    else:
+        importer = InMemoryTodoImporter(InMemoryTodoStore())
+
+    handler = ImportTodosHandler(importer, InMemoryEventBus(), batch_size=batch_size)
+    parse = parse_ndjson if fmt == "ndjson" else parse_csv
+    command = ImportTodosCommand(user_id="bench-user", rows=parse(chunks(body)))
+
+    summary = None
+    async for record in handler.handle(command):
+        if record["type"] == "summary":
+            summary = record
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--postgres", action="store_true")
+    args = parser.parse_args()
+
+    body = make_upload(args.rows, args.format)
+    started = time.perf_counter()
+    summary = asyncio.run(run(body, args.format, args.batch_size, args.postgres))
+    elapsed = time.perf_counter() - started
+
+    target = "postgres COPY" if args.postgres else "in-memory"
+    print(f"{args.rows} {args.format} rows ({len(body) / 1e6:.1f} MB) into {target}")
+    print(f"  {elapsed:.2f} s, {args.rows / elapsed:,.0f} rows/sec")
+    print(f"  summary: {summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Per-request dependency overhead and pool occupancy, request-scoped vs lazy sessions.
+
+Usage: python benchmarks/request_overhead.py [--requests 2000] [--concurrency 50]
+                                             [--send-ms 5]
+
+"request-scoped" mirrors the previous wiring: a session per request that
+holds its connection until the response has been sent (simulated by
+--send-ms). "lazy" uses the container's read session, which checks a
+connection out at the first statement and keeps it, for one snapshot,
+until the request's teardown closes it. The overhead section needs no
+database; the occupancy section runs against settings.database_url.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from application.use_cases.queries.get_todo import GetTodoHandler  # noqa: E402
+from domain.exceptions import TodoNotFoundError  # noqa: E402
+from infrastructure.container import get_container  # noqa: E402
+from infrastructure.persistence.sqlalchemy.database import (  # noqa: E402
+    async_session_maker,
+    engine,
+)
+from infrastructure.persistence.sqlalchemy.read_repositories import (  # noqa: E402
+    TodoReadRepository,
+)
+
+
+async def request_scoped(todo_id: str, send_ms: float, query: bool = True) -> None:
+    async with async_session_maker() as session:
+        handler = GetTodoHandler(TodoReadRepository(session))
+        if query:
+            await _get(handler, todo_id)
+            await asyncio.sleep(send_ms / 1000)
+
+
+async def lazy(todo_id: str, send_ms: float, query: bool = True) -> None:
+    session = get_container().read_session()
+    try:
+        handler = GetTodoHandler(TodoReadRepository(session))
+        if query:
+            await _get(handler, todo_id)
+            await asyncio.sleep(send_ms / 1000)
+    finally:
+        await session.close()
+
+
+async def _get(handler: GetTodoHandler, todo_id: str) -> None:
+    try:
+        await handler.handle(todo_id, "bench-user")
+    except TodoNotFoundError:
+        pass
+
+
+async def overhead(flow, rounds: int = 20_000) -> float:
+    """Microseconds to build (and tear down) the dependencies of one request"""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await flow("", 0, query=False)
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+async def occupancy(flow, requests: int, concurrency: int, send_ms: float) -> dict:
+    samples = []
+    done = asyncio.Event()
+
+    async def sample() -> None:
+        while not done.is_set():
+            samples.append(engine.pool.checkedout())
+            await asyncio.sleep(0.001)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            await flow(str(uuid.uuid4()), send_ms)
+
+    sampler = asyncio.create_task(sample())
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await sampler
+    return {
+        "rps": requests / elapsed,
+        "mean": sum(samples) / max(len(samples), 1),
+        "max": max(samples, default=0),
+    }
+
+
+async def run(args) -> None:
+    print("dependency overhead per request (no statement executed)")
+    for name, flow in (("request-scoped", request_scoped), ("lazy", lazy)):
+        print(f"  {name:<15} {await overhead(flow):7.2f} us")
+
+    print(f"pool occupancy, {args.concurrency} concurrent, {args.send_ms} ms send")
+    for name, flow in (("request-scoped", request_scoped), ("lazy", lazy)):
+        result = await occupancy(flow, args.requests, args.concurrency, args.send_ms)
+        print(
+            f"  {name:<15} {result['rps']:8.0f} req/s"
+            f"  connections checked out: mean {result['mean']:5.1f}, max {result['max']}"
+        )
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--send-ms", type=float, default=5.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional
+
+
+@dataclass
+class TrendPointDTO:
+    """Todos created and completed in one bucket; net_open runs from the start of the range"""
+
+    bucket_start: date
+    created: int
+    completed: int
+    net_open: int
+
+
+@dataclass
+class CompletionTimeDTO:
+    """Time from creation to completion; priority None covers all priorities"""
+
+    priority: Optional[int]
+    completed: int
+    p50_hours: Optional[float]
+    p90_hours: Optional[float]
+
+
+@dataclass
+class OverdueRateDTO:
+    priority: int
+    completed_with_due_date: int
+    completed_late: int
+    open_overdue: int
+    overdue_rate: Optional[float]
+
+
+@dataclass
+class AnalyticsDTO:
+    since: date
+    until: date
+    bucket: str
+    trend: List[TrendPointDTO]
+    time_to_complete: List[CompletionTimeDTO]
+    overdue: List[OverdueRateDTO]
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class ProjectDTO:
+    id: str
+    name: str
+    open_count: int
+    completed_count: int
+    created_at: datetime
+    updated_at: datetime
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+
+from domain.entities.todo import Todo
 
 
 @dataclass
@@ -16,3 +18,99 @@ class TodoDTO:
     due_date: Optional[datetime]
     tags: List[str]
     is_overdue: bool
+    recurrence: Optional[str] = None
+    parent_id: Optional[str] = None
+    project_id: Optional[str] = None
+
+
+
+def todo_to_dto(todo: Todo) -> TodoDTO:
+    return TodoDTO(
+        id=str(todo.id),
+        title=todo.title,
+        description=todo.description,
+        status=todo.status.value,
+        priority=todo.priority.value,
+        created_at=todo.created_at,
+        updated_at=todo.updated_at,
+        completed_at=todo.completed_at,
+        due_date=todo.due_date,
+        tags=todo.tags,
+        is_overdue=todo.is_overdue(),
+        recurrence=str(todo.recurrence) if todo.recurrence else None,
+        parent_id=str(todo.parent_id) if todo.parent_id else None,
+        project_id=str(todo.project_id) if todo.project_id else None,
+    )
+
+
+@dataclass
+class TodoTreeDTO:
+    """A todo with its subtasks; done and total count all of its descendants"""
+
+    todo: TodoDTO
+    done: int
+    total: int
+    children: List["TodoTreeDTO"]
+
+
+@dataclass
+class SubtaskCountsDTO:
+    todo_id: str
+    done: int
+    total: int
+
+
+@dataclass
+class TodoOccurrenceDTO:
+    """A future occurrence of a recurring todo that is not stored yet"""
+
+    todo_id: str
+    title: str
+    priority: int
+    due_date: datetime
+    occurrence_index: int
+
+
+@dataclass
+class TodoChangesDTO:
+    changed: List[TodoDTO]
+    deleted: List[str]
+    next_token: str
+    has_more: bool
+
+
+@dataclass
+class TodoVersionDTO:
+    version: int
+    kind: str
+    changes: Dict[str, Any]
+    recorded_at: datetime
+
+
+@dataclass
+class TodoHistoryDTO:
+    """Newest first; next_cursor is the `before` of the following page"""
+
+    items: List[TodoVersionDTO]
+    next_cursor: Optional[int]
+
+
+@dataclass
+class TodoStateDTO:
+    """A todo as of one version, rebuilt from its latest snapshot and later diffs"""
+
+    todo_id: str
+    version: int
+    recorded_at: datetime
+    deleted: bool
+    state: Dict[str, Any]
+    replayed: int
+
+
+@dataclass
+class TitleSuggestionDTO:
+    id: str
+    title: str
+
+
+TODO_FIELDS = tuple(field.name for field in fields(TodoDTO))
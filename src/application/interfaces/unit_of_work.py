@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
+from domain.repositories.project_repository import ProjectRepository
 from domain.repositories.todo_repository import TodoRepository
 
 T = TypeVar("T")
@@ -8,6 +9,7 @@ T = TypeVar("T")
 
 class UnitOfWork(ABC, Generic[T]):
     todos: TodoRepository
+    projects: ProjectRepository
 
     @abstractmethod
     async def __aenter__(self) -> T:
@@ -1,16 +1,20 @@
 from dataclasses import dataclass
 
-from domain.events.todo_events import TodoCompleted
+from domain.entities.project import ProjectCounterDeltas
+from domain.events.todo_events import TodoCompleted, TodoCreated
 from domain.exceptions import TodoNotFoundError
 from domain.value_objects.todo_id import TodoId
 from ...interfaces.event_bus import EventBus
 from ...interfaces.unit_of_work import UnitOfWork
+from .project_counters import apply_project_counters
 
 
 @dataclass
 class CompleteTodoCommand:
     todo_id: str
     user_id: str
+    # Also complete every open subtask below the todo.
+    cascade: bool = False
 
 
 class CompleteTodoHandler:
@@ -20,15 +24,48 @@ class CompleteTodoHandler:
 
     async def handle(self, command: CompleteTodoCommand) -> None:
         async with self.uow:
-            todo = await self.uow.todos.find_by_id(TodoId(command.todo_id))
-            if not todo:
+            # Locked, so concurrent writes cannot both apply counter deltas
+            # computed from the same prior state.
+            todo = await self.uow.todos.find_by_id_for_update(TodoId(command.todo_id))
+            if todo is None or todo.user_id != command.user_id:
                 raise TodoNotFoundError(f"Todo {command.todo_id} not found")
 
+            deltas = ProjectCounterDeltas()
+            deltas.remove(todo)
             todo.complete()
+            deltas.add(todo)
 
             await self.uow.todos.save(todo)
 
-            event = TodoCompleted(todo_id=todo.id, user_id=command.user_id)
-            await self.event_bus.publish(event)
+            completed = [todo]
+            events = []
+            if command.cascade:
+                descendants = await self.uow.todos.complete_descendants(todo)
+                for descendant in descendants:
+                    deltas.complete(descendant.project_id)
+                completed.extend(descendants)
+
+            for done in completed:
+                events.append(TodoCompleted(todo_id=done.id, user_id=command.user_id))
+
+                # Recurring todos only ever store their next occurrence; later
+                # ones are expanded virtually by list queries.
+                next_todo = done.next_occurrence()
+                if next_todo is not None:
+                    await self.uow.todos.save(next_todo)
+                    deltas.add(next_todo)
+                    events.append(
+                        TodoCreated(
+                            todo_id=next_todo.id,
+                            title=next_todo.title,
+                            user_id=command.user_id,
+                        )
+                    )
+
+            await apply_project_counters(self.uow, command.user_id, deltas)
 
             await self.uow.commit()
+
+        # Subscribers only ever hear about committed writes.
+        for event in events:
+            await self.event_bus.publish(event)
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+from domain.entities.project import Project
+from domain.value_objects.project_id import ProjectId
+from ...interfaces.unit_of_work import UnitOfWork
+
+
+@dataclass
+class CreateProjectCommand:
+    name: str
+    user_id: str
+
+
+class CreateProjectHandler:
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def handle(self, command: CreateProjectCommand) -> str:
+        project = Project(id=ProjectId.generate(), name=command.name, user_id=command.user_id)
+
+        async with self.uow:
+            await self.uow.projects.save(project)
+            await self.uow.commit()
+
+        return str(project.id)
@@ -2,13 +2,18 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+from domain.entities.project import ProjectCounterDeltas
 from domain.entities.todo import Todo
 from domain.events.todo_events import TodoCreated
+from domain.exceptions import InvalidRecurrenceRuleError, TodoNotFoundError
 from domain.value_objects.priority import Priority
+from domain.value_objects.project_id import ProjectId
+from domain.value_objects.recurrence_rule import RecurrenceRule
 from domain.value_objects.todo_id import TodoId
 from domain.value_objects.todo_status import TodoStatus
 from ...interfaces.event_bus import EventBus
 from ...interfaces.unit_of_work import UnitOfWork
+from .project_counters import apply_project_counters
 
 
 @dataclass
@@ -19,6 +24,33 @@ class CreateTodoCommand:
     due_date: Optional[datetime]
     tags: list[str]
     user_id: str
+    recurrence: Optional[str] = None
+    parent_id: Optional[str] = None
+    project_id: Optional[str] = None
+
+
+def build_todo(command: CreateTodoCommand) -> Todo:
+    recurrence = None
+    if command.recurrence:
+        if command.due_date is None:
+            raise InvalidRecurrenceRuleError("Recurring todos need a due_date")
+        recurrence = RecurrenceRule.parse(command.recurrence)
+
+    now = datetime.utcnow()
+    return Todo(
+        id=TodoId.generate(),
+        title=command.title,
+        description=command.description,
+        status=TodoStatus.PENDING,
+        priority=command.priority,
+        created_at=now,
+        updated_at=now,
+        due_date=command.due_date,
+        tags=command.tags,
+        user_id=command.user_id,
+        recurrence=recurrence,
+        project_id=ProjectId(command.project_id) if command.project_id else None,
+    )
 
 
 class CreateTodoHandler:
@@ -27,26 +59,28 @@ class CreateTodoHandler:
         self.event_bus = event_bus
 
     async def handle(self, command: CreateTodoCommand) -> str:
+        todo = build_todo(command)
+
         async with self.uow:
-            todo = Todo(
-                id=TodoId.generate(),
-                title=command.title,
-                description=command.description,
-                status=TodoStatus.PENDING,
-                priority=command.priority,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-                due_date=command.due_date,
-                tags=command.tags,
-            )
+            if command.parent_id is not None:
+                parent = await self.uow.todos.find_by_id(TodoId(command.parent_id))
+                if parent is None or parent.user_id != command.user_id:
+                    raise TodoNotFoundError(f"Parent todo {command.parent_id} not found")
+                todo.attach_to(parent)
+                if todo.project_id is None:
+                    todo.project_id = parent.project_id
 
             await self.uow.todos.save(todo)
 
-            event = TodoCreated(
-                todo_id=todo.id, title=todo.title, user_id=command.user_id
+            deltas = ProjectCounterDeltas()
+            deltas.add(todo)
+            await apply_project_counters(
+                self.uow, command.user_id, deltas, required=todo.project_id
             )
-            await self.event_bus.publish(event)
 
             await self.uow.commit()
 
-            return str(todo.id)
+        event = TodoCreated(todo_id=todo.id, title=todo.title, user_id=command.user_id)
+        await self.event_bus.publish(event)
+
+        return str(todo.id)
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+from domain.events.todo_events import TodoUpdated
+from domain.exceptions import ProjectNotFoundError
+from domain.value_objects.project_id import ProjectId
+from ...interfaces.event_bus import EventBus
+from ...interfaces.unit_of_work import UnitOfWork
+
+
+@dataclass
+class DeleteProjectCommand:
+    project_id: str
+    user_id: str
+
+
+class DeleteProjectHandler:
+    """Deletes a project; its todos are kept and just leave the project"""
+
+    def __init__(self, uow: UnitOfWork, event_bus: EventBus):
+        self.uow = uow
+        self.event_bus = event_bus
+
+    async def handle(self, command: DeleteProjectCommand) -> None:
+        project_id = ProjectId(command.project_id)
+
+        async with self.uow:
+            # Deleting first takes the project row lock, so a concurrent
+            # create into the project either commits before the todos are
+            # unassigned below or fails its counter update afterwards.
+            if not await self.uow.projects.delete(project_id, command.user_id):
+                raise ProjectNotFoundError(f"Project {command.project_id} not found")
+
+            unassigned = await self.uow.todos.unassign_project(project_id, command.user_id)
+
+            await self.uow.commit()
+
+        for todo_id in unassigned:
+            event = TodoUpdated(
+                todo_id=todo_id, user_id=command.user_id, changed_fields=["project_id"]
+            )
+            await self.event_bus.publish(event)
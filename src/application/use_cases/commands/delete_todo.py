@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from typing import List
+
+from domain.entities.project import ProjectCounterDeltas
+from domain.events.todo_events import TodoDeleted
+from domain.exceptions import TodoNotFoundError
+from domain.value_objects.todo_id import TodoId
+from ...interfaces.event_bus import EventBus
+from ...interfaces.unit_of_work import UnitOfWork
+from .project_counters import apply_project_counters
+
+
+@dataclass
+class DeleteTodoCommand:
+    todo_id: str
+    user_id: str
+
+
+@dataclass
+class BulkDeleteTodosCommand:
+    todo_ids: List[str]
+    user_id: str
+
+
+class DeleteTodoHandler:
+    def __init__(self, uow: UnitOfWork, event_bus: EventBus):
+        self.uow = uow
+        self.event_bus = event_bus
+
+    async def handle(self, command: DeleteTodoCommand) -> None:
+        async with self.uow:
+            deleted = await self.uow.todos.delete_many(
+                [TodoId(command.todo_id)], command.user_id
+            )
+            if not deleted:
+                raise TodoNotFoundError(f"Todo {command.todo_id} not found")
+            # Subtasks go with their parent rather than being left orphaned.
+            deleted.extend(await self.uow.todos.delete_descendants(deleted[0]))
+
+            deltas = ProjectCounterDeltas()
+            for todo in deleted:
+                deltas.remove(todo)
+            await apply_project_counters(self.uow, command.user_id, deltas)
+
+            await self.uow.commit()
+
+        for todo in deleted:
+            event = TodoDeleted(todo_id=todo.id, user_id=command.user_id)
+            await self.event_bus.publish(event)
+
+
+class BulkDeleteTodosHandler:
+    def __init__(self, uow: UnitOfWork, event_bus: EventBus):
+        self.uow = uow
+        self.event_bus = event_bus
+
+    async def handle(self, command: BulkDeleteTodosCommand) -> tuple[List[str], List[str]]:
+        requested = list(dict.fromkeys(TodoId(todo_id) for todo_id in command.todo_ids))
+
+        async with self.uow:
+            deleted = await self.uow.todos.delete_many(requested, command.user_id)
+            for todo in list(deleted):
+                deleted.extend(await self.uow.todos.delete_descendants(todo))
+
+            deltas = ProjectCounterDeltas()
+            for todo in deleted:
+                deltas.remove(todo)
+            await apply_project_counters(self.uow, command.user_id, deltas)
+
+            await self.uow.commit()
+
+        for todo in deleted:
+            event = TodoDeleted(todo_id=todo.id, user_id=command.user_id)
+            await self.event_bus.publish(event)
+
+        deleted_ids = {todo.id for todo in deleted}
+        return (
+            [str(todo_id) for todo_id in requested if todo_id in deleted_ids],
+            [str(todo_id) for todo_id in requested if todo_id not in deleted_ids],
+        )
@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from domain.entities.todo import Todo
+from domain.events.todo_events import TodosImported
+from domain.value_objects.priority import Priority
+from domain.value_objects.todo_id import TodoId
+from domain.value_objects.todo_status import TodoStatus
+from ...interfaces.event_bus import EventBus
+
+
+@dataclass
+class ImportRow:
+    """One record of an upload; error is set when it could not be parsed"""
+
+    line: int
+    values: Optional[dict]
+    error: Optional[str] = None
+
+
+@dataclass
+class ImportTodosCommand:
+    user_id: str
+    rows: AsyncIterator[ImportRow]
+
+
+def _optional_datetime(value, name: str) -> Optional[datetime]:
+    if value in (None, ""):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be an ISO 8601 datetime")
+    # Stored datetimes are naive UTC.
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def todo_from_row(values: dict, user_id: str) -> Todo:
+    """Validate one imported record; raises ValueError describing the first problem"""
+    title = values.get("title")
+    if not isinstance(title, str) or not 1 <= len(title.strip()) <= 200:
+        raise ValueError("title must be 1 to 200 characters")
+
+    description = values.get("description") or None
+    if description is not None and not isinstance(description, str):
+        raise ValueError("description must be a string")
+
+    try:
+        priority = Priority(int(values.get("priority") or Priority.MEDIUM))
+    except (TypeError, ValueError):
+        raise ValueError("priority must be 1 to 4")
+
+    try:
+        status = TodoStatus(values.get("status") or TodoStatus.PENDING.value)
+    except ValueError:
+        raise ValueError("status must be one of " + ", ".join(s.value for s in TodoStatus))
+
+    tags = values.get("tags") or []
+    if isinstance(tags, str):
+        tags = [tag.strip() for tag in tags.split(";") if tag.strip()]
+    if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+        raise ValueError("tags must be a list of strings")
+    if len(tags) > 10:
+        raise ValueError("at most 10 tags are allowed")
+
+    todo_id = values.get("id")
+    try:
+        todo_id = TodoId(str(UUID(str(todo_id)))) if todo_id else TodoId.generate()
+    except ValueError:
+        raise ValueError("id must be a UUID")
+
+    created_at = _optional_datetime(values.get("created_at"), "created_at") or datetime.utcnow()
+    completed_at = _optional_datetime(values.get("completed_at"), "completed_at")
+    if status == TodoStatus.COMPLETED and completed_at is None:
+        completed_at = created_at
+
+    return Todo(
+        id=todo_id,
+        title=title.strip(),
+        description=description,
+        status=status,
+        priority=priority,
+        created_at=created_at,
+        updated_at=created_at,
+        completed_at=completed_at,
+        due_date=_optional_datetime(values.get("due_date"), "due_date"),
+        tags=tags,
+        user_id=user_id,
+    )
+
+
+class ImportTodosHandler:
+    """Validates an upload row by row and hands valid todos to a bulk importer.
+
+    The importer stages batches of at most batch_size todos and merges them
+    into the todo table once, at the end, in a single transaction; only the
+    current batch is held in memory. Progress and per-row errors are yielded
+    as they happen (at most max_reported_errors errors are itemized).
+    """
+
+    def __init__(
+        self,
+        importer,
+        event_bus: EventBus,
+        batch_size: int = 5000,
+        max_reported_errors: int = 100,
+    ):
+        self.importer = importer
+        self.event_bus = event_bus
+        self.batch_size = batch_size
+        self.max_reported_errors = max_reported_errors
+
+    async def handle(self, command: ImportTodosCommand) -> AsyncIterator[dict]:
+        received = staged = rejected = 0
+        batch = []
+
+        async with self.importer:
+            async for row in command.rows:
+                received += 1
+                try:
+                    if row.error is not None:
+                        raise ValueError(row.error)
+                    batch.append(todo_from_row(row.values, command.user_id))
+                except ValueError as exc:
+                    rejected += 1
+                    if rejected <= self.max_reported_errors:
+                        yield {"type": "error", "line": row.line, "error": str(exc)}
+
+                if len(batch) >= self.batch_size:
+                    await self.importer.stage(batch)
+                    staged += len(batch)
+                    batch = []
+                    yield {"type": "progress", "received": received, "staged": staged}
+
+            if batch:
+                await self.importer.stage(batch)
+                staged += len(batch)
+            imported = await self.importer.commit()
+
+        if imported:
+            await self.event_bus.publish(
+                TodosImported(user_id=command.user_id, imported=imported)
+            )
+
+        yield {
+            "type": "summary",
+            "received": received,
+            "imported": imported,
+            "rejected": rejected,
+            # Rows whose id already existed are skipped by the merge.
+            "skipped": staged - imported,
+        }
+
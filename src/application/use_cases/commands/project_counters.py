@@ -0,0 +1,24 @@
+from typing import Optional
+
+from domain.entities.project import ProjectCounterDeltas
+from domain.exceptions import ProjectNotFoundError
+from domain.value_objects.project_id import ProjectId
+from ...interfaces.unit_of_work import UnitOfWork
+
+
+async def apply_project_counters(
+    uow: UnitOfWork,
+    user_id: str,
+    deltas: ProjectCounterDeltas,
+    required: Optional[ProjectId] = None,
+) -> None:
+    """Apply counter deltas inside the unit of work's transaction.
+
+    The increment doubles as the existence and ownership check for
+    `required`, the project a todo is being put into: if a concurrent delete
+    of the project won, its row is gone and the write fails here.
+    """
+    changes = deltas.changes()
+    existing = await uow.projects.adjust_counts(user_id, changes)
+    if required is not None and required in changes and required not in existing:
+        raise ProjectNotFoundError(f"Project {required} not found")
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+from domain.exceptions import ProjectNotFoundError
+from domain.value_objects.project_id import ProjectId
+from ...interfaces.unit_of_work import UnitOfWork
+
+
+@dataclass
+class RenameProjectCommand:
+    project_id: str
+    name: str
+    user_id: str
+
+
+class RenameProjectHandler:
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def handle(self, command: RenameProjectCommand) -> None:
+        async with self.uow:
+            project = await self.uow.projects.find_by_id(ProjectId(command.project_id))
+            if project is None or project.user_id != command.user_id:
+                raise ProjectNotFoundError(f"Project {command.project_id} not found")
+
+            project.rename(command.name)
+
+            await self.uow.projects.save(project)
+            await self.uow.commit()
@@ -2,11 +2,16 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from domain.exceptions import TodoNotFoundError
+from domain.entities.project import ProjectCounterDeltas
+from domain.events.todo_events import TodoUpdated
+from domain.exceptions import InvalidRecurrenceRuleError, TodoNotFoundError
 from domain.value_objects.priority import Priority
+from domain.value_objects.project_id import ProjectId
+from domain.value_objects.recurrence_rule import RecurrenceRule
 from domain.value_objects.todo_id import TodoId
 from ...interfaces.event_bus import EventBus
 from ...interfaces.unit_of_work import UnitOfWork
+from .project_counters import apply_project_counters
 
 
 @dataclass
@@ -18,6 +23,10 @@ class UpdateTodoCommand:
     due_date: Optional[datetime]
     tags: Optional[list[str]]
     user_id: str
+    # An empty string stops the todo from recurring.
+    recurrence: Optional[str] = None
+    # An empty string takes the todo out of its project.
+    project_id: Optional[str] = None
 
 
 class UpdateTodoHandler:
@@ -27,22 +36,54 @@ class UpdateTodoHandler:
 
     async def handle(self, command: UpdateTodoCommand) -> None:
         async with self.uow:
-            todo = await self.uow.todos.find_by_id(TodoId(command.todo_id))
-            if not todo:
+            # Locked, so concurrent writes cannot both apply counter deltas
+            # computed from the same prior state.
+            todo = await self.uow.todos.find_by_id_for_update(TodoId(command.todo_id))
+            if todo is None or todo.user_id != command.user_id:
                 raise TodoNotFoundError(f"Todo {command.todo_id} not found")
 
+            deltas = ProjectCounterDeltas()
+            deltas.remove(todo)
+
+            changed_fields = []
             if command.title is not None:
                 todo.title = command.title
+                changed_fields.append("title")
             if command.description is not None:
                 todo.description = command.description
+                changed_fields.append("description")
             if command.priority is not None:
                 todo.priority = command.priority
+                changed_fields.append("priority")
             if command.due_date is not None:
                 todo.due_date = command.due_date
+                changed_fields.append("due_date")
             if command.tags is not None:
                 todo.tags = command.tags
+                changed_fields.append("tags")
+            if command.recurrence is not None:
+                if command.recurrence and todo.due_date is None:
+                    raise InvalidRecurrenceRuleError("Recurring todos need a due_date")
+                todo.recurrence = (
+                    RecurrenceRule.parse(command.recurrence) if command.recurrence else None
+                )
+                changed_fields.append("recurrence")
+            if command.project_id is not None:
+                todo.project_id = ProjectId(command.project_id) if command.project_id else None
+                changed_fields.append("project_id")
 
             todo.updated_at = datetime.utcnow()
 
             await self.uow.todos.save(todo)
+
+            deltas.add(todo)
+            await apply_project_counters(
+                self.uow, command.user_id, deltas, required=todo.project_id
+            )
+
             await self.uow.commit()
+
+        event = TodoUpdated(
+            todo_id=todo.id, user_id=command.user_id, changed_fields=changed_fields
+        )
+        await self.event_bus.publish(event)
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from typing import List
+
+from domain.value_objects.todo_id import TodoId
+from ...dto.todo_dto import TodoDTO, todo_to_dto
+
+
+@dataclass
+class BatchGetTodosQuery:
+    user_id: str
+    todo_ids: List[str]
+
+
+class BatchGetTodosHandler:
+    def __init__(self, todo_read_repository):
+        self.todo_read_repository = todo_read_repository
+
+    async def handle(self, query: BatchGetTodosQuery) -> tuple[List[TodoDTO], List[str]]:
+        requested = list(dict.fromkeys(TodoId(todo_id) for todo_id in query.todo_ids))
+        todos = await self.todo_read_repository.find_by_ids(requested, query.user_id)
+
+        found = {todo.id: todo for todo in todos}
+        items = [todo_to_dto(found[todo_id]) for todo_id in requested if todo_id in found]
+        missing = [str(todo_id) for todo_id in requested if todo_id not in found]
+        return items, missing
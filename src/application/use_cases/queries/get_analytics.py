@@ -0,0 +1,181 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import List, Optional, Sequence, Tuple
+
+from domain.value_objects.priority import Priority
+from ...dto.analytics_dto import (
+    AnalyticsDTO,
+    CompletionTimeDTO,
+    OverdueRateDTO,
+    TrendPointDTO,
+)
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+# Upper edges (hours) of the time-to-complete histogram buckets; bucket i
+# holds durations in [EDGES[i - 1], EDGES[i]), the last one everything above.
+# Rollups store the histogram, so percentiles never need the individual todos.
+DURATION_EDGES_HOURS = (
+    0.25, 0.5, 1, 2, 4, 8, 16, 24, 48, 72, 120, 168, 336, 720, 1440, 2880,
+)
+DURATION_BUCKETS = len(DURATION_EDGES_HOURS) + 1
+PERCENTILES = (50, 90)
+
+
+def duration_bucket(hours: float) -> int:
+    """Histogram bucket of a duration, as Postgres width_bucket(hours, edges) numbers it"""
+    return bisect_right(DURATION_EDGES_HOURS, hours)
+
+
+class AnalyticsBucket(Enum):
+    DAY = "day"
+    WEEK = "week"
+
+
+@dataclass
+class GetAnalyticsQuery:
+    user_id: str
+    since: date
+    until: date
+    bucket: AnalyticsBucket = AnalyticsBucket.DAY
+
+
+# One row per (day, priority) with completions:
+# (priority, completed, completed_with_due_date, completed_late, histogram).
+CompletionRow = Tuple[int, int, int, int, Sequence[int]]
+
+
+class GetAnalyticsHandler:
+    """Completion trends, time to complete and overdue rates over a date range.
+
+    The repository buckets and sums in the database; what is left here is
+    adding up per-day histograms and interpolating percentiles from them,
+    vectorized with NumPy when it is installed.
+    """
+
+    def __init__(self, analytics_read_repository):
+        self.analytics_read_repository = analytics_read_repository
+
+    async def handle(self, query: GetAnalyticsQuery) -> AnalyticsDTO:
+        repository = self.analytics_read_repository
+        trend = await repository.find_trend(
+            query.user_id, query.since, query.until, query.bucket.value
+        )
+        completions = await repository.find_completions(query.user_id, query.since, query.until)
+        open_overdue = await repository.count_open_overdue(query.user_id, datetime.utcnow())
+
+        return AnalyticsDTO(
+            since=query.since,
+            until=query.until,
+            bucket=query.bucket.value,
+            trend=[
+                TrendPointDTO(
+                    bucket_start=bucket_start,
+                    created=created,
+                    completed=completed,
+                    net_open=net_open,
+                )
+                for bucket_start, created, completed, net_open in trend
+            ],
+            time_to_complete=_completion_times(completions),
+            overdue=_overdue_rates(completions, open_overdue),
+        )
+
+
+def _completion_times(rows: List[CompletionRow]) -> List[CompletionTimeDTO]:
+    groups: List[Tuple[Optional[int], List[CompletionRow]]] = [(None, rows)]
+    groups.extend(
+        (int(priority), [row for row in rows if row[0] == priority]) for priority in Priority
+    )
+    times = []
+    for priority, group in groups:
+        counts = _sum_histograms([row[4] for row in group])
+        p50, p90 = _percentiles(counts, PERCENTILES)
+        times.append(
+            CompletionTimeDTO(
+                priority=priority,
+                completed=sum(row[1] for row in group),
+                p50_hours=p50,
+                p90_hours=p90,
+            )
+        )
+    return times
+
+
+def _overdue_rates(rows: List[CompletionRow], open_overdue: dict) -> List[OverdueRateDTO]:
+    rates = []
+    for priority in Priority:
+        group = [row for row in rows if row[0] == priority]
+        with_due_date = sum(row[2] for row in group)
+        late = sum(row[3] for row in group)
+        still_open = open_overdue.get(int(priority), 0)
+        # Share of todos with a due date that missed it: completed late, or
+        # still open past it.
+        due = with_due_date + still_open
+        rates.append(
+            OverdueRateDTO(
+                priority=int(priority),
+                completed_with_due_date=with_due_date,
+                completed_late=late,
+                open_overdue=still_open,
+                overdue_rate=(late + still_open) / due if due else None,
+            )
+        )
+    return rates
+
+
+def _sum_histograms(histograms: List[Sequence[int]]) -> List[int]:
+    if not histograms:
+        return [0] * DURATION_BUCKETS
+    if numpy is not None:
+        return numpy.asarray(histograms, dtype=numpy.int64).sum(axis=0).tolist()
+    return [sum(column) for column in zip(*histograms)]
+
+
+def _bucket_bounds(index: int) -> Tuple[float, float]:
+    lower = DURATION_EDGES_HOURS[index - 1] if index else 0.0
+    # The open-ended last bucket reports its lower edge.
+    upper = DURATION_EDGES_HOURS[index] if index < len(DURATION_EDGES_HOURS) else lower
+    return lower, upper
+
+
+def _percentiles(counts: List[int], percentiles: Sequence[float]) -> List[Optional[float]]:
+    """Percentiles interpolated linearly within histogram buckets"""
+    total = sum(counts)
+    if not total:
+        return [None] * len(percentiles)
+
+    if numpy is not None:
+        counts_array = numpy.asarray(counts, dtype=numpy.float64)
+        cumulative = numpy.cumsum(counts_array)
+        targets = numpy.asarray(percentiles, dtype=numpy.float64) / 100 * total
+        indexes = numpy.searchsorted(cumulative, targets, side="left")
+        bounds = numpy.asarray([_bucket_bounds(i) for i in range(len(counts))])
+        lower, upper = bounds[indexes, 0], bounds[indexes, 1]
+        before = cumulative[indexes] - counts_array[indexes]
+        fraction = (targets - before) / counts_array[indexes]
+        return (lower + fraction * (upper - lower)).round(2).tolist()
+
+    values = []
+    for percentile in percentiles:
+        target = percentile / 100 * total
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if count and cumulative + count >= target:
+                lower, upper = _bucket_bounds(index)
+                fraction = (target - cumulative) / count
+                values.append(round(lower + fraction * (upper - lower), 2))
+                break
+            cumulative += count
+    return values
+
+
+def analytics_range(days: int, today: Optional[date] = None) -> Tuple[date, date]:
+    """The last `days` days, today included"""
+    until = today or datetime.utcnow().date()
+    return until - timedelta(days=days - 1), until
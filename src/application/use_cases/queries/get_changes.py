@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from domain.exceptions import ChangeTokenExpiredError
+from ...dto.todo_dto import TodoChangesDTO, todo_to_dto
+
+
+class ChangeToken(NamedTuple):
+    """Position in a user's change feed: (transaction id, change sequence)"""
+
+    xid: int = 0
+    seq: int = 0
+
+    @classmethod
+    def parse(cls, token: str) -> "ChangeToken":
+        xid, separator, seq = token.partition("-")
+        if not separator:
+            # "0", or a bare sequence number from before tokens carried the
+            # transaction id; the latter sorts below every sync horizon, so
+            # its holder is told to resync.
+            xid, seq = "0", token
+        if not (xid.isdigit() and seq.isdigit()):
+            raise ValueError(f"Invalid change token {token!r}")
+        return cls(int(xid), int(seq))
+
+    def __str__(self) -> str:
+        return f"{self.xid}-{self.seq}" if self != ChangeToken() else "0"
+
+
+@dataclass
+class GetChangesQuery:
+    user_id: str
+    since: ChangeToken = field(default_factory=ChangeToken)
+    limit: int = 100
+
+
+class GetChangesHandler:
+    def __init__(self, todo_read_repository):
+        self.todo_read_repository = todo_read_repository
+
+    async def handle(self, query: GetChangesQuery) -> TodoChangesDTO:
+        if query.since != ChangeToken():
+            horizon = await self.todo_read_repository.get_sync_horizon(query.user_id)
+            if query.since.xid <= horizon:
+                raise ChangeTokenExpiredError(
+                    "Change token is older than the retained history, resync required"
+                )
+
+        todos, tombstones = await self.todo_read_repository.find_changes_since(
+            query.user_id, query.since, query.limit
+        )
+
+        entries = sorted(
+            [(position, todo, None) for position, todo in todos]
+            + [(position, None, todo_id) for position, todo_id in tombstones],
+            key=lambda entry: entry[0],
+        )
+        page = entries[: query.limit]
+
+        return TodoChangesDTO(
+            changed=[todo_to_dto(todo) for _, todo, _ in page if todo is not None],
+            deleted=[todo_id for _, _, todo_id in page if todo_id is not None],
+            next_token=str(ChangeToken(*page[-1][0]) if page else query.since),
+            has_more=len(entries) > query.limit,
+        )
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+
+from ...dto.todo_dto import TodoDTO, todo_to_dto
+
+
+def next_up_key(todo) -> tuple:
+    """Sort key for "next up": priority DESC, then due_date ASC NULLS LAST"""
+    return (-int(todo.priority), todo.due_date is None, todo.due_date or datetime.min)
+
+
+@dataclass
+class GetNextTodosQuery:
+    user_id: str
+    k: int = 10
+
+
+class GetNextTodosHandler:
+    def __init__(self, next_todos):
+        self.next_todos = next_todos
+
+    async def handle(self, query: GetNextTodosQuery) -> List[TodoDTO]:
+        todos = await self.next_todos.find_next(query.user_id, query.k)
+        return [todo_to_dto(todo) for todo in todos]
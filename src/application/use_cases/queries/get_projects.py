@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import List
+
+from domain.exceptions import ProjectNotFoundError
+from domain.value_objects.project_id import ProjectId
+from ...dto.project_dto import ProjectDTO
+
+
+@dataclass
+class ListProjectsQuery:
+    user_id: str
+
+
+class GetProjectsHandler:
+    def __init__(self, project_read_repository):
+        self.project_read_repository = project_read_repository
+
+    async def handle(self, query: ListProjectsQuery) -> List[ProjectDTO]:
+        """Every project of the user with its counters, for sidebars: one indexed read"""
+        projects = await self.project_read_repository.find_by_user(query.user_id)
+        return [self._to_dto(project) for project in projects]
+
+    async def get(self, project_id: str, user_id: str) -> ProjectDTO:
+        project = await self.project_read_repository.find_by_id(ProjectId(project_id))
+        if project is None or project.user_id != user_id:
+            raise ProjectNotFoundError(f"Project {project_id} not found")
+        return self._to_dto(project)
+
+    def _to_dto(self, project) -> ProjectDTO:
+        return ProjectDTO(
+            id=str(project.id),
+            name=project.name,
+            open_count=project.open_count,
+            completed_count=project.completed_count,
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+        )
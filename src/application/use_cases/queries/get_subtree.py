@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+from domain.exceptions import TodoNotFoundError
+from domain.value_objects.todo_id import TodoId
+from domain.value_objects.todo_status import TodoStatus
+from ...dto.todo_dto import SubtaskCountsDTO, TodoTreeDTO, todo_to_dto
+
+
+@dataclass
+class GetSubtreeQuery:
+    todo_id: str
+    user_id: str
+
+
+@dataclass
+class GetSubtaskCountsQuery:
+    todo_ids: List[str]
+    user_id: str
+
+
+class GetSubtreeHandler:
+    def __init__(self, todo_read_repository):
+        self.todo_read_repository = todo_read_repository
+
+    async def handle(self, query: GetSubtreeQuery) -> TodoTreeDTO:
+        todos = await self.todo_read_repository.find_subtree(
+            TodoId(query.todo_id), query.user_id
+        )
+        if not todos:
+            raise TodoNotFoundError(f"Todo {query.todo_id} not found")
+
+        # Rows arrive in path order, so every ancestor precedes its
+        # descendants; each todo is counted once per ancestor in the tree.
+        nodes: Dict[str, TodoTreeDTO] = {}
+        root = None
+        for todo in todos:
+            node = TodoTreeDTO(todo=todo_to_dto(todo), done=0, total=0, children=[])
+            ancestors = [nodes[a] for a in todo.path.split("/")[:-2] if a in nodes]
+            for ancestor in ancestors:
+                ancestor.total += 1
+                ancestor.done += todo.status == TodoStatus.COMPLETED
+            if ancestors:
+                # The nearest ancestor still present adopts the todo, even if
+                # its direct parent was deleted.
+                ancestors[-1].children.append(node)
+            else:
+                root = node
+            nodes[str(todo.id)] = node
+        return root
+
+    async def counts(self, query: GetSubtaskCountsQuery) -> List[SubtaskCountsDTO]:
+        requested = list(dict.fromkeys(TodoId(todo_id) for todo_id in query.todo_ids))
+        counts = await self.todo_read_repository.count_subtrees(requested, query.user_id)
+        items = []
+        for todo_id in requested:
+            if todo_id in counts:
+                done, total = counts[todo_id]
+                items.append(SubtaskCountsDTO(todo_id=str(todo_id), done=done, total=total))
+        return items
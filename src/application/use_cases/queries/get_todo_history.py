@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from domain.entities.todo_history import DELETED, SNAPSHOT_INTERVAL, rebuild_state
+from domain.exceptions import TodoNotFoundError
+from domain.value_objects.todo_id import TodoId
+from ...dto.todo_dto import TodoHistoryDTO, TodoStateDTO, TodoVersionDTO
+
+
+@dataclass
+class GetTodoHistoryQuery:
+    todo_id: str
+    user_id: str
+    limit: int = 50
+    # Keyset cursor: only versions older than this one.
+    before: Optional[int] = None
+
+
+@dataclass
+class GetTodoStateQuery:
+    todo_id: str
+    user_id: str
+    # Defaults to now, i.e. the latest version.
+    at: Optional[datetime] = None
+
+
+class GetTodoHistoryHandler:
+    def __init__(self, history_read_repository):
+        self.history_read_repository = history_read_repository
+
+    async def handle(self, query: GetTodoHistoryQuery) -> TodoHistoryDTO:
+        todo_id = TodoId(query.todo_id)
+        versions = await self.history_read_repository.find_versions(
+            todo_id, query.user_id, query.before, query.limit + 1
+        )
+        if not versions and query.before is None:
+            raise TodoNotFoundError(f"Todo {query.todo_id} not found")
+
+        page = versions[: query.limit]
+        has_more = len(versions) > query.limit
+        return TodoHistoryDTO(
+            items=[
+                TodoVersionDTO(
+                    version=entry.version,
+                    kind=entry.kind,
+                    changes=entry.changes,
+                    recorded_at=entry.recorded_at,
+                )
+                for entry in page
+            ],
+            next_cursor=page[-1].version if has_more else None,
+        )
+
+    async def state_at(self, query: GetTodoStateQuery) -> TodoStateDTO:
+        todo_id = TodoId(query.todo_id)
+        at = query.at or datetime.utcnow()
+        snapshot = await self.history_read_repository.find_snapshot(todo_id, query.user_id, at)
+        # Snapshots are SNAPSHOT_INTERVAL versions apart, which bounds the replay.
+        versions = await self.history_read_repository.find_versions_after(
+            todo_id,
+            query.user_id,
+            snapshot.version if snapshot else 0,
+            at,
+            SNAPSHOT_INTERVAL,
+        )
+        if snapshot is None and not versions:
+            raise TodoNotFoundError(f"Todo {query.todo_id} not found")
+
+        latest = versions[-1] if versions else snapshot
+        return TodoStateDTO(
+            todo_id=str(todo_id),
+            version=latest.version,
+            recorded_at=latest.recorded_at,
+            deleted=bool(versions) and versions[-1].kind == DELETED,
+            state=rebuild_state(snapshot, versions),
+            replayed=len(versions),
+        )
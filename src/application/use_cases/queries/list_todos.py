@@ -1,10 +1,11 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional, List
 from enum import Enum
 
 from domain.value_objects.todo_status import TodoStatus
 from domain.value_objects.priority import Priority
-from ...dto.todo_dto import TodoDTO
+from ...dto.todo_dto import TodoDTO, TodoOccurrenceDTO, todo_to_dto
 
 
 class SortField(Enum):
@@ -26,10 +27,16 @@ class ListTodosQuery:
     priority: Optional[Priority] = None
     tags: Optional[List[str]] = None
     search: Optional[str] = None
+    ids: Optional[List[str]] = None
+    project_id: Optional[str] = None
+    fields: Optional[List[str]] = None
     sort_by: SortField = SortField.CREATED_AT
     sort_order: SortOrder = SortOrder.DESC
     limit: int = 20
     offset: int = 0
+    occurrences_from: Optional[datetime] = None
+    occurrences_to: Optional[datetime] = None
+    max_occurrences: int = 500
 
 
 class ListTodosHandler:
@@ -43,25 +50,68 @@ class ListTodosHandler:
             priority=query.priority,
             tags=query.tags,
             search=query.search,
+            ids=query.ids,
             sort_by=query.sort_by.value,
             sort_order=query.sort_order.value,
             limit=query.limit,
-            offset=query.offset
+            offset=query.offset,
+            project_id=query.project_id,
         )
         
-        return [self._to_dto(todo) for todo in todos], total
+        return [todo_to_dto(todo) for todo in todos], total
+
+    async def handle_fields(self, query: ListTodosQuery) -> tuple[List[dict], int]:
+        """Sparse variant of handle: only query.fields are read and returned"""
+        return await self.todo_read_repository.find_fields_with_filters(
+            fields=query.fields,
+            user_id=query.user_id,
+            status=query.status,
+            priority=query.priority,
+            tags=query.tags,
+            search=query.search,
+            ids=query.ids,
+            sort_by=query.sort_by.value,
+            sort_order=query.sort_order.value,
+            limit=query.limit,
+            offset=query.offset,
+            project_id=query.project_id,
+        )
     
-    def _to_dto(self, todo) -> TodoDTO:
-        return TodoDTO(
-            id=str(todo.id),
-            title=todo.title,
-            description=todo.description,
-            status=todo.status.value,
-            priority=todo.priority.value,
-            created_at=todo.created_at,
-            updated_at=todo.updated_at,
-            completed_at=todo.completed_at,
-            due_date=todo.due_date,
-            tags=todo.tags,
-            is_overdue=todo.is_overdue()
-        )
\ No newline at end of file
+    async def expand_occurrences(self, query: ListTodosQuery) -> List[TodoOccurrenceDTO]:
+        """Virtual occurrences of open recurring todos due within the query window.
+
+        Only the next occurrence of a series is stored, so later ones are
+        generated here from its rule, starting at the window; cost is bounded
+        by the number of rules and max_occurrences, not by the length of the
+        window or its distance from the stored occurrence.
+        """
+        if query.occurrences_from is None or query.occurrences_to is None:
+            return []
+
+        todos = await self.todo_read_repository.find_recurring(query.user_id)
+        occurrences = []
+        for todo in todos:
+            if query.priority and todo.priority != query.priority:
+                continue
+            if query.tags and not set(query.tags).intersection(todo.tags):
+                continue
+            if query.project_id and str(todo.project_id) != query.project_id:
+                continue
+            due_dates = todo.recurrence.occurrences(
+                todo.due_date, todo.occurrence_index, start=query.occurrences_from
+            )
+            for step, (index, due_date) in enumerate(due_dates, start=1):
+                if due_date > query.occurrences_to or step > query.max_occurrences:
+                    break
+                occurrences.append(
+                    TodoOccurrenceDTO(
+                        todo_id=str(todo.id),
+                        title=todo.title,
+                        priority=todo.priority.value,
+                        due_date=due_date,
+                        occurrence_index=index,
+                    )
+                )
+
+        occurrences.sort(key=lambda occurrence: occurrence.due_date)
+        return occurrences[: query.max_occurrences]
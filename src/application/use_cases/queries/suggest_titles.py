@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import List
+
+from ...dto.todo_dto import TitleSuggestionDTO
+
+
+@dataclass
+class SuggestTitlesQuery:
+    user_id: str
+    prefix: str
+    limit: int = 10
+
+
+class SuggestTitlesHandler:
+    def __init__(self, title_suggestions):
+        self.title_suggestions = title_suggestions
+
+    async def handle(self, query: SuggestTitlesQuery) -> List[TitleSuggestionDTO]:
+        matches = await self.title_suggestions.suggest(
+            query.user_id, query.prefix, query.limit
+        )
+        return [TitleSuggestionDTO(id=todo_id, title=title) for todo_id, title in matches]
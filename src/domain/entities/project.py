@@ -0,0 +1,61 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from ..value_objects.project_id import ProjectId
+from ..value_objects.todo_status import TodoStatus
+from .todo import Todo
+
+OPEN_STATUSES = (TodoStatus.PENDING, TodoStatus.IN_PROGRESS)
+
+
+@dataclass
+class Project:
+    id: ProjectId
+    name: str
+    user_id: str
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+    # Denormalized; only ever changed through ProjectRepository.adjust_counts.
+    open_count: int = 0
+    completed_count: int = 0
+
+    def rename(self, name: str) -> None:
+        self.name = name
+        self.updated_at = datetime.utcnow()
+
+
+class ProjectCounterDeltas:
+    """Net change to each project's (open, completed) counters in one unit of work.
+
+    remove() a todo's state before it changes and add() it afterwards; a
+    todo with no project, or that is cancelled, counts towards neither.
+    """
+
+    def __init__(self):
+        self._deltas: Dict[ProjectId, list] = defaultdict(lambda: [0, 0])
+
+    def add(self, todo: Todo, sign: int = 1) -> None:
+        if todo.project_id is None:
+            return
+        if todo.status in OPEN_STATUSES:
+            self._deltas[todo.project_id][0] += sign
+        elif todo.status == TodoStatus.COMPLETED:
+            self._deltas[todo.project_id][1] += sign
+
+    def remove(self, todo: Todo) -> None:
+        self.add(todo, -1)
+
+    def complete(self, project_id: Optional[ProjectId]) -> None:
+        """An open todo of the project was completed outside of remove()/add()"""
+        if project_id is not None:
+            self._deltas[project_id][0] -= 1
+            self._deltas[project_id][1] += 1
+
+    def changes(self) -> Dict[ProjectId, Tuple[int, int]]:
+        return {
+            project_id: (open_delta, completed_delta)
+            for project_id, (open_delta, completed_delta) in self._deltas.items()
+            if open_delta or completed_delta
+        }
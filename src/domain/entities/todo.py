@@ -4,9 +4,14 @@ from typing import List, Optional
 
 from ..exceptions import InvalidTodoStateError
 from ..value_objects.priority import Priority
+from ..value_objects.project_id import ProjectId
+from ..value_objects.recurrence_rule import RecurrenceRule
 from ..value_objects.todo_id import TodoId
 from ..value_objects.todo_status import TodoStatus
 
+# Path segments are 37 characters, so this also bounds the path column.
+MAX_SUBTASK_DEPTH = 10
+
 
 @dataclass
 class Todo:
@@ -20,6 +25,30 @@ class Todo:
     completed_at: Optional[datetime] = None
     due_date: Optional[datetime] = None
     tags: List[str] = field(default_factory=list)
+    user_id: Optional[str] = None
+    recurrence: Optional[RecurrenceRule] = None
+    series_id: Optional[TodoId] = None
+    occurrence_index: int = 1
+    parent_id: Optional[TodoId] = None
+    # Materialized path, "<root id>/.../<own id>/": a subtree is one prefix range.
+    path: str = ""
+    project_id: Optional[ProjectId] = None
+
+    def __post_init__(self) -> None:
+        if not self.path:
+            self.path = f"{self.id}/"
+
+    @property
+    def depth(self) -> int:
+        return self.path.count("/") - 1
+
+    def attach_to(self, parent: "Todo") -> None:
+        if parent.depth + 1 >= MAX_SUBTASK_DEPTH:
+            raise InvalidTodoStateError(
+                f"Subtasks can be nested at most {MAX_SUBTASK_DEPTH} levels deep"
+            )
+        self.parent_id = parent.id
+        self.path = f"{parent.path}{self.id}/"
 
     def complete(self) -> None:
         if self.status == TodoStatus.COMPLETED:
@@ -28,7 +57,35 @@ class Todo:
         self.completed_at = datetime.utcnow()
         self.updated_at = datetime.utcnow()
 
+    def next_occurrence(self) -> Optional["Todo"]:
+        """The following occurrence of a recurring todo, or None when the rule is exhausted"""
+        if self.recurrence is None or self.due_date is None:
+            return None
+        due_date = self.recurrence.next_after(self.due_date, self.occurrence_index)
+        if due_date is None:
+            return None
+        now = datetime.utcnow()
+        next_id = TodoId.generate()
+        parent_path = self.path[: -len(f"{self.id}/")]
+        return Todo(
+            id=next_id,
+            title=self.title,
+            description=self.description,
+            priority=self.priority,
+            created_at=now,
+            updated_at=now,
+            due_date=due_date,
+            tags=list(self.tags),
+            user_id=self.user_id,
+            recurrence=self.recurrence,
+            series_id=self.series_id or self.id,
+            occurrence_index=self.occurrence_index + 1,
+            parent_id=self.parent_id,
+            path=f"{parent_path}{next_id}/",
+            project_id=self.project_id,
+        )
+
     def is_overdue(self) -> bool:
         if self.due_date is None or self.status == TodoStatus.COMPLETED:
             return False
-        return self.due_date < datetime.datetime()
+        return self.due_date < datetime.utcnow()
@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..value_objects.todo_id import TodoId
+from ..value_objects.todo_status import TodoStatus
+from .todo import Todo
+
+# A full snapshot is stored with every SNAPSHOT_INTERVAL-th version, so
+# rebuilding a todo at any moment replays at most SNAPSHOT_INTERVAL diffs.
+SNAPSHOT_INTERVAL = 50
+
+CREATED = "created"
+UPDATED = "updated"
+COMPLETED = "completed"
+DELETED = "deleted"
+
+
+@dataclass
+class TodoVersion:
+    """One append-only history entry: the fields a write changed, with their new values"""
+
+    todo_id: TodoId
+    user_id: str
+    version: int
+    kind: str
+    changes: Dict[str, Any]
+    recorded_at: datetime
+
+
+@dataclass
+class TodoSnapshot:
+    todo_id: TodoId
+    user_id: str
+    version: int
+    state: Dict[str, Any]
+    recorded_at: datetime
+
+
+def _json(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def todo_state(todo: Todo) -> Dict[str, Any]:
+    """The user-visible fields of a todo, as JSON values"""
+    return {
+        "title": todo.title,
+        "description": todo.description,
+        "status": todo.status.value,
+        "priority": int(todo.priority),
+        "created_at": _json(todo.created_at),
+        "completed_at": _json(todo.completed_at),
+        "due_date": _json(todo.due_date),
+        "tags": list(todo.tags or []),
+        "recurrence": str(todo.recurrence) if todo.recurrence else None,
+        "parent_id": str(todo.parent_id) if todo.parent_id else None,
+        "project_id": str(todo.project_id) if todo.project_id else None,
+    }
+
+
+def diff_states(before: Optional[Dict[str, Any]], after: Dict[str, Any]) -> Dict[str, Any]:
+    if before is None:
+        return dict(after)
+    return {field: value for field, value in after.items() if before.get(field) != value}
+
+
+def record_version(
+    todo: Todo,
+    version: int,
+    changes: Dict[str, Any],
+    recorded_at: datetime,
+    deleted: bool = False,
+) -> Tuple[TodoVersion, Optional[TodoSnapshot]]:
+    """The history entry for `todo` reaching `version`, and its snapshot if one is due"""
+    if deleted:
+        kind = DELETED
+    elif version == 1:
+        kind = CREATED
+    elif changes.get("status") == TodoStatus.COMPLETED.value:
+        kind = COMPLETED
+    else:
+        kind = UPDATED
+
+    entry = TodoVersion(
+        todo_id=todo.id,
+        user_id=todo.user_id,
+        version=version,
+        kind=kind,
+        changes=changes,
+        recorded_at=recorded_at,
+    )
+    snapshot = None
+    # Nothing follows a deletion, so it never needs replaying past.
+    if version % SNAPSHOT_INTERVAL == 0 and not deleted:
+        snapshot = TodoSnapshot(
+            todo_id=todo.id,
+            user_id=todo.user_id,
+            version=version,
+            state=todo_state(todo),
+            recorded_at=recorded_at,
+        )
+    return entry, snapshot
+
+
+def rebuild_state(
+    snapshot: Optional[TodoSnapshot], versions: List[TodoVersion]
+) -> Dict[str, Any]:
+    """Apply `versions` (ascending, all newer than the snapshot) on top of it"""
+    state = dict(snapshot.state) if snapshot else {}
+    for entry in versions:
+        state.update(entry.changes)
+    return state
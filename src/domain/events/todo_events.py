@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 
 from .base import DomainEvent
 from ..value_objects.todo_id import TodoId
@@ -17,7 +18,34 @@ class TodoCompleted(DomainEvent):
     user_id: str
 
 
+@dataclass(kw_only=True)
+class TodoUpdated(DomainEvent):
+    todo_id: TodoId
+    user_id: str
+    changed_fields: list[str]
+
+
 @dataclass(kw_only=True)
 class TodoDeleted(DomainEvent):
     todo_id: TodoId
     user_id: str
+
+
+@dataclass(kw_only=True)
+class TodosImported(DomainEvent):
+    user_id: str
+    imported: int
+
+
+@dataclass(kw_only=True)
+class TodoDueSoon(DomainEvent):
+    todo_id: TodoId
+    user_id: str
+    due_date: datetime
+
+
+@dataclass(kw_only=True)
+class TodoOverdue(DomainEvent):
+    todo_id: TodoId
+    user_id: str
+    due_date: datetime
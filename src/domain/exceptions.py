@@ -14,3 +14,21 @@ class InvalidTodoStateError(DomainException):
     """Raised when todo state transition is invalid"""
 
     pass
+
+
+class ChangeTokenExpiredError(DomainException):
+    """Raised when a sync token predates compacted tombstones"""
+
+    pass
+
+
+class InvalidRecurrenceRuleError(DomainException):
+    """Raised when a recurrence rule cannot be parsed or applied"""
+
+    pass
+
+
+class ProjectNotFoundError(DomainException):
+    """Raised when a project is not found"""
+
+    pass
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Set, Tuple
+
+from ..entities.project import Project
+from ..value_objects.project_id import ProjectId
+
+
+class ProjectRepository(ABC):
+    @abstractmethod
+    async def save(self, project: Project) -> None:
+        """Insert or rename; the counters of an existing project are left alone"""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, project_id: ProjectId) -> Optional[Project]:
+        pass
+
+    @abstractmethod
+    async def delete(self, project_id: ProjectId, user_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def adjust_counts(
+        self, user_id: str, deltas: Dict[ProjectId, Tuple[int, int]]
+    ) -> Set[ProjectId]:
+        """Add (open, completed) deltas to the user's projects; returns those that exist"""
+        pass
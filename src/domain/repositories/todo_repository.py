@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from ..entities.todo import Todo
+from ..value_objects.project_id import ProjectId
 from ..value_objects.todo_id import TodoId
 from ..value_objects.todo_status import TodoStatus
 
@@ -15,6 +16,11 @@ class TodoRepository(ABC):
     async def find_by_id(self, todo_id: TodoId) -> Optional[Todo]:
         pass
 
+    @abstractmethod
+    async def find_by_id_for_update(self, todo_id: TodoId) -> Optional[Todo]:
+        """find_by_id that keeps concurrent writers off the todo until commit"""
+        pass
+
     @abstractmethod
     async def find_all(self) -> List[Todo]:
         pass
@@ -27,6 +33,26 @@ class TodoRepository(ABC):
     async def delete(self, todo_id: TodoId) -> None:
         pass
 
+    @abstractmethod
+    async def delete_many(self, todo_ids: List[TodoId], user_id: str) -> List[Todo]:
+        """Delete the user's todos among todo_ids, returning them as they were"""
+        pass
+
     @abstractmethod
     async def exists(self, todo_id: TodoId) -> bool:
+        pass
+
+    @abstractmethod
+    async def complete_descendants(self, todo: Todo) -> List[Todo]:
+        """Complete every open todo below `todo`, returning them as completed"""
+        pass
+
+    @abstractmethod
+    async def delete_descendants(self, todo: Todo) -> List[Todo]:
+        """Delete every todo below `todo`, returning them as they were"""
+        pass
+
+    @abstractmethod
+    async def unassign_project(self, project_id: ProjectId, user_id: str) -> List[TodoId]:
+        """Take every todo of the project out of it"""
         pass
\ No newline at end of file
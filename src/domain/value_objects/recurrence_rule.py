@@ -0,0 +1,201 @@
+import calendar
+from dataclasses import dataclass
+from datetime import MAXYEAR, datetime, timedelta
+from typing import Iterator, Optional, Tuple
+
+from ..exceptions import InvalidRecurrenceRuleError
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+# Larger intervals are never meaningful and overflow datetime arithmetic.
+MAX_INTERVAL = 1000
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """RRULE subset: FREQ, INTERVAL, BYDAY (weekly), COUNT and UNTIL.
+
+    Occurrences are generated from an anchor occurrence (the due date of
+    the todo carrying the rule), so only the next one ever has to be stored.
+    """
+
+    freq: str
+    interval: int = 1
+    by_day: Tuple[int, ...] = ()
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+
+    @classmethod
+    def parse(cls, value: str) -> "RecurrenceRule":
+        parts = {}
+        for part in value.strip().removeprefix("RRULE:").split(";"):
+            if not part:
+                continue
+            name, sep, raw = part.partition("=")
+            if not sep:
+                raise InvalidRecurrenceRuleError(f"Malformed rule part: {part}")
+            parts[name.strip().upper()] = raw.strip().upper()
+
+        freq = parts.pop("FREQ", None)
+        if freq not in FREQUENCIES:
+            raise InvalidRecurrenceRuleError("FREQ must be one of " + ", ".join(FREQUENCIES))
+
+        try:
+            interval = int(parts.pop("INTERVAL", "1"))
+            count = int(parts["COUNT"]) if "COUNT" in parts else None
+        except ValueError:
+            raise InvalidRecurrenceRuleError("INTERVAL and COUNT must be integers")
+        parts.pop("COUNT", None)
+        if interval < 1 or (count is not None and count < 1):
+            raise InvalidRecurrenceRuleError("INTERVAL and COUNT must be positive")
+        if interval > MAX_INTERVAL:
+            raise InvalidRecurrenceRuleError(f"INTERVAL must be at most {MAX_INTERVAL}")
+
+        until = None
+        if "UNTIL" in parts:
+            raw_until = parts.pop("UNTIL").rstrip("Z")
+            try:
+                until = datetime.strptime(
+                    raw_until, "%Y%m%dT%H%M%S" if "T" in raw_until else "%Y%m%d"
+                )
+            except ValueError:
+                raise InvalidRecurrenceRuleError("UNTIL must be YYYYMMDD[THHMMSS[Z]]")
+
+        by_day: Tuple[int, ...] = ()
+        if "BYDAY" in parts:
+            if freq != "WEEKLY":
+                raise InvalidRecurrenceRuleError("BYDAY is only supported with FREQ=WEEKLY")
+            days = parts.pop("BYDAY").split(",")
+            if any(day not in WEEKDAYS for day in days):
+                raise InvalidRecurrenceRuleError("BYDAY values must be MO..SU")
+            by_day = tuple(sorted({WEEKDAYS.index(day) for day in days}))
+
+        if parts:
+            raise InvalidRecurrenceRuleError(
+                "Unsupported rule parts: " + ", ".join(sorted(parts))
+            )
+
+        return cls(freq=freq, interval=interval, by_day=by_day, count=count, until=until)
+
+    def __str__(self) -> str:
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.by_day:
+            parts.append("BYDAY=" + ",".join(WEEKDAYS[day] for day in self.by_day))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            parts.append("UNTIL=" + self.until.strftime("%Y%m%dT%H%M%S"))
+        return ";".join(parts)
+
+    def occurrences(
+        self, anchor: datetime, anchor_index: int = 1, start: Optional[datetime] = None
+    ) -> Iterator[Tuple[int, datetime]]:
+        """(index, due date) of occurrences after the anchor, which is occurrence anchor_index.
+
+        With start, occurrences before it are skipped arithmetically rather
+        than generated, so a window far past the anchor costs no more than
+        one next to it.
+        """
+        periods, index = self._skip(anchor, start) if start is not None else (0, 0)
+        index += anchor_index
+        for candidate in self._candidates(anchor, periods):
+            if candidate <= anchor:
+                continue
+            index += 1
+            if self.count is not None and index > self.count:
+                return
+            if self.until is not None and candidate > self.until:
+                return
+            if start is None or candidate >= start:
+                yield index, candidate
+
+    def next_after(self, anchor: datetime, anchor_index: int = 1) -> Optional[datetime]:
+        occurrence = next(self.occurrences(anchor, anchor_index), None)
+        return occurrence[1] if occurrence else None
+
+    def _skip(self, anchor: datetime, start: datetime) -> Tuple[int, int]:
+        """Whole periods entirely before start, and how many occurrences they hold"""
+        if self.freq == "DAILY":
+            periods = max(0, (start - anchor) // timedelta(days=self.interval) - 1)
+            return periods, periods
+
+        if self.freq == "WEEKLY":
+            days = self.by_day or (anchor.weekday(),)
+            week_start = anchor - timedelta(days=anchor.weekday())
+            periods = max(0, (start - week_start) // timedelta(weeks=self.interval) - 1)
+            if not periods:
+                return 0, 0
+            # The anchor's own week only holds the days after the anchor.
+            first = sum(1 for day in days if week_start + timedelta(days=day) > anchor)
+            return periods, first + (periods - 1) * len(days)
+
+        if self.freq == "MONTHLY":
+            months = (start.year - anchor.year) * 12 + start.month - anchor.month
+            periods = max(0, months // self.interval - 1)
+            if anchor.day <= 28:
+                return periods, periods
+            skipped = 0
+            for period in range(1, periods + 1):
+                year, month = self._add_months(anchor, period * self.interval)
+                if anchor.day <= calendar.monthrange(year, month)[1]:
+                    skipped += 1
+            return periods, skipped
+
+        periods = max(0, (start.year - anchor.year) // self.interval - 1)
+        if not (anchor.month == 2 and anchor.day == 29):
+            return periods, periods
+        skipped = sum(
+            1
+            for period in range(1, periods + 1)
+            if calendar.isleap(anchor.year + period * self.interval)
+        )
+        return periods, skipped
+
+    @staticmethod
+    def _add_months(anchor: datetime, months: int) -> Tuple[int, int]:
+        month = anchor.month + months
+        return anchor.year + (month - 1) // 12, (month - 1) % 12 + 1
+
+    def _candidates(self, anchor: datetime, periods: int = 0) -> Iterator[datetime]:
+        """Candidate dates from period `periods` on; ends at the last representable date"""
+        try:
+            if self.freq == "DAILY":
+                step = timedelta(days=self.interval)
+                current = anchor + step * periods
+                while True:
+                    current += step
+                    yield current
+
+            elif self.freq == "WEEKLY":
+                days = self.by_day or (anchor.weekday(),)
+                week_start = anchor - timedelta(days=anchor.weekday())
+                week_start += timedelta(weeks=self.interval) * periods
+                while True:
+                    for day in days:
+                        yield week_start + timedelta(days=day)
+                    week_start += timedelta(weeks=self.interval)
+
+            elif self.freq == "MONTHLY":
+                period = periods
+                while True:
+                    period += 1
+                    year, month = self._add_months(anchor, period * self.interval)
+                    if year > MAXYEAR:
+                        return
+                    # Months without the anchor's day are skipped, as in RFC 5545.
+                    if anchor.day <= calendar.monthrange(year, month)[1]:
+                        yield anchor.replace(year=year, month=month)
+
+            else:
+                year = anchor.year + periods * self.interval
+                while True:
+                    year += self.interval
+                    if year > MAXYEAR:
+                        return
+                    if anchor.month == 2 and anchor.day == 29 and not calendar.isleap(year):
+                        continue
+                    yield anchor.replace(year=year)
+        except OverflowError:
+            return
@@ -0,0 +1,253 @@
+import zlib
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, Optional
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+DEFAULT_EXCLUDED_MEDIA_TYPES = ("text/event-stream",)
+
+
+class Compressor(ABC):
+    """Incremental encoder used for both buffered and streamed bodies"""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        pass
+
+    @abstractmethod
+    def flush(self) -> bytes:
+        pass
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        pass
+
+
+class GzipCompressor(Compressor):
+    def __init__(self, level: int):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor(Compressor):
+    def __init__(self, level: int):
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class ZstdCompressor(Compressor):
+    def __init__(self, level: int):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def available_encodings() -> Dict[str, Callable[[int], Compressor]]:
+    """Encodings usable in this process, in server preference order"""
+    encoders: Dict[str, Callable[[int], Compressor]] = {}
+    if zstandard is not None:
+        encoders["zstd"] = ZstdCompressor
+    if brotli is not None:
+        encoders["br"] = BrotliCompressor
+    encoders["gzip"] = GzipCompressor
+    return encoders
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    weights: Dict[str, float] = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[token] = q
+    return weights
+
+
+def negotiate_encoding(header: str, supported: Iterable[str]) -> Optional[str]:
+    """Pick the client's highest-weighted encoding, ties go to server order"""
+    weights = parse_accept_encoding(header)
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in supported:
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CompressionMiddleware:
+    """Compresses responses with zstd, br or gzip based on Accept-Encoding.
+
+    Pure ASGI so that streamed bodies are encoded chunk by chunk (each chunk
+    is flushed so clients see data as soon as it is produced) instead of
+    being buffered in full.
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 500,
+        gzip_level: int = 6,
+        brotli_level: int = 4,
+        zstd_level: int = 3,
+        encodings: Optional[Iterable[str]] = None,
+        excluded_media_types: Iterable[str] = DEFAULT_EXCLUDED_MEDIA_TYPES,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": gzip_level, "br": brotli_level, "zstd": zstd_level}
+        available = available_encodings()
+        if encodings is not None:
+            allowed = set(encodings)
+            available = {k: v for k, v in available.items() if k in allowed}
+        self.encoders = available
+        self.excluded_media_types = tuple(excluded_media_types)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+
+        encoding = negotiate_encoding(accept, self.encoders) if accept else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def create_compressor(self, encoding: str) -> Compressor:
+        return self.encoders[encoding](self.levels[encoding])
+
+
+class _CompressingResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start_message = None
+        self._compressor: Optional[Compressor] = None
+        self._passthrough = False
+
+    async def send(self, message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            self._start_message = message
+            headers = dict(message.get("headers", []))
+            content_type = headers.get(b"content-type", b"").decode("latin-1")
+            if b"content-encoding" in headers or content_type.startswith(
+                self.middleware.excluded_media_types
+            ):
+                self._passthrough = True
+            return
+
+        if message_type != "http.response.body":
+            await self._send(message)
+            return
+
+        if self._passthrough:
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._compressor is None:
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self._passthrough = True
+                await self._flush_start()
+                await self._send(message)
+                return
+
+            self._compressor = self.middleware.create_compressor(self.encoding)
+
+            if not more_body:
+                payload = self._compressor.compress(body) + self._compressor.finish()
+                self._set_encoding_headers(content_length=len(payload))
+                await self._flush_start()
+                await self._send(
+                    {"type": "http.response.body", "body": payload, "more_body": False}
+                )
+                return
+
+            self._set_encoding_headers(content_length=None)
+            await self._flush_start()
+
+        if more_body:
+            payload = self._compressor.compress(body) + self._compressor.flush()
+        else:
+            payload = self._compressor.compress(body) + self._compressor.finish()
+
+        await self._send(
+            {"type": "http.response.body", "body": payload, "more_body": more_body}
+        )
+
+    def _set_encoding_headers(self, content_length: Optional[int]) -> None:
+        headers = [
+            (name, value)
+            for name, value in self._start_message.get("headers", [])
+            if name not in (b"content-length", b"content-encoding")
+        ]
+        headers.append((b"content-encoding", self.encoding.encode("latin-1")))
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode("latin-1")))
+
+        vary = [value for name, value in headers if name == b"vary"]
+        if not any(b"accept-encoding" in value.lower() for value in vary):
+            headers.append((b"vary", b"Accept-Encoding"))
+
+        self._start_message = {**self._start_message, "headers": headers}
+
+    async def _flush_start(self) -> None:
+        if self._start_message is not None:
+            await self._send(self._start_message)
+            self._start_message = None
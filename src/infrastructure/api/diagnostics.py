@@ -0,0 +1,26 @@
+from ..diagnostics import QueryDiagnostics, current_request
+
+
+class DiagnosticsMiddleware:
+    """Opens a per-request diagnostics scope while query diagnostics are enabled"""
+
+    def __init__(self, app, diagnostics: QueryDiagnostics):
+        self.app = app
+        self.diagnostics = diagnostics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = self.diagnostics.start_request(scope)
+        if request is None:
+            await self.app(scope, receive, send)
+            return
+
+        token = current_request.set(request)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_request.reset(token)
+            self.diagnostics.finish_request(request)
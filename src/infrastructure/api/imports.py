@@ -0,0 +1,106 @@
+import codecs
+import csv
+import json
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterator, Tuple
+
+from application.use_cases.commands.import_todos import ImportRow
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/jsonl", "application/ndjson")
+CSV_MEDIA_TYPES = ("text/csv",)
+# Uploads larger than this are spooled to a temporary file rather than memory.
+SPOOL_MEMORY_BYTES = 1024 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+
+
+async def spool_upload(chunks: AsyncIterator[bytes]) -> SpooledTemporaryFile:
+    """Read a request body in full before the response starts.
+
+    A streaming response may listen for the client disconnecting by calling
+    receive() itself, which would swallow body chunks still being read.
+    """
+    spool = SpooledTemporaryFile(max_size=SPOOL_MEMORY_BYTES)
+    try:
+        async for chunk in chunks:
+            spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+async def read_spooled(spool: SpooledTemporaryFile) -> AsyncIterator[bytes]:
+    """Chunks of a spooled upload; closes the spool once read"""
+    try:
+        while chunk := spool.read(READ_CHUNK_BYTES):
+            yield chunk
+    finally:
+        spool.close()
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """Decoded lines of a streamed body, numbered from 1, one chunk in memory at a time"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    number = 0
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *complete, pending = pending.split("\n")
+        for line in complete:
+            number += 1
+            yield number, line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield number + 1, pending.rstrip("\r")
+
+
+async def parse_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRow]:
+    async for number, line in _lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            values = json.loads(line)
+        except ValueError as exc:
+            yield ImportRow(line=number, values=None, error=f"invalid JSON: {exc}")
+            continue
+        if not isinstance(values, dict):
+            yield ImportRow(line=number, values=None, error="each line must be a JSON object")
+            continue
+        yield ImportRow(line=number, values=values)
+
+
+async def parse_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportRow]:
+    """CSV with a header row; tags are separated by ';' within their column"""
+    header = None
+    record, start = [], 0
+    async for number, line in _lines(chunks):
+        if not record:
+            start = number
+        record.append(line)
+        # A quoted field may span lines; the record ends once quotes balance.
+        if sum(part.count('"') for part in record) % 2:
+            continue
+        text, record = "\n".join(record), []
+        if not text.strip():
+            continue
+
+        try:
+            fields = next(csv.reader([text]))
+        except csv.Error as exc:
+            yield ImportRow(line=start, values=None, error=f"invalid CSV: {exc}")
+            continue
+        if header is None:
+            header = [name.strip() for name in fields]
+            continue
+        if len(fields) != len(header):
+            yield ImportRow(
+                line=start,
+                values=None,
+                error=f"expected {len(header)} columns, got {len(fields)}",
+            )
+            continue
+        yield ImportRow(line=start, values=dict(zip(header, fields)))
+
+    if record:
+        yield ImportRow(line=start, values=None, error="unterminated quoted field")
@@ -1,18 +1,62 @@
-from typing import Annotated
-from fastapi import Depends
+from typing import Annotated, AsyncIterator, Optional
+from fastapi import Depends, HTTPException, WebSocket, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from application.use_cases.commands.complete_todo import CompleteTodoHandler
+from application.use_cases.commands.create_project import CreateProjectHandler
 from application.use_cases.commands.create_todo import CreateTodoHandler
+from application.use_cases.commands.delete_project import DeleteProjectHandler
+from application.use_cases.commands.delete_todo import (
+    BulkDeleteTodosHandler,
+    DeleteTodoHandler,
+)
+from application.use_cases.commands.import_todos import ImportTodosHandler
+from application.use_cases.commands.update_project import RenameProjectHandler
 from application.use_cases.commands.update_todo import UpdateTodoHandler
+from application.use_cases.queries.batch_get_todos import BatchGetTodosHandler
+from application.use_cases.queries.get_analytics import GetAnalyticsHandler
+from application.use_cases.queries.get_changes import GetChangesHandler
+from application.use_cases.queries.get_next_todos import GetNextTodosHandler
+from application.use_cases.queries.get_projects import GetProjectsHandler
+from application.use_cases.queries.get_subtree import GetSubtreeHandler
 from application.use_cases.queries.get_todo import GetTodoHandler
+from application.use_cases.queries.get_todo_history import GetTodoHistoryHandler
 from application.use_cases.queries.list_todos import ListTodosHandler
+from application.use_cases.queries.suggest_titles import SuggestTitlesHandler
+from config.settings import get_settings
 
+from ...cache.next_todos import CachedNextTodos, NextTodosCache
+from ...cache.title_suggestions import CachedTitleSuggestions, TitleSuggestionCache
+from ...container import get_container
+from ...diagnostics import QueryDiagnostics
+from ...events.broker import BrokerEventBus
+from ...events.change_feed import ChangeFeed
 from ...events.event_bus import InMemoryEventBus
-from ...persistence.sqlalchemy.database import get_session
-from ...persistence.sqlalchemy.read_repositories import TodoReadRepository
+from ...persistence.memory.bulk_import import InMemoryTodoImporter
+from ...persistence.memory.read_repositories import (
+    InMemoryAnalyticsReadRepository,
+    InMemoryProjectReadRepository,
+    InMemoryTodoHistoryReadRepository,
+    InMemoryTodoReadRepository,
+)
+from ...persistence.memory.store import InMemoryTodoStore
+from ...persistence.memory.unit_of_work import InMemoryUnitOfWork
+from ...persistence.sqlalchemy.bulk_import import CopyTodoImporter
+from ...persistence.sqlalchemy.dataloader import TodoDataLoader
+from ...persistence.sqlalchemy.database import ReadSession, engine
+from ...persistence.sqlalchemy.group_commit import (
+    CoalescedCompleteTodoHandler,
+    CoalescedCreateTodoHandler,
+    WriteCoalescer,
+)
+from ...persistence.sqlalchemy.read_repositories import (
+    AnalyticsReadRepository,
+    ProjectReadRepository,
+    TodoHistoryReadRepository,
+    TodoReadRepository,
+)
 from ...persistence.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+from ...reminders.scheduler import ReminderScheduler
 
 security = HTTPBearer()
 
@@ -23,25 +67,76 @@ async def get_current_user(
     return {"id": "user123", "email": "user@example.com"}
 
 
-async def get_unit_of_work(session: Annotated[AsyncSession, Depends(get_session)]):
-    return SQLAlchemyUnitOfWork(session)
+async def get_current_ws_user(websocket: WebSocket) -> dict:
+    return {"id": "user123", "email": "user@example.com"}
+
+
+async def get_diagnostics_admin(
+    current_user: Annotated[dict, Depends(get_current_user)],
+) -> dict:
+    # Diagnostics switches add overhead to every request in the process.
+    if current_user["id"] not in get_settings().diagnostics_admin_user_ids:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Diagnostics are restricted to administrators",
+        )
+    return current_user
+
+
+def get_unit_of_work() -> SQLAlchemyUnitOfWork:
+    return get_container().unit_of_work()
+
+
+# App-scoped singletons, owned by the container
+def get_event_bus() -> InMemoryEventBus:
+    return get_container().event_bus
+
+
+def get_broker_event_bus() -> Optional[BrokerEventBus]:
+    return get_container().broker_event_bus
+
 
+def get_change_feed() -> ChangeFeed:
+    return get_container().change_feed
 
-def get_event_bus():
-    return InMemoryEventBus()
+
+def get_query_diagnostics() -> QueryDiagnostics:
+    return get_container().query_diagnostics
+
+
+def get_title_suggestion_cache() -> TitleSuggestionCache:
+    return get_container().title_suggestion_cache
+
+
+def get_next_todos_cache() -> Optional[NextTodosCache]:
+    return get_container().next_todos_cache
+
+
+def get_write_coalescer() -> Optional[WriteCoalescer]:
+    return get_container().write_coalescer
+
+
+def get_reminder_scheduler() -> ReminderScheduler:
+    return get_container().reminder_scheduler
 
 
 def get_create_todo_handler(
     uow: Annotated[SQLAlchemyUnitOfWork, Depends(get_unit_of_work)],
     event_bus: Annotated[InMemoryEventBus, Depends(get_event_bus)],
+    coalescer: Annotated[Optional[WriteCoalescer], Depends(get_write_coalescer)],
 ) -> CreateTodoHandler:
+    if coalescer is not None:
+        return CoalescedCreateTodoHandler(coalescer, CreateTodoHandler(uow, event_bus))
     return CreateTodoHandler(uow, event_bus)
 
 
 def get_complete_todo_handler(
     uow: Annotated[SQLAlchemyUnitOfWork, Depends(get_unit_of_work)],
     event_bus: Annotated[InMemoryEventBus, Depends(get_event_bus)],
+    coalescer: Annotated[Optional[WriteCoalescer], Depends(get_write_coalescer)],
 ) -> CompleteTodoHandler:
+    if coalescer is not None:
+        return CoalescedCompleteTodoHandler(coalescer, CompleteTodoHandler(uow, event_bus))
     return CompleteTodoHandler(uow, event_bus)
 
 
@@ -52,16 +147,199 @@ def get_update_todo_handler(
     return UpdateTodoHandler(uow, event_bus)
 
 
+def get_delete_todo_handler(
+    uow: Annotated[SQLAlchemyUnitOfWork, Depends(get_unit_of_work)],
+    event_bus: Annotated[InMemoryEventBus, Depends(get_event_bus)],
+) -> DeleteTodoHandler:
+    return DeleteTodoHandler(uow, event_bus)
+
+
+def get_bulk_delete_todos_handler(
+    uow: Annotated[SQLAlchemyUnitOfWork, Depends(get_unit_of_work)],
+    event_bus: Annotated[InMemoryEventBus, Depends(get_event_bus)],
+) -> BulkDeleteTodosHandler:
+    return BulkDeleteTodosHandler(uow, event_bus)
+
+
+def get_create_project_handler(
+    uow: Annotated[SQLAlchemyUnitOfWork, Depends(get_unit_of_work)],
+) -> CreateProjectHandler:
+    return CreateProjectHandler(uow)
+
+
+def get_rename_project_handler(
+    uow: Annotated[SQLAlchemyUnitOfWork, Depends(get_unit_of_work)],
+) -> RenameProjectHandler:
+    return RenameProjectHandler(uow)
+
+
+def get_delete_project_handler(
+    uow: Annotated[SQLAlchemyUnitOfWork, Depends(get_unit_of_work)],
+    event_bus: Annotated[InMemoryEventBus, Depends(get_event_bus)],
+) -> DeleteProjectHandler:
+    return DeleteProjectHandler(uow, event_bus)
+
+
+def get_todo_importer() -> CopyTodoImporter:
+    return CopyTodoImporter(engine)
+
+
+def get_import_todos_handler(
+    importer: Annotated[CopyTodoImporter, Depends(get_todo_importer)],
+    event_bus: Annotated[InMemoryEventBus, Depends(get_event_bus)],
+) -> ImportTodosHandler:
+    settings = get_settings()
+    return ImportTodosHandler(
+        importer,
+        event_bus,
+        batch_size=settings.import_batch_size,
+        max_reported_errors=settings.import_max_reported_errors,
+    )
+
+
 # Query Handlers
+async def get_read_session() -> AsyncIterator[ReadSession]:
+    # Shared by every read repository of the request, so they all read one
+    # snapshot; closed once the request is done.
+    session = get_container().read_session()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+def get_todo_read_repository(
+    session: Annotated[ReadSession, Depends(get_read_session)],
+) -> TodoReadRepository:
+    return TodoReadRepository(session)
+
+
+def get_project_read_repository(
+    session: Annotated[ReadSession, Depends(get_read_session)],
+) -> ProjectReadRepository:
+    return ProjectReadRepository(session)
+
+
+def get_history_read_repository(
+    session: Annotated[ReadSession, Depends(get_read_session)],
+) -> TodoHistoryReadRepository:
+    return TodoHistoryReadRepository(session)
+
+
+def get_analytics_read_repository(
+    session: Annotated[ReadSession, Depends(get_read_session)],
+) -> AnalyticsReadRepository:
+    return AnalyticsReadRepository(session)
+
+
+def get_todo_loader(
+    read_repo: Annotated[TodoReadRepository, Depends(get_todo_read_repository)],
+) -> TodoDataLoader:
+    # FastAPI caches dependencies per request, so every consumer within one
+    # request shares this loader and its batches.
+    return TodoDataLoader(read_repo, max_batch_size=get_settings().batch_get_max_ids)
+
+
 def get_list_todos_handler(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    read_repo: Annotated[TodoReadRepository, Depends(get_todo_read_repository)],
 ) -> ListTodosHandler:
-    read_repo = TodoReadRepository(session)
     return ListTodosHandler(read_repo)
 
 
 def get_get_todo_handler(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    loader: Annotated[TodoDataLoader, Depends(get_todo_loader)],
 ) -> GetTodoHandler:
-    read_repo = TodoReadRepository(session)
-    return GetTodoHandler(read_repo)
+    return GetTodoHandler(loader)
+
+
+def get_batch_get_todos_handler(
+    loader: Annotated[TodoDataLoader, Depends(get_todo_loader)],
+) -> BatchGetTodosHandler:
+    return BatchGetTodosHandler(loader)
+
+
+def get_get_changes_handler(
+    read_repo: Annotated[TodoReadRepository, Depends(get_todo_read_repository)],
+) -> GetChangesHandler:
+    return GetChangesHandler(read_repo)
+
+
+def get_get_subtree_handler(
+    read_repo: Annotated[TodoReadRepository, Depends(get_todo_read_repository)],
+) -> GetSubtreeHandler:
+    return GetSubtreeHandler(read_repo)
+
+
+def get_todo_history_handler(
+    read_repo: Annotated[TodoHistoryReadRepository, Depends(get_history_read_repository)],
+) -> GetTodoHistoryHandler:
+    return GetTodoHistoryHandler(read_repo)
+
+
+def get_analytics_handler(
+    read_repo: Annotated[AnalyticsReadRepository, Depends(get_analytics_read_repository)],
+) -> GetAnalyticsHandler:
+    return GetAnalyticsHandler(read_repo)
+
+
+def get_get_projects_handler(
+    read_repo: Annotated[ProjectReadRepository, Depends(get_project_read_repository)],
+) -> GetProjectsHandler:
+    return GetProjectsHandler(read_repo)
+
+
+def get_suggest_titles_handler(
+    read_repo: Annotated[TodoReadRepository, Depends(get_todo_read_repository)],
+    cache: Annotated[TitleSuggestionCache, Depends(get_title_suggestion_cache)],
+) -> SuggestTitlesHandler:
+    return SuggestTitlesHandler(CachedTitleSuggestions(cache, read_repo))
+
+
+def get_next_todos_handler(
+    read_repo: Annotated[TodoReadRepository, Depends(get_todo_read_repository)],
+    cache: Annotated[Optional[NextTodosCache], Depends(get_next_todos_cache)],
+) -> GetNextTodosHandler:
+    if cache is None:
+        return GetNextTodosHandler(read_repo)
+    return GetNextTodosHandler(CachedNextTodos(cache, read_repo))
+
+
+# In-memory backend
+def get_todo_store() -> InMemoryTodoStore:
+    return get_container().todo_store
+
+
+def get_memory_unit_of_work() -> InMemoryUnitOfWork:
+    return InMemoryUnitOfWork(get_todo_store())
+
+
+def get_memory_todo_read_repository() -> InMemoryTodoReadRepository:
+    return InMemoryTodoReadRepository(get_todo_store())
+
+
+def get_memory_project_read_repository() -> InMemoryProjectReadRepository:
+    return InMemoryProjectReadRepository(get_todo_store())
+
+
+def get_memory_history_read_repository() -> InMemoryTodoHistoryReadRepository:
+    return InMemoryTodoHistoryReadRepository(get_todo_store())
+
+
+def get_memory_analytics_read_repository() -> InMemoryAnalyticsReadRepository:
+    return InMemoryAnalyticsReadRepository(get_todo_store())
+
+
+def get_memory_todo_importer() -> InMemoryTodoImporter:
+    return InMemoryTodoImporter(get_todo_store())
+
+
+def memory_backend_overrides() -> dict:
+    """Dependency overrides that swap Postgres for the in-memory store"""
+    return {
+        get_unit_of_work: get_memory_unit_of_work,
+        get_todo_read_repository: get_memory_todo_read_repository,
+        get_project_read_repository: get_memory_project_read_repository,
+        get_history_read_repository: get_memory_history_read_repository,
+        get_analytics_read_repository: get_memory_analytics_read_repository,
+        get_todo_importer: get_memory_todo_importer,
+    }
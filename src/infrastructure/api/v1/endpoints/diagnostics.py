@@ -0,0 +1,48 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from ....diagnostics import QueryDiagnostics
+from ..dependencies import get_diagnostics_admin, get_query_diagnostics
+from ..schemas import (
+    DiagnosticsResponse,
+    EventConsumerMetricsResponse,
+    UpdateDiagnosticsRequest,
+)
+
+router = APIRouter(prefix="/diagnostics", tags=["diagnostics"])
+
+
+@router.get("/", response_model=DiagnosticsResponse)
+async def get_diagnostics(
+    current_user: Annotated[dict, Depends(get_diagnostics_admin)],
+    diagnostics: Annotated[QueryDiagnostics, Depends(get_query_diagnostics)],
+):
+    """Current settings, recent slow queries and captured plans"""
+    return DiagnosticsResponse(**diagnostics.report())
+
+
+@router.patch("/", response_model=DiagnosticsResponse)
+async def update_diagnostics(
+    request: UpdateDiagnosticsRequest,
+    current_user: Annotated[dict, Depends(get_diagnostics_admin)],
+    diagnostics: Annotated[QueryDiagnostics, Depends(get_query_diagnostics)],
+):
+    """Change diagnostics settings at runtime; omitted fields are left as they are"""
+    diagnostics.update(**request.model_dump(exclude_none=True))
+    return DiagnosticsResponse(**diagnostics.report())
+
+
+@router.get("/event-consumer", response_model=EventConsumerMetricsResponse)
+async def get_event_consumer_metrics(
+    request: Request,
+    current_user: Annotated[dict, Depends(get_diagnostics_admin)],
+):
+    """Per-partition lag and lane depths of this worker's event consumer"""
+    consumer = getattr(request.app.state, "event_consumer", None)
+    if consumer is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="The event consumer is not enabled",
+        )
+    return EventConsumerMetricsResponse(**await consumer.metrics())
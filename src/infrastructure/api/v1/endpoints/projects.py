@@ -0,0 +1,119 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from application.use_cases.commands.create_project import (
+    CreateProjectCommand,
+    CreateProjectHandler,
+)
+from application.use_cases.commands.delete_project import (
+    DeleteProjectCommand,
+    DeleteProjectHandler,
+)
+from application.use_cases.commands.update_project import (
+    RenameProjectCommand,
+    RenameProjectHandler,
+)
+from application.use_cases.queries.get_projects import (
+    GetProjectsHandler,
+    ListProjectsQuery,
+)
+from domain.exceptions import ProjectNotFoundError
+
+from ..dependencies import (
+    get_create_project_handler,
+    get_current_user,
+    get_delete_project_handler,
+    get_get_projects_handler,
+    get_rename_project_handler,
+)
+from ..schemas import (
+    CreateProjectRequest,
+    ProjectListResponse,
+    ProjectResponse,
+    UpdateProjectRequest,
+)
+
+router = APIRouter(prefix="/projects", tags=["projects"])
+
+
+@router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
+async def create_project(
+    request: CreateProjectRequest,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[CreateProjectHandler, Depends(get_create_project_handler)],
+    get_handler: Annotated[GetProjectsHandler, Depends(get_get_projects_handler)],
+):
+    """Create an empty project"""
+    command = CreateProjectCommand(name=request.name, user_id=current_user["id"])
+    project_id = await handler.handle(command)
+
+    project = await get_handler.get(project_id, current_user["id"])
+    return ProjectResponse(**project.__dict__)
+
+
+@router.get("/", response_model=ProjectListResponse)
+async def list_projects(
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[GetProjectsHandler, Depends(get_get_projects_handler)],
+):
+    """Every project of the current user with its open and completed todo counts"""
+    projects = await handler.handle(ListProjectsQuery(user_id=current_user["id"]))
+    return ProjectListResponse(
+        items=[ProjectResponse(**project.__dict__) for project in projects]
+    )
+
+
+@router.get("/{project_id}", response_model=ProjectResponse)
+async def get_project(
+    project_id: str,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[GetProjectsHandler, Depends(get_get_projects_handler)],
+):
+    """Get a specific project"""
+    try:
+        project = await handler.get(project_id, current_user["id"])
+    except ProjectNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Project {project_id} not found"
+        )
+    return ProjectResponse(**project.__dict__)
+
+
+@router.put("/{project_id}", response_model=ProjectResponse)
+async def rename_project(
+    project_id: str,
+    request: UpdateProjectRequest,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[RenameProjectHandler, Depends(get_rename_project_handler)],
+    get_handler: Annotated[GetProjectsHandler, Depends(get_get_projects_handler)],
+):
+    """Rename a project"""
+    try:
+        command = RenameProjectCommand(
+            project_id=project_id, name=request.name, user_id=current_user["id"]
+        )
+        await handler.handle(command)
+
+        project = await get_handler.get(project_id, current_user["id"])
+    except ProjectNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Project {project_id} not found"
+        )
+    return ProjectResponse(**project.__dict__)
+
+
+@router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_project(
+    project_id: str,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[DeleteProjectHandler, Depends(get_delete_project_handler)],
+):
+    """Delete a project; its todos are kept without a project"""
+    try:
+        command = DeleteProjectCommand(project_id=project_id, user_id=current_user["id"])
+        await handler.handle(command)
+    except ProjectNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Project {project_id} not found"
+        )
@@ -1,7 +1,30 @@
+import asyncio
+import json
+from datetime import datetime, timezone
 from typing import Annotated, List, Optional
+from uuid import UUID
 
+from ....events.change_feed import ChangeFeed
 from ....events.event_bus import InMemoryEventBus
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from ...imports import (
+    CSV_MEDIA_TYPES,
+    NDJSON_MEDIA_TYPES,
+    parse_csv,
+    parse_ndjson,
+    read_spooled,
+    spool_upload,
+)
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import JSONResponse, StreamingResponse
 from ....persistence.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
 
 from application.use_cases.commands.complete_todo import (
@@ -12,46 +35,149 @@ from application.use_cases.commands.create_todo import (
     CreateTodoCommand,
     CreateTodoHandler,
 )
+from application.use_cases.commands.delete_todo import (
+    BulkDeleteTodosCommand,
+    BulkDeleteTodosHandler,
+    DeleteTodoCommand,
+    DeleteTodoHandler,
+)
+from application.use_cases.commands.import_todos import (
+    ImportTodosCommand,
+    ImportTodosHandler,
+)
 from application.use_cases.commands.update_todo import (
     UpdateTodoCommand,
     UpdateTodoHandler,
 )
+from application.dto.todo_dto import TODO_FIELDS
+from application.use_cases.queries.batch_get_todos import (
+    BatchGetTodosHandler,
+    BatchGetTodosQuery,
+)
+from application.use_cases.queries.get_analytics import (
+    AnalyticsBucket,
+    GetAnalyticsHandler,
+    GetAnalyticsQuery,
+    analytics_range,
+)
+from application.use_cases.queries.get_changes import (
+    ChangeToken,
+    GetChangesHandler,
+    GetChangesQuery,
+)
+from application.use_cases.queries.get_next_todos import (
+    GetNextTodosHandler,
+    GetNextTodosQuery,
+)
+from application.use_cases.queries.get_subtree import (
+    GetSubtaskCountsQuery,
+    GetSubtreeHandler,
+    GetSubtreeQuery,
+)
 from application.use_cases.queries.get_todo import GetTodoHandler
+from application.use_cases.queries.get_todo_history import (
+    GetTodoHistoryHandler,
+    GetTodoHistoryQuery,
+    GetTodoStateQuery,
+)
 from application.use_cases.queries.list_todos import (
     ListTodosHandler,
     ListTodosQuery,
     SortField,
     SortOrder,
 )
-from domain.exceptions import InvalidTodoStateError, TodoNotFoundError
+from application.use_cases.queries.suggest_titles import (
+    SuggestTitlesHandler,
+    SuggestTitlesQuery,
+)
+from domain.exceptions import (
+    ChangeTokenExpiredError,
+    InvalidTodoStateError,
+    TodoNotFoundError,
+)
 from domain.value_objects.priority import Priority
 from domain.value_objects.todo_status import TodoStatus
+from config.settings import get_settings
 
 from ..dependencies import (
+    get_analytics_handler,
+    get_batch_get_todos_handler,
+    get_bulk_delete_todos_handler,
+    get_change_feed,
     get_complete_todo_handler,
     get_create_todo_handler,
     get_current_user,
+    get_current_ws_user,
+    get_delete_todo_handler,
     get_event_bus,
+    get_get_changes_handler,
+    get_get_subtree_handler,
     get_get_todo_handler,
+    get_import_todos_handler,
     get_list_todos_handler,
+    get_next_todos_handler,
+    get_suggest_titles_handler,
+    get_todo_history_handler,
     get_unit_of_work,
 )
 from ..schemas import (
+    AnalyticsResponse,
+    BatchDeleteTodosRequest,
+    BatchGetTodosRequest,
     CreateTodoRequest,
+    NextTodosResponse,
+    SubtaskCountsListResponse,
+    SubtaskCountsResponse,
+    TitleSuggestionResponse,
+    TitleSuggestionsResponse,
+    TodoBatchDeleteResponse,
+    TodoBatchResponse,
+    TodoChangesResponse,
+    TodoHistoryResponse,
     TodoListResponse,
+    TodoOccurrenceResponse,
     TodoResponse,
+    TodoStateResponse,
     TodoStatusEnum,
+    TodoTreeResponse,
     UpdateTodoRequest,
+    projected_todo_list_response,
+    projected_todo_response,
 )
 
 router = APIRouter(prefix="/todos", tags=["todos"])
 
+FIELDS_DESCRIPTION = f"Comma-separated sparse fieldset, any of: {', '.join(TODO_FIELDS)}"
+
+
+def parse_fields(fields: Optional[str]) -> Optional[tuple[str, ...]]:
+    if not fields:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested.difference(TODO_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    requested.add("id")
+    # Canonical order so equal fieldsets share a cached response model.
+    return tuple(name for name in TODO_FIELDS if name in requested)
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Stored due dates are naive UTC; aware query times would not compare with them"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
 
 @router.post("/", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
 async def create_todo(
     request: CreateTodoRequest,
     current_user: Annotated[dict, Depends(get_current_user)],
     handler: Annotated[CreateTodoHandler, Depends(get_create_todo_handler)],
+    get_handler: Annotated[GetTodoHandler, Depends(get_get_todo_handler)],
 ):
     """Create a new todo"""
     command = CreateTodoCommand(
@@ -61,11 +187,13 @@ async def create_todo(
         due_date=request.due_date,
         tags=request.tags,
         user_id=current_user["id"],
+        recurrence=request.recurrence,
+        parent_id=str(request.parent_id) if request.parent_id else None,
+        project_id=str(request.project_id) if request.project_id else None,
     )
 
     todo_id = await handler.handle(command)
 
-    get_handler = get_get_todo_handler()
     todo = await get_handler.handle(todo_id, current_user["id"])
 
     return TodoResponse(**todo.__dict__)
@@ -79,23 +207,58 @@ async def list_todos(
     priority: Optional[int] = Query(None, ge=1, le=4),
     tags: Optional[List[str]] = Query(None),
     search: Optional[str] = None,
+    ids: Optional[List[UUID]] = Query(None),
+    project_id: Optional[UUID] = None,
     sort_by: SortField = SortField.CREATED_AT,
     sort_order: SortOrder = SortOrder.DESC,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    occurrences_from: Optional[datetime] = Query(
+        None, description="Expand recurring todos from this time (with occurrences_to)"
+    ),
+    occurrences_to: Optional[datetime] = None,
 ):
     """List todos with filtering and pagination"""
+    occurrences_from = _naive_utc(occurrences_from)
+    occurrences_to = _naive_utc(occurrences_to)
+    if (occurrences_from is None) != (occurrences_to is None) or (
+        occurrences_from and occurrences_from > occurrences_to
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="occurrences_from and occurrences_to must be given together, in order",
+        )
+    selected_fields = parse_fields(fields)
     query = ListTodosQuery(
         user_id=current_user["id"],
         status=TodoStatus(status) if status else None,
         priority=Priority(priority) if priority else None,
         tags=tags,
         search=search,
+        ids=[str(todo_id) for todo_id in ids] if ids else None,
+        project_id=str(project_id) if project_id else None,
+        fields=list(selected_fields) if selected_fields else None,
         sort_by=sort_by,
         sort_order=sort_order,
         limit=limit,
         offset=offset,
+        occurrences_from=occurrences_from,
+        occurrences_to=occurrences_to,
+        max_occurrences=get_settings().recurrence_max_occurrences,
     )
+    occurrences = [
+        TodoOccurrenceResponse(**occurrence.__dict__)
+        for occurrence in await handler.expand_occurrences(query)
+    ]
+
+    if selected_fields:
+        rows, total = await handler.handle_fields(query)
+        response_model = projected_todo_list_response(selected_fields)
+        page = response_model(
+            items=rows, total=total, limit=limit, offset=offset, occurrences=occurrences
+        )
+        return JSONResponse(content=page.model_dump(mode="json"))
 
     todos, total = await handler.handle(query)
 
@@ -104,17 +267,305 @@ async def list_todos(
         total=total,
         limit=limit,
         offset=offset,
+        occurrences=occurrences,
+    )
+
+
+@router.post(":batchGet", response_model=TodoBatchResponse)
+async def batch_get_todos(
+    request: BatchGetTodosRequest,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[BatchGetTodosHandler, Depends(get_batch_get_todos_handler)],
+):
+    """Get several todos by id in one round trip"""
+    max_ids = get_settings().batch_get_max_ids
+    if len(request.ids) > max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {max_ids} ids can be requested at once",
+        )
+
+    query = BatchGetTodosQuery(
+        user_id=current_user["id"],
+        todo_ids=[str(todo_id) for todo_id in request.ids],
+    )
+    todos, missing = await handler.handle(query)
+
+    return TodoBatchResponse(
+        items=[TodoResponse(**todo.__dict__) for todo in todos],
+        missing=missing,
+    )
+
+
+@router.post(":batchDelete", response_model=TodoBatchDeleteResponse)
+async def batch_delete_todos(
+    request: BatchDeleteTodosRequest,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[BulkDeleteTodosHandler, Depends(get_bulk_delete_todos_handler)],
+):
+    """Delete several todos, along with their subtasks"""
+    max_ids = get_settings().batch_get_max_ids
+    if len(request.ids) > max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {max_ids} ids can be deleted at once",
+        )
+
+    command = BulkDeleteTodosCommand(
+        todo_ids=[str(todo_id) for todo_id in request.ids],
+        user_id=current_user["id"],
+    )
+    deleted, missing = await handler.handle(command)
+
+    return TodoBatchDeleteResponse(deleted=deleted, missing=missing)
+
+
+@router.post(":subtaskCounts", response_model=SubtaskCountsListResponse)
+async def subtask_counts(
+    request: BatchGetTodosRequest,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[GetSubtreeHandler, Depends(get_get_subtree_handler)],
+):
+    """Completed and total subtasks below each of several todos, in one query"""
+    max_ids = get_settings().batch_get_max_ids
+    if len(request.ids) > max_ids:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {max_ids} ids can be requested at once",
+        )
+
+    query = GetSubtaskCountsQuery(
+        todo_ids=[str(todo_id) for todo_id in request.ids],
+        user_id=current_user["id"],
+    )
+    counts = await handler.counts(query)
+
+    return SubtaskCountsListResponse(
+        items=[SubtaskCountsResponse(**item.__dict__) for item in counts]
+    )
+
+
+@router.post(":import")
+async def import_todos(
+    request: Request,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[ImportTodosHandler, Depends(get_import_todos_handler)],
+):
+    """Bulk import todos from an NDJSON or CSV body.
+
+    The body is spooled (to disk past a size limit) before responding, then
+    parsed chunk by chunk. Responds with NDJSON: progress and per-row error
+    records while the rows are staged, then a summary once everything has
+    been committed.
+    """
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if media_type in NDJSON_MEDIA_TYPES:
+        parse = parse_ndjson
+    elif media_type in CSV_MEDIA_TYPES:
+        parse = parse_csv
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Upload application/x-ndjson or text/csv",
+        )
+
+    upload = await spool_upload(request.stream())
+    command = ImportTodosCommand(user_id=current_user["id"], rows=parse(read_spooled(upload)))
+
+    async def report():
+        async for record in handler.handle(command):
+            yield json.dumps(record) + "\n"
+
+    return StreamingResponse(report(), media_type="application/x-ndjson")
+
+
+@router.get("/next", response_model=NextTodosResponse)
+async def next_todos(
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[GetNextTodosHandler, Depends(get_next_todos_handler)],
+    k: int = Query(10, ge=1),
+):
+    """The k most important open todos: highest priority, then earliest due"""
+    max_k = get_settings().next_todos_max_k
+    if k > max_k:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"k must be at most {max_k}",
+        )
+    todos = await handler.handle(GetNextTodosQuery(user_id=current_user["id"], k=k))
+
+    return NextTodosResponse(items=[TodoResponse(**todo.__dict__) for todo in todos])
+
+
+@router.get("/suggest", response_model=TitleSuggestionsResponse)
+async def suggest_titles(
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[SuggestTitlesHandler, Depends(get_suggest_titles_handler)],
+    q: str = Query(..., min_length=1, max_length=200),
+    k: int = Query(10, ge=1, le=50),
+):
+    """Autocomplete todo titles by prefix"""
+    query = SuggestTitlesQuery(user_id=current_user["id"], prefix=q, limit=k)
+    suggestions = await handler.handle(query)
+
+    return TitleSuggestionsResponse(
+        items=[TitleSuggestionResponse(**s.__dict__) for s in suggestions]
+    )
+
+
+@router.get("/changes", response_model=TodoChangesResponse)
+async def get_todo_changes(
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[GetChangesHandler, Depends(get_get_changes_handler)],
+    since: str = Query("0", description="next_token of the previous sync, 0 for a full sync"),
+    limit: int = Query(100, ge=1, le=500),
+):
+    """Todos changed and deleted since a change token"""
+    try:
+        token = ChangeToken.parse(since)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid change token"
+        )
+
+    query = GetChangesQuery(user_id=current_user["id"], since=token, limit=limit)
+    try:
+        changes = await handler.handle(query)
+    except ChangeTokenExpiredError as e:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(e))
+
+    return TodoChangesResponse(
+        changed=[TodoResponse(**todo.__dict__) for todo in changes.changed],
+        deleted=changes.deleted,
+        next_token=changes.next_token,
+        has_more=changes.has_more,
     )
 
 
+@router.get("/analytics", response_model=AnalyticsResponse)
+async def get_analytics(
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[GetAnalyticsHandler, Depends(get_analytics_handler)],
+    bucket: AnalyticsBucket = AnalyticsBucket.DAY,
+    days: int = Query(90, ge=1, description="Report on the last `days` days, today included"),
+):
+    """Created/completed trend, time to complete and overdue rates by priority.
+
+    Counts come from a daily rollup that trails writes by up to one refresh
+    interval; open overdue todos are counted live.
+    """
+    max_days = get_settings().analytics_max_days
+    if days > max_days:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {max_days} days can be reported at once",
+        )
+    since, until = analytics_range(days)
+    analytics = await handler.handle(
+        GetAnalyticsQuery(user_id=current_user["id"], since=since, until=until, bucket=bucket)
+    )
+    return AnalyticsResponse.model_validate(analytics)
+
+
+def format_sse(payload: Optional[dict]) -> str:
+    if payload is None:
+        return ": keep-alive\n\n"
+    return f"id: {payload['id']}\nevent: {payload['event']}\ndata: {payload['data']}\n\n"
+
+
+@router.get("/stream")
+async def stream_todo_changes(
+    current_user: Annotated[dict, Depends(get_current_user)],
+    change_feed: Annotated[ChangeFeed, Depends(get_change_feed)],
+):
+    """Stream todo changes of the current user as Server-Sent Events.
+
+    The feed is fed by this worker's in-process event bus, so a client only
+    sees changes made through the worker it is connected to. When the API
+    runs several workers, clients should resync through /changes after
+    reconnecting.
+    """
+    subscription = change_feed.subscribe(current_user["id"])
+    heartbeat = get_settings().change_feed_heartbeat_seconds
+
+    async def event_stream():
+        try:
+            yield "retry: 3000\n\n"
+            async for payload in subscription.events(heartbeat):
+                yield format_sse(payload)
+        finally:
+            change_feed.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/stream")
+async def stream_todo_changes_ws(
+    websocket: WebSocket,
+    current_user: Annotated[dict, Depends(get_current_ws_user)],
+    change_feed: Annotated[ChangeFeed, Depends(get_change_feed)],
+):
+    """Stream todo changes of the current user over a WebSocket.
+
+    Like the Server-Sent Events stream, this only carries changes made
+    through the worker the socket is connected to.
+    """
+    await websocket.accept()
+    subscription = change_feed.subscribe(current_user["id"])
+    heartbeat = get_settings().change_feed_heartbeat_seconds
+
+    async def wait_for_disconnect():
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            change_feed.unsubscribe(subscription)
+
+    receiver = asyncio.create_task(wait_for_disconnect())
+    try:
+        async for payload in subscription.events(heartbeat):
+            if payload is None:
+                await websocket.send_json({"event": "keep-alive"})
+            else:
+                await websocket.send_json(
+                    {
+                        "id": payload["id"],
+                        "event": payload["event"],
+                        "data": json.loads(payload["data"]),
+                    }
+                )
+        if subscription.overflowed:
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+        change_feed.unsubscribe(subscription)
+
+
 @router.get("/{todo_id}", response_model=TodoResponse)
 async def get_todo(
     todo_id: str,
     current_user: Annotated[dict, Depends(get_current_user)],
     handler: Annotated[GetTodoHandler, Depends(get_get_todo_handler)],
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
 ):
     """Get a specific todo"""
+    selected_fields = parse_fields(fields)
     try:
+        if selected_fields:
+            row = await handler.handle_fields(
+                todo_id, current_user["id"], list(selected_fields)
+            )
+            todo = projected_todo_response(selected_fields)(**row)
+            return JSONResponse(content=todo.model_dump(mode="json"))
+
         todo = await handler.handle(todo_id, current_user["id"])
         return TodoResponse(**todo.__dict__)
     except TodoNotFoundError:
@@ -123,19 +574,86 @@ async def get_todo(
         )
 
 
+@router.get("/{todo_id}/subtree", response_model=TodoTreeResponse)
+async def get_todo_subtree(
+    todo_id: str,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[GetSubtreeHandler, Depends(get_get_subtree_handler)],
+):
+    """A todo with all of its nested subtasks and their completion counts"""
+    try:
+        tree = await handler.handle(
+            GetSubtreeQuery(todo_id=todo_id, user_id=current_user["id"])
+        )
+    except TodoNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Todo {todo_id} not found"
+        )
+
+    return TodoTreeResponse.model_validate(tree)
+
+
+@router.get("/{todo_id}/history", response_model=TodoHistoryResponse)
+async def get_todo_history(
+    todo_id: str,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[GetTodoHistoryHandler, Depends(get_todo_history_handler)],
+    limit: int = Query(50, ge=1, le=200),
+    before: Optional[int] = Query(
+        None, ge=1, description="next_cursor of the previous page"
+    ),
+):
+    """Field changes of a todo, newest first; kept after the todo is deleted"""
+    try:
+        history = await handler.handle(
+            GetTodoHistoryQuery(
+                todo_id=todo_id, user_id=current_user["id"], limit=limit, before=before
+            )
+        )
+    except TodoNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Todo {todo_id} not found"
+        )
+
+    return TodoHistoryResponse.model_validate(history)
+
+
+@router.get("/{todo_id}/history/state", response_model=TodoStateResponse)
+async def get_todo_state(
+    todo_id: str,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[GetTodoHistoryHandler, Depends(get_todo_history_handler)],
+    at: Optional[datetime] = Query(None, description="Point in time; defaults to now"),
+):
+    """The todo as it was at a point in time, rebuilt from its history"""
+    try:
+        state = await handler.state_at(
+            GetTodoStateQuery(todo_id=todo_id, user_id=current_user["id"], at=at)
+        )
+    except TodoNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Todo {todo_id} not found"
+        )
+
+    return TodoStateResponse(**state.__dict__)
+
+
 @router.post("/{todo_id}/complete", response_model=TodoResponse)
 async def complete_todo(
     todo_id: str,
     current_user: Annotated[dict, Depends(get_current_user)],
     handler: Annotated[CompleteTodoHandler, Depends(get_complete_todo_handler)],
+    get_handler: Annotated[GetTodoHandler, Depends(get_get_todo_handler)],
+    cascade: bool = Query(False, description="Also complete every open subtask"),
 ):
     """Complete a todo"""
     try:
-        command = CompleteTodoCommand(todo_id=todo_id, user_id=current_user["id"])
+        command = CompleteTodoCommand(
+            todo_id=todo_id, user_id=current_user["id"], cascade=cascade
+        )
 
         await handler.handle(command)
 
-        get_handler = get_get_todo_handler()
         todo = await get_handler.handle(todo_id, current_user["id"])
 
         return TodoResponse(**todo.__dict__)
@@ -154,6 +672,7 @@ async def update_todo(
     current_user: Annotated[dict, Depends(get_current_user)],
     uow: Annotated[SQLAlchemyUnitOfWork, Depends(get_unit_of_work)],
     event_bus: Annotated[InMemoryEventBus, Depends(get_event_bus)],
+    get_handler: Annotated[GetTodoHandler, Depends(get_get_todo_handler)],
 ):
     """Update a todo"""
     handler = UpdateTodoHandler(uow, event_bus)
@@ -165,12 +684,13 @@ async def update_todo(
         due_date=request.due_date,
         tags=request.tags,
         user_id=current_user["id"],
+        recurrence=request.recurrence,
+        project_id=str(request.project_id) if request.project_id is not None else None,
     )
 
     try:
         await handler.handle(command)
 
-        get_handler = get_get_todo_handler()
         todo = await get_handler.handle(todo_id, current_user["id"])
 
         return TodoResponse(**todo.__dict__)
@@ -178,3 +698,19 @@ async def update_todo(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"Todo {todo_id} not found"
         )
+
+
+@router.delete("/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_todo(
+    todo_id: str,
+    current_user: Annotated[dict, Depends(get_current_user)],
+    handler: Annotated[DeleteTodoHandler, Depends(get_delete_todo_handler)],
+):
+    """Delete a todo along with its subtasks"""
+    try:
+        command = DeleteTodoCommand(todo_id=todo_id, user_id=current_user["id"])
+        await handler.handle(command)
+    except TodoNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Todo {todo_id} not found"
+        )
@@ -1,7 +1,9 @@
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from enum import IntEnum, Enum
-from typing import List, Optional
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, List, Literal, Optional, Union
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict, Field, create_model
 
 
 class PriorityEnum(IntEnum):
@@ -24,6 +26,13 @@ class CreateTodoRequest(BaseModel):
     priority: PriorityEnum = PriorityEnum.MEDIUM
     due_date: Optional[datetime] = None
     tags: List[str] = Field(default_factory=list, max_items=10)
+    recurrence: Optional[str] = Field(
+        None, max_length=200, description="RRULE, e.g. FREQ=WEEKLY;BYDAY=MO,TH"
+    )
+    parent_id: Optional[UUID] = Field(None, description="Create as a subtask of this todo")
+    project_id: Optional[UUID] = Field(
+        None, description="Project of the todo; subtasks default to their parent's"
+    )
 
 
 class UpdateTodoRequest(BaseModel):
@@ -32,6 +41,12 @@ class UpdateTodoRequest(BaseModel):
     priority: Optional[PriorityEnum] = None
     due_date: Optional[datetime] = None
     tags: Optional[List[str]] = Field(None, max_items=10)
+    recurrence: Optional[str] = Field(
+        None, max_length=200, description="RRULE; an empty string stops recurrence"
+    )
+    project_id: Optional[Union[UUID, Literal[""]]] = Field(
+        None, description="Move to this project; an empty string removes it from its project"
+    )
 
 
 class TodoResponse(BaseModel):
@@ -46,15 +61,244 @@ class TodoResponse(BaseModel):
     due_date: Optional[datetime]
     tags: List[str]
     is_overdue: bool
+    recurrence: Optional[str] = None
+    parent_id: Optional[str] = None
+    project_id: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class TodoTreeResponse(BaseModel):
+    todo: TodoResponse
+    done: int
+    total: int
+    children: List["TodoTreeResponse"] = Field(default_factory=list)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SubtaskCountsResponse(BaseModel):
+    todo_id: str
+    done: int
+    total: int
+
+
+class SubtaskCountsListResponse(BaseModel):
+    items: List[SubtaskCountsResponse]
+
+
+class TodoVersionResponse(BaseModel):
+    version: int
+    kind: str
+    changes: Dict[str, Any]
+    recorded_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TodoHistoryResponse(BaseModel):
+    items: List[TodoVersionResponse]
+    next_cursor: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TodoStateResponse(BaseModel):
+    todo_id: str
+    version: int
+    recorded_at: datetime
+    deleted: bool
+    state: Dict[str, Any]
+    replayed: int
+
+
+class TrendPointResponse(BaseModel):
+    bucket_start: date
+    created: int
+    completed: int
+    net_open: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CompletionTimeResponse(BaseModel):
+    priority: Optional[PriorityEnum]
+    completed: int
+    p50_hours: Optional[float]
+    p90_hours: Optional[float]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class OverdueRateResponse(BaseModel):
+    priority: PriorityEnum
+    completed_with_due_date: int
+    completed_late: int
+    open_overdue: int
+    overdue_rate: Optional[float]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AnalyticsResponse(BaseModel):
+    since: date
+    until: date
+    bucket: str
+    trend: List[TrendPointResponse]
+    time_to_complete: List[CompletionTimeResponse]
+    overdue: List[OverdueRateResponse]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CreateProjectRequest(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+
+
+class UpdateProjectRequest(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+
+
+class ProjectResponse(BaseModel):
+    id: str
+    name: str
+    open_count: int
+    completed_count: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class ProjectListResponse(BaseModel):
+    items: List[ProjectResponse]
+
+
+class TodoOccurrenceResponse(BaseModel):
+    todo_id: str
+    title: str
+    priority: PriorityEnum
+    due_date: datetime
+    occurrence_index: int
+
+
 class TodoListResponse(BaseModel):
     items: List[TodoResponse]
     total: int
     limit: int
     offset: int
+    occurrences: List[TodoOccurrenceResponse] = Field(default_factory=list)
+
+
+@lru_cache(maxsize=128)
+def projected_todo_response(fields: tuple[str, ...]) -> type[BaseModel]:
+    """TodoResponse narrowed to the requested sparse fieldset"""
+    return create_model(
+        "TodoProjectionResponse",
+        **{
+            name: (TodoResponse.model_fields[name].annotation, ...)
+            for name in fields
+        },
+    )
+
+
+@lru_cache(maxsize=128)
+def projected_todo_list_response(fields: tuple[str, ...]) -> type[BaseModel]:
+    return create_model(
+        "TodoProjectionListResponse",
+        items=(List[projected_todo_response(fields)], ...),
+        total=(int, ...),
+        limit=(int, ...),
+        offset=(int, ...),
+        occurrences=(List[TodoOccurrenceResponse], []),
+    )
+
+
+class BatchGetTodosRequest(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1)
+
+
+class BatchDeleteTodosRequest(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1)
+
+
+class TodoBatchDeleteResponse(BaseModel):
+    deleted: List[str]
+    missing: List[str]
+
+
+class TodoBatchResponse(BaseModel):
+    items: List[TodoResponse]
+    missing: List[str]
+
+
+class TodoChangesResponse(BaseModel):
+    changed: List[TodoResponse]
+    deleted: List[str]
+    next_token: str
+    has_more: bool
+
+
+class NextTodosResponse(BaseModel):
+    items: List[TodoResponse]
+
+
+class TitleSuggestionResponse(BaseModel):
+    id: str
+    title: str
+
+
+class TitleSuggestionsResponse(BaseModel):
+    items: List[TitleSuggestionResponse]
+
+
+class DiagnosticsConfigSchema(BaseModel):
+    enabled: bool
+    slow_query_ms: float = Field(..., ge=0)
+    explain_sample_rate: float = Field(..., ge=0, le=1)
+    n_plus_one_threshold: int = Field(..., ge=2)
+    tracemalloc_enabled: bool
+    tracemalloc_top: int = Field(..., ge=1, le=100)
+
+
+class UpdateDiagnosticsRequest(BaseModel):
+    enabled: Optional[bool] = None
+    slow_query_ms: Optional[float] = Field(None, ge=0)
+    explain_sample_rate: Optional[float] = Field(None, ge=0, le=1)
+    n_plus_one_threshold: Optional[int] = Field(None, ge=2)
+    tracemalloc_enabled: Optional[bool] = None
+    tracemalloc_top: Optional[int] = Field(None, ge=1, le=100)
+
+
+class SlowQueryResponse(BaseModel):
+    sql: str
+    parameter_shape: List[str]
+    duration_ms: float
+    route: str
+    recorded_at: float
+
+
+class QueryPlanResponse(BaseModel):
+    sql: str
+    plan: list
+    recorded_at: float
+
+
+class DiagnosticsResponse(BaseModel):
+    config: DiagnosticsConfigSchema
+    slow_queries: List[SlowQueryResponse]
+    plans: List[QueryPlanResponse]
+
+
+class ConsumerPartitionResponse(BaseModel):
+    end_offset: int
+    committed: Optional[int]
+    lag: int
+    processed: int
+    dead_lettered: int
+
+
+class EventConsumerMetricsResponse(BaseModel):
+    partitions: Dict[int, ConsumerPartitionResponse]
+    lane_depths: List[int]
 
 
 class ErrorResponse(BaseModel):
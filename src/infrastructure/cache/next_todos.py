@@ -0,0 +1,107 @@
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+from application.use_cases.queries.get_next_todos import next_up_key
+from domain.entities.todo import Todo
+from domain.events.todo_events import (
+    TodoCompleted,
+    TodoCreated,
+    TodoDeleted,
+    TodosImported,
+    TodoUpdated,
+)
+
+from .pending_loads import PendingLoads
+
+# Fields that can move a todo into, out of or within the "next up" order.
+ORDER_FIELDS = {"priority", "due_date", "status"}
+
+
+class UserNextTodos:
+    """A user's top `depth` open todos in next-up order"""
+
+    def __init__(self, todos: List[Todo], depth: int):
+        self.todos = sorted(todos, key=next_up_key)
+        # Fewer rows than asked for means this is every open todo the user has.
+        self.exhaustive = len(todos) < depth
+        self.loaded_at = time.monotonic()
+
+    def remove(self, todo_id) -> None:
+        self.todos = [todo for todo in self.todos if todo.id != todo_id]
+
+    def contains(self, todo_id) -> bool:
+        return any(todo.id == todo_id for todo in self.todos)
+
+
+class NextTodosCache:
+    """Per-user top-K of open todos, loaded from the database in one bounded scan.
+
+    Completions and deletes, the common writes from a "next up" view, just
+    drop the todo from the cached run; the entry is reloaded once it no
+    longer holds k todos. Creates and updates that may reorder it invalidate
+    the user, since the events do not carry the todo's fields. Entries expire
+    after ttl_seconds to bound staleness from writes in other workers. A
+    reload that a write's event overtakes is served to its own request but
+    not cached.
+    """
+
+    def __init__(self, depth: int = 50, max_users: int = 1000, ttl_seconds: float = 60):
+        self.depth = depth
+        self.max_users = max_users
+        self.ttl_seconds = ttl_seconds
+        self._users: "OrderedDict[str, UserNextTodos]" = OrderedDict()
+        self._loads = PendingLoads()
+
+    async def find_next(self, read_repository, user_id: str, limit: int) -> List[Todo]:
+        if limit > self.depth:
+            return await read_repository.find_next(user_id, limit)
+
+        entry = self._get(user_id)
+        if entry is None or (len(entry.todos) < limit and not entry.exhaustive):
+            with self._loads.track(user_id) as load:
+                todos = await read_repository.find_next(user_id, self.depth)
+            entry = UserNextTodos(todos, self.depth)
+            if load.stale:
+                return entry.todos[:limit]
+            self._users[user_id] = entry
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+        return entry.todos[:limit]
+
+    def _get(self, user_id: str) -> Optional[UserNextTodos]:
+        entry = self._users.get(user_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.loaded_at > self.ttl_seconds:
+            del self._users[user_id]
+            return None
+        self._users.move_to_end(user_id)
+        return entry
+
+    def invalidate(self, user_id: str) -> None:
+        self._users.pop(user_id, None)
+
+    async def handle_event(self, event) -> None:
+        self._loads.invalidate(event.user_id)
+        entry = self._users.get(event.user_id)
+        if entry is None:
+            return
+        if isinstance(event, (TodoCompleted, TodoDeleted)):
+            entry.remove(event.todo_id)
+        elif isinstance(event, (TodoCreated, TodosImported)):
+            self.invalidate(event.user_id)
+        elif isinstance(event, TodoUpdated):
+            if ORDER_FIELDS.intersection(event.changed_fields) or entry.contains(event.todo_id):
+                self.invalidate(event.user_id)
+
+
+class CachedNextTodos:
+    """Binds the shared cache to a request's read repository"""
+
+    def __init__(self, cache: NextTodosCache, read_repository):
+        self.cache = cache
+        self.read_repository = read_repository
+
+    async def find_next(self, user_id: str, limit: int) -> List[Todo]:
+        return await self.cache.find_next(self.read_repository, user_id, limit)
@@ -0,0 +1,36 @@
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+
+class PendingLoad:
+    def __init__(self):
+        self.stale = False
+
+
+class PendingLoads:
+    """Cache loads in flight, per user, so that a write landing mid-load vetoes storing it.
+
+    A load reads a snapshot that may predate a write whose event arrives
+    before the load finishes; caching that result would serve the old state
+    until the entry expires. Events only arrive after their write commits,
+    so a load that saw no event for its user while in flight is current.
+    """
+
+    def __init__(self):
+        self._loads: Dict[str, List[PendingLoad]] = {}
+
+    @contextmanager
+    def track(self, user_id: str) -> Iterator[PendingLoad]:
+        load = PendingLoad()
+        self._loads.setdefault(user_id, []).append(load)
+        try:
+            yield load
+        finally:
+            loads = self._loads[user_id]
+            loads.remove(load)
+            if not loads:
+                del self._loads[user_id]
+
+    def invalidate(self, user_id: str) -> None:
+        for load in self._loads.get(user_id, ()):
+            load.stale = True
@@ -0,0 +1,126 @@
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from domain.events.todo_events import TodoCreated, TodoDeleted, TodosImported, TodoUpdated
+
+from .pending_loads import PendingLoads
+
+
+class UserTitleIndex:
+    """Sorted (lower(title), title, id) entries; a prefix is a contiguous range"""
+
+    def __init__(self, titles: List[Tuple[str, str]]):
+        self.entries: List[Tuple[str, str, str]] = sorted(
+            (title.lower(), title, todo_id) for todo_id, title in titles
+        )
+        self.by_id: Dict[str, Tuple[str, str, str]] = {
+            entry[2]: entry for entry in self.entries
+        }
+        self.loaded_at = time.monotonic()
+
+    def add(self, todo_id: str, title: str) -> None:
+        self.remove(todo_id)
+        entry = (title.lower(), title, todo_id)
+        insort(self.entries, entry)
+        self.by_id[todo_id] = entry
+
+    def remove(self, todo_id: str) -> None:
+        entry = self.by_id.pop(todo_id, None)
+        if entry is not None:
+            del self.entries[bisect_left(self.entries, entry)]
+
+    def search(self, prefix: str, limit: int) -> List[Tuple[str, str]]:
+        prefix = prefix.lower()
+        matches = []
+        for lowered, title, todo_id in self.entries[bisect_left(self.entries, (prefix,)) :]:
+            if not lowered.startswith(prefix) or len(matches) == limit:
+                break
+            matches.append((todo_id, title))
+        return matches
+
+
+class TitleSuggestionCache:
+    """Per-user prefix indexes of todo titles, warmed on first use.
+
+    Users with more than max_titles todos are never cached and always go to
+    the database prefix index. Entries are kept current by todo events from
+    this process and expire after ttl_seconds to bound staleness from writes
+    handled by other workers. A warm that a write's event overtakes is served
+    to its own request but not cached.
+    """
+
+    def __init__(self, max_users: int = 1000, max_titles: int = 5000, ttl_seconds: float = 300):
+        self.max_users = max_users
+        self.max_titles = max_titles
+        self.ttl_seconds = ttl_seconds
+        self._users: "OrderedDict[str, UserTitleIndex]" = OrderedDict()
+        self._oversized: set = set()
+        self._loads = PendingLoads()
+
+    async def suggest(
+        self, read_repository, user_id: str, prefix: str, limit: int
+    ) -> List[Tuple[str, str]]:
+        index = self._get(user_id)
+        if index is None and user_id not in self._oversized:
+            index = await self._warm(read_repository, user_id)
+        if index is None:
+            return await read_repository.suggest_titles(user_id, prefix, limit)
+        return index.search(prefix, limit)
+
+    def _get(self, user_id: str) -> Optional[UserTitleIndex]:
+        index = self._users.get(user_id)
+        if index is None:
+            return None
+        if time.monotonic() - index.loaded_at > self.ttl_seconds:
+            del self._users[user_id]
+            return None
+        self._users.move_to_end(user_id)
+        return index
+
+    async def _warm(self, read_repository, user_id: str) -> Optional[UserTitleIndex]:
+        with self._loads.track(user_id) as load:
+            titles = await read_repository.find_titles(user_id, self.max_titles + 1)
+        if len(titles) > self.max_titles:
+            if not load.stale:
+                self._oversized.add(user_id)
+            return None
+
+        index = UserTitleIndex(titles)
+        if load.stale:
+            return index
+        self._users[user_id] = index
+        while len(self._users) > self.max_users:
+            self._users.popitem(last=False)
+        return index
+
+    def invalidate(self, user_id: str) -> None:
+        self._users.pop(user_id, None)
+        self._oversized.discard(user_id)
+
+    async def handle_event(self, event) -> None:
+        self._loads.invalidate(event.user_id)
+        index = self._users.get(event.user_id)
+        if isinstance(event, TodoCreated):
+            if index is not None:
+                index.add(str(event.todo_id), event.title)
+        elif isinstance(event, TodoUpdated):
+            if "title" in event.changed_fields:
+                self.invalidate(event.user_id)
+        elif isinstance(event, TodoDeleted):
+            if index is not None:
+                index.remove(str(event.todo_id))
+        elif isinstance(event, TodosImported):
+            self.invalidate(event.user_id)
+
+
+class CachedTitleSuggestions:
+    """Binds the shared cache to a request's read repository"""
+
+    def __init__(self, cache: TitleSuggestionCache, read_repository):
+        self.cache = cache
+        self.read_repository = read_repository
+
+    async def suggest(self, user_id: str, prefix: str, limit: int) -> List[Tuple[str, str]]:
+        return await self.cache.suggest(self.read_repository, user_id, prefix, limit)
@@ -0,0 +1,122 @@
+from datetime import timedelta
+from functools import cached_property, lru_cache
+from typing import Optional
+
+from config.settings import Settings, get_settings
+
+from .cache.next_todos import NextTodosCache
+from .cache.title_suggestions import TitleSuggestionCache
+from .diagnostics import DiagnosticsConfig, QueryDiagnostics
+from .events.broker import BrokerEventBus, InProcessBroker
+from .events.change_feed import ChangeFeed
+from .events.event_bus import InMemoryEventBus
+from .persistence.memory.read_repositories import InMemoryTodoReadRepository
+from .persistence.memory.store import InMemoryTodoStore
+from .persistence.sqlalchemy.database import ReadSession, async_session_maker
+from .persistence.sqlalchemy.group_commit import WriteCoalescer
+from .persistence.sqlalchemy.read_repositories import TodoReadRepository
+from .persistence.sqlalchemy.unit_of_work import SQLAlchemyUnitOfWork
+from .reminders.scheduler import ReminderScheduler
+
+
+class Container:
+    """Stateless and shared objects that live for the whole app.
+
+    Everything here is built on first use and then reused by every request,
+    so per-request dependency resolution only creates the handler and its
+    unit of work or read session, neither of which touches the database
+    until a statement runs.
+    """
+
+    def __init__(self, settings: Settings, session_factory=async_session_maker):
+        self.settings = settings
+        self.session_factory = session_factory
+
+    @cached_property
+    def event_bus(self) -> InMemoryEventBus:
+        return InMemoryEventBus()
+
+    @cached_property
+    def broker_event_bus(self) -> Optional[BrokerEventBus]:
+        if not self.settings.event_consumer_enabled:
+            return None
+        return BrokerEventBus(InProcessBroker(partitions=self.settings.consumer_partitions))
+
+    @cached_property
+    def change_feed(self) -> ChangeFeed:
+        return ChangeFeed(buffer_size=self.settings.change_feed_buffer_size)
+
+    @cached_property
+    def query_diagnostics(self) -> QueryDiagnostics:
+        settings = self.settings
+        config = DiagnosticsConfig(
+            enabled=settings.diagnostics_enabled,
+            slow_query_ms=settings.diagnostics_slow_query_ms,
+            explain_sample_rate=settings.diagnostics_explain_sample_rate,
+            n_plus_one_threshold=settings.diagnostics_n_plus_one_threshold,
+            tracemalloc_enabled=settings.diagnostics_tracemalloc_enabled,
+            tracemalloc_top=settings.diagnostics_tracemalloc_top,
+        )
+        return QueryDiagnostics(config, history_size=settings.diagnostics_history_size)
+
+    @cached_property
+    def title_suggestion_cache(self) -> TitleSuggestionCache:
+        return TitleSuggestionCache(
+            max_users=self.settings.suggest_cache_max_users,
+            max_titles=self.settings.suggest_cache_max_titles,
+            ttl_seconds=self.settings.suggest_cache_ttl_seconds,
+        )
+
+    @cached_property
+    def next_todos_cache(self) -> Optional[NextTodosCache]:
+        if not self.settings.next_todos_cache_enabled:
+            return None
+        return NextTodosCache(
+            depth=self.settings.next_todos_max_k,
+            max_users=self.settings.next_todos_cache_max_users,
+            ttl_seconds=self.settings.next_todos_cache_ttl_seconds,
+        )
+
+    @cached_property
+    def write_coalescer(self) -> Optional[WriteCoalescer]:
+        settings = self.settings
+        if not settings.write_coalescing_enabled or settings.persistence_backend != "sqlalchemy":
+            return None
+        return WriteCoalescer(
+            self.session_factory,
+            self.event_bus,
+            window_seconds=settings.write_coalescing_window_ms / 1000,
+            max_batch_size=settings.write_coalescing_max_batch,
+        )
+
+    @cached_property
+    def todo_store(self) -> InMemoryTodoStore:
+        return InMemoryTodoStore()
+
+    @cached_property
+    def reminder_scheduler(self) -> ReminderScheduler:
+        settings = self.settings
+        if settings.persistence_backend == "memory":
+            todos = InMemoryTodoReadRepository(self.todo_store)
+        else:
+            # App-scoped, so it must not pin one snapshot for its lifetime.
+            todos = TodoReadRepository(ReadSession(self.session_factory, per_statement=True))
+        return ReminderScheduler(
+            todos,
+            self.event_bus,
+            lead_time=timedelta(minutes=settings.reminder_lead_minutes),
+            window=timedelta(minutes=settings.reminder_window_minutes),
+            tick_seconds=settings.reminder_tick_seconds,
+            max_loaded=settings.reminder_max_loaded,
+        )
+
+    def unit_of_work(self) -> SQLAlchemyUnitOfWork:
+        return SQLAlchemyUnitOfWork(self.session_factory)
+
+    def read_session(self) -> ReadSession:
+        return ReadSession(self.session_factory)
+
+
+@lru_cache()
+def get_container() -> Container:
+    return Container(get_settings())
@@ -0,0 +1,167 @@
+import logging
+import random
+import time
+import tracemalloc
+from collections import Counter, deque
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Deque, Dict, List, Optional
+
+logger = logging.getLogger("todo.diagnostics")
+
+
+@dataclass
+class DiagnosticsConfig:
+    """Runtime-adjustable switches; changed through the diagnostics endpoint"""
+
+    enabled: bool = False
+    slow_query_ms: float = 200.0
+    explain_sample_rate: float = 0.1
+    n_plus_one_threshold: int = 5
+    tracemalloc_enabled: bool = False
+    tracemalloc_top: int = 10
+
+
+@dataclass
+class SlowQuery:
+    sql: str
+    parameter_shape: List[str]
+    duration_ms: float
+    route: str
+    recorded_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class RequestDiagnostics:
+    """Statements seen while serving one request"""
+
+    scope: dict
+    statements: Counter = field(default_factory=Counter)
+    snapshot: Optional[tracemalloc.Snapshot] = None
+
+    @property
+    def route(self) -> str:
+        # FastAPI stores the matched route in the scope once routing is done.
+        route = self.scope.get("route")
+        path = getattr(route, "path", None) or self.scope.get("path", "")
+        return f"{self.scope.get('method', '')} {path}".strip()
+
+
+current_request: ContextVar[Optional[RequestDiagnostics]] = ContextVar(
+    "current_request_diagnostics", default=None
+)
+
+
+def parameter_shape(parameters) -> List[str]:
+    """Types (and sequence lengths) of bound parameters, never their values"""
+    if parameters is None:
+        return []
+    if isinstance(parameters, dict):
+        parameters = parameters.values()
+    shape = []
+    for value in parameters:
+        if isinstance(value, (list, tuple)):
+            shape.append(f"{type(value).__name__}[{len(value)}]")
+        else:
+            shape.append(type(value).__name__)
+    return shape
+
+
+class QueryDiagnostics:
+    """Slow-query log, sampled EXPLAIN plans and per-request N+1 detection.
+
+    Statement hooks are installed once and check `config.enabled` on every
+    call, so everything can be switched on and off at runtime. Only the
+    most recent `history_size` slow queries and one plan per statement
+    shape are kept.
+    """
+
+    def __init__(self, config: DiagnosticsConfig, history_size: int = 100):
+        self.config = config
+        self.slow_queries: Deque[SlowQuery] = deque(maxlen=history_size)
+        self.plans: Dict[str, dict] = {}
+        self.history_size = history_size
+
+    def record(self, statement: str, parameters, duration_ms: float) -> bool:
+        """Account one executed statement; True if it should be EXPLAINed"""
+        request = current_request.get()
+        if request is not None:
+            request.statements[statement] += 1
+
+        if duration_ms < self.config.slow_query_ms:
+            return False
+
+        entry = SlowQuery(
+            sql=statement,
+            parameter_shape=parameter_shape(parameters),
+            duration_ms=round(duration_ms, 2),
+            route=request.route if request is not None else "",
+        )
+        self.slow_queries.append(entry)
+        logger.warning(
+            "Slow query %.1f ms on %s: %s params=%s",
+            duration_ms,
+            entry.route or "<no request>",
+            statement,
+            entry.parameter_shape,
+        )
+        return self._should_explain(statement)
+
+    def _should_explain(self, statement: str) -> bool:
+        if statement in self.plans or not statement.lstrip().upper().startswith("SELECT"):
+            return False
+        return random.random() < self.config.explain_sample_rate
+
+    def record_plan(self, statement: str, plan) -> None:
+        if len(self.plans) >= self.history_size:
+            self.plans.pop(next(iter(self.plans)))
+        self.plans[statement] = {"plan": plan, "recorded_at": time.time()}
+
+    def start_request(self, scope: dict) -> Optional[RequestDiagnostics]:
+        if not self.config.enabled:
+            return None
+        request = RequestDiagnostics(scope=scope)
+        if self.config.tracemalloc_enabled:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            request.snapshot = tracemalloc.take_snapshot()
+        return request
+
+    def finish_request(self, request: RequestDiagnostics) -> None:
+        repeated = {
+            statement: count
+            for statement, count in request.statements.items()
+            if count >= self.config.n_plus_one_threshold
+        }
+        for statement, count in repeated.items():
+            logger.warning(
+                "Possible N+1 on %s: statement ran %d times: %s",
+                request.route,
+                count,
+                statement,
+            )
+
+        if request.snapshot is not None and tracemalloc.is_tracing():
+            # Process-wide: allocations of concurrent requests show up too.
+            stats = tracemalloc.take_snapshot().compare_to(request.snapshot, "lineno")
+            top = stats[: self.config.tracemalloc_top]
+            logger.info(
+                "Allocations during %s:\n%s",
+                request.route,
+                "\n".join(str(stat) for stat in top),
+            )
+
+    def update(self, **changes) -> DiagnosticsConfig:
+        for name, value in changes.items():
+            setattr(self.config, name, value)
+        if not (self.config.enabled and self.config.tracemalloc_enabled):
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+        return self.config
+
+    def report(self) -> dict:
+        return {
+            "config": asdict(self.config),
+            "slow_queries": [asdict(entry) for entry in reversed(self.slow_queries)],
+            "plans": [{"sql": sql, **plan} for sql, plan in self.plans.items()],
+        }
@@ -0,0 +1,145 @@
+import asyncio
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Type
+
+from application.interfaces.event_bus import EventBus, EventHandler
+from domain.events.base import DomainEvent
+
+from .event_bus import InMemoryEventBus
+
+
+def partition_key(event: DomainEvent) -> str:
+    return getattr(event, "user_id", "") or ""
+
+
+def stable_hash(key: str) -> int:
+    return zlib.crc32(key.encode("utf-8"))
+
+
+@dataclass
+class Message:
+    partition: int
+    offset: int
+    key: str
+    event: DomainEvent
+    attempts: int = 0
+
+
+@dataclass
+class DeadLetter:
+    message: Message
+    error: str
+
+
+class BrokerAdapter(ABC):
+    """What the consumer runtime needs from a partitioned log broker"""
+
+    @abstractmethod
+    async def publish(self, key: str, event: DomainEvent) -> None:
+        pass
+
+    @abstractmethod
+    async def fetch(self, max_messages: int, timeout: float) -> List[Message]:
+        pass
+
+    @abstractmethod
+    async def commit(self, offsets: Dict[int, int]) -> None:
+        """Record, per partition, the next offset the group has to process"""
+        pass
+
+    @abstractmethod
+    async def dead_letter(self, message: Message, error: str) -> None:
+        pass
+
+    @abstractmethod
+    async def end_offsets(self) -> Dict[int, int]:
+        pass
+
+
+class InProcessBroker(BrokerAdapter):
+    """Partitioned in-memory log for tests and single-process deployments"""
+
+    def __init__(self, partitions: int = 8):
+        self.partitions = partitions
+        self._logs: List[List[Message]] = [[] for _ in range(partitions)]
+        self._base: List[int] = [0] * partitions
+        self._positions: List[int] = [0] * partitions
+        self._committed: List[int] = [0] * partitions
+        self._available = asyncio.Event()
+        self._next_partition = 0
+        self.dead_letters: List[DeadLetter] = []
+
+    async def publish(self, key: str, event: DomainEvent) -> None:
+        partition = stable_hash(key) % self.partitions
+        offset = self._base[partition] + len(self._logs[partition])
+        self._logs[partition].append(Message(partition, offset, key, event))
+        self._available.set()
+
+    async def fetch(self, max_messages: int, timeout: float) -> List[Message]:
+        messages = self._take(max_messages)
+        if messages:
+            return messages
+
+        self._available.clear()
+        try:
+            await asyncio.wait_for(self._available.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        return self._take(max_messages)
+
+    def _take(self, max_messages: int) -> List[Message]:
+        messages: List[Message] = []
+        # Round-robin over partitions so one busy partition can't starve the rest.
+        for step in range(self.partitions):
+            partition = (self._next_partition + step) % self.partitions
+            log = self._logs[partition]
+            start = self._positions[partition] - self._base[partition]
+            taken = log[start : start + max_messages - len(messages)]
+            self._positions[partition] += len(taken)
+            messages.extend(taken)
+            if len(messages) >= max_messages:
+                break
+        self._next_partition = (self._next_partition + 1) % self.partitions
+        return messages
+
+    async def commit(self, offsets: Dict[int, int]) -> None:
+        for partition, offset in offsets.items():
+            if offset <= self._committed[partition]:
+                continue
+            self._committed[partition] = offset
+            del self._logs[partition][: offset - self._base[partition]]
+            self._base[partition] = offset
+
+    async def dead_letter(self, message: Message, error: str) -> None:
+        self.dead_letters.append(DeadLetter(message, error))
+
+    async def end_offsets(self) -> Dict[int, int]:
+        return {
+            partition: self._base[partition] + len(self._logs[partition])
+            for partition in range(self.partitions)
+        }
+
+    def committed_offsets(self) -> Dict[int, int]:
+        return dict(enumerate(self._committed))
+
+
+class BrokerEventBus(EventBus):
+    """Publishes domain events to a broker, keyed by user, instead of in-process.
+
+    Handlers subscribed here are registered on `dispatcher`, the bus a
+    PartitionedConsumer reading the same broker delivers to, so they run
+    when the consumer gets to the event rather than inside publish().
+    """
+
+    def __init__(self, broker: BrokerAdapter, dispatcher: Optional[InMemoryEventBus] = None):
+        self.broker = broker
+        self.dispatcher = dispatcher if dispatcher is not None else InMemoryEventBus()
+
+    async def publish(self, event: DomainEvent) -> None:
+        await self.broker.publish(partition_key(event), event)
+
+    def subscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
+        self.dispatcher.subscribe(event_type, handler)
+
@@ -0,0 +1,130 @@
+import asyncio
+import json
+from dataclasses import fields
+from datetime import datetime
+from typing import AsyncIterator, Dict, Optional, Set
+
+from domain.events.base import DomainEvent
+from domain.events.todo_events import (
+    TodoCompleted,
+    TodoCreated,
+    TodoDeleted,
+    TodosImported,
+    TodoUpdated,
+)
+from domain.value_objects.todo_id import TodoId
+
+EVENT_NAMES = {
+    TodoCreated: "todo.created",
+    TodoUpdated: "todo.updated",
+    TodoCompleted: "todo.completed",
+    TodoDeleted: "todo.deleted",
+    TodosImported: "todos.imported",
+}
+
+_CLOSED = object()
+
+
+def serialize_event(event: DomainEvent) -> dict:
+    data = {}
+    for field in fields(event):
+        if field.name == "metadata":
+            continue
+        value = getattr(event, field.name)
+        if isinstance(value, TodoId):
+            value = str(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        data[field.name] = value
+    return {
+        "id": event.event_id,
+        "event": EVENT_NAMES[type(event)],
+        "data": json.dumps(data),
+    }
+
+
+class Subscription:
+    """One connected client: a bounded buffer of serialized events.
+
+    A subscriber that lets its buffer fill up is disconnected rather than
+    allowed to hold back publishers or grow without bound; clients are
+    expected to reconnect and resync.
+    """
+
+    def __init__(self, user_id: str, buffer_size: int):
+        self.user_id = user_id
+        self.overflowed = False
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+
+    def offer(self, payload: dict) -> None:
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self.close()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        while True:
+            try:
+                self._queue.put_nowait(_CLOSED)
+                return
+            except asyncio.QueueFull:
+                self._queue.get_nowait()
+
+    async def events(self, heartbeat_interval: float) -> AsyncIterator[Optional[dict]]:
+        """Yield payloads, or None when nothing arrived within the heartbeat interval"""
+        while True:
+            try:
+                payload = await asyncio.wait_for(
+                    self._queue.get(), timeout=heartbeat_interval
+                )
+            except asyncio.TimeoutError:
+                if self.closed:
+                    return
+                yield None
+                continue
+            if payload is _CLOSED:
+                return
+            yield payload
+
+
+class ChangeFeed:
+    """Fans todo domain events out to the subscriptions of their user"""
+
+    def __init__(self, buffer_size: int = 100):
+        self.buffer_size = buffer_size
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+
+    def subscribe(self, user_id: str) -> Subscription:
+        subscription = Subscription(user_id, self.buffer_size)
+        self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscription.close()
+        subscribers = self._subscribers.get(subscription.user_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.user_id]
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    async def handle_event(self, event: DomainEvent) -> None:
+        subscribers = self._subscribers.get(event.user_id)
+        if not subscribers:
+            return
+        payload = serialize_event(event)
+        for subscription in list(subscribers):
+            subscription.offer(payload)
+            if subscription.overflowed:
+                self.unsubscribe(subscription)
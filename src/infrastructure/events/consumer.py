@@ -0,0 +1,191 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from application.interfaces.event_bus import EventHandler
+
+from .broker import BrokerAdapter, Message, stable_hash
+from .event_bus import InMemoryEventBus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PartitionProgress:
+    """Completed offsets of one broker partition and its committable watermark"""
+
+    next_offset: int
+    committed: int
+    done: Set[int] = field(default_factory=set)
+    processed: int = 0
+    failed: int = 0
+
+    def complete(self, offset: int) -> None:
+        self.done.add(offset)
+        while self.next_offset in self.done:
+            self.done.remove(self.next_offset)
+            self.next_offset += 1
+
+
+class PartitionedConsumer:
+    """Consumes broker messages with per-user ordering and cross-user parallelism.
+
+    Messages are routed to one of `concurrency` lanes by a stable hash of
+    their key (the user id). A lane handles its messages one at a time, so a
+    user's events are applied in publish order, while different lanes run
+    concurrently. Offsets are committed in batches, and only up to the
+    lowest offset not yet finished in each partition, so a crash replays
+    unfinished work rather than skipping it. Each handler of an event is
+    retried on its own, so a failure never re-runs handlers that succeeded.
+    """
+
+    def __init__(
+        self,
+        broker: BrokerAdapter,
+        dispatcher: InMemoryEventBus,
+        concurrency: int = 16,
+        fetch_batch_size: int = 100,
+        lane_buffer_size: int = 1000,
+        ack_batch_size: int = 100,
+        ack_interval_seconds: float = 1.0,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.5,
+    ):
+        self.broker = broker
+        self.dispatcher = dispatcher
+        self.concurrency = concurrency
+        self.fetch_batch_size = fetch_batch_size
+        self.ack_batch_size = ack_batch_size
+        self.ack_interval_seconds = ack_interval_seconds
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+
+        self._lanes: List[asyncio.Queue] = [
+            asyncio.Queue(maxsize=lane_buffer_size) for _ in range(concurrency)
+        ]
+        self._progress: Dict[int, PartitionProgress] = {}
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+        self._stopping = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._run_lane(lane)) for lane in self._lanes
+        ]
+        self._tasks.append(asyncio.create_task(self._run_fetcher()))
+
+    async def stop(self, drain_timeout: float = 10.0) -> None:
+        self._stopping.set()
+        fetcher, lanes = self._tasks[-1], self._tasks[:-1]
+        await fetcher
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(lane.join() for lane in self._lanes)), drain_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Consumer stopped with unprocessed messages")
+        for task in lanes:
+            task.cancel()
+        await asyncio.gather(*lanes, return_exceptions=True)
+        await self._commit()
+
+    async def _run_fetcher(self) -> None:
+        while not self._stopping.is_set():
+            messages = await self.broker.fetch(
+                self.fetch_batch_size, timeout=self.ack_interval_seconds
+            )
+            for message in messages:
+                if message.partition not in self._progress:
+                    self._progress[message.partition] = PartitionProgress(
+                        next_offset=message.offset, committed=message.offset
+                    )
+                lane = self._lanes[stable_hash(message.key) % self.concurrency]
+                await lane.put(message)
+
+            if self._should_commit():
+                await self._commit()
+
+    async def _run_lane(self, lane: asyncio.Queue) -> None:
+        while True:
+            message = await lane.get()
+            try:
+                await self._process(message)
+            finally:
+                lane.task_done()
+
+    async def _process(self, message: Message) -> None:
+        progress = self._progress[message.partition]
+        for handler in self.dispatcher.handlers_for(type(message.event)):
+            await self._run_handler(message, handler, progress)
+
+        progress.processed += 1
+        progress.complete(message.offset)
+        self._uncommitted += 1
+
+    async def _run_handler(
+        self, message: Message, handler: EventHandler, progress: PartitionProgress
+    ) -> None:
+        attempts = 0
+        while True:
+            attempts += 1
+            message.attempts += 1
+            try:
+                await handler(message.event)
+                return
+            except Exception as exc:
+                name = getattr(handler, "__qualname__", repr(handler))
+                if attempts > self.max_retries:
+                    progress.failed += 1
+                    logger.exception(
+                        "Dead-lettering %s for %s after %d attempts",
+                        type(message.event).__name__,
+                        name,
+                        attempts,
+                    )
+                    await self.broker.dead_letter(message, f"{name}: {exc!r}")
+                    return
+                await asyncio.sleep(self.retry_backoff_seconds * 2 ** (attempts - 1))
+
+    def _should_commit(self) -> bool:
+        if not self._uncommitted:
+            return False
+        return (
+            self._uncommitted >= self.ack_batch_size
+            or time.monotonic() - self._last_commit >= self.ack_interval_seconds
+        )
+
+    async def _commit(self) -> None:
+        offsets = {
+            partition: progress.next_offset
+            for partition, progress in self._progress.items()
+            if progress.next_offset > progress.committed
+        }
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+        if not offsets:
+            return
+        await self.broker.commit(offsets)
+        for partition, offset in offsets.items():
+            self._progress[partition].committed = offset
+
+    async def metrics(self) -> dict:
+        """Per-partition lag (end offset minus committed offset) and lane depths"""
+        end_offsets = await self.broker.end_offsets()
+        partitions = {}
+        for partition, end_offset in end_offsets.items():
+            progress: Optional[PartitionProgress] = self._progress.get(partition)
+            committed = progress.committed if progress else None
+            partitions[partition] = {
+                "end_offset": end_offset,
+                "committed": committed,
+                "lag": end_offset - committed if committed is not None else end_offset,
+                "processed": progress.processed if progress else 0,
+                "dead_lettered": progress.failed if progress else 0,
+            }
+        return {
+            "partitions": partitions,
+            "lane_depths": [lane.qsize() for lane in self._lanes],
+        }
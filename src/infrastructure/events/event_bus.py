@@ -13,8 +13,9 @@ class InMemoryEventBus(EventBus):
             self._handlers[event_type] = []
         self._handlers[event_type].append(handler)
 
+    def handlers_for(self, event_type: Type[DomainEvent]) -> List[EventHandler]:
+        return list(self._handlers.get(event_type, ()))
+
     async def publish(self, event: DomainEvent) -> None:
-        event_type = type(event)
-        if event_type in self._handlers:
-            for handler in self._handlers[event_type]:
-                await handler(event)
+        for handler in self.handlers_for(type(event)):
+            await handler(event)
@@ -1,5 +1,23 @@
-from domain.events.todo_events import TodoCompleted, TodoCreated
-from ..api.v1.dependencies import get_event_bus
+from domain.events.todo_events import (
+    TodoCompleted,
+    TodoCreated,
+    TodoDeleted,
+    TodoDueSoon,
+    TodoOverdue,
+    TodosImported,
+    TodoUpdated,
+)
+from config.settings import get_settings
+from ..api.v1.dependencies import (
+    get_broker_event_bus,
+    get_change_feed,
+    get_event_bus,
+    get_next_todos_cache,
+    get_reminder_scheduler,
+    get_title_suggestion_cache,
+)
+from .broker import BrokerEventBus
+from .consumer import PartitionedConsumer
 
 
 async def handle_todo_created(event: TodoCreated):
@@ -12,7 +30,75 @@ async def handle_todo_completed(event: TodoCompleted):
     print(f"Todo {event.todo_id} completed by {event.user_id}")
 
 
+async def handle_todo_due_soon(event: TodoDueSoon):
+    """Remind the user that a todo is coming due"""
+    print(f"Todo {event.todo_id} of {event.user_id} is due at {event.due_date}")
+
+
+async def handle_todo_overdue(event: TodoOverdue):
+    """Tell the user that a todo is now overdue"""
+    print(f"Todo {event.todo_id} of {event.user_id} is overdue")
+
+
 def register_event_handlers():
     event_bus = get_event_bus()
-    event_bus.subscribe(TodoCreated, handle_todo_created)
-    event_bus.subscribe(TodoCompleted, handle_todo_completed)
+
+    # Notifications go through the broker when the consumer is enabled; the
+    # caches, change feed and scheduler below hold this worker's state and
+    # always stay on the in-process bus.
+    notifications = get_broker_event_bus() or event_bus
+    notifications.subscribe(TodoCreated, handle_todo_created)
+    notifications.subscribe(TodoCompleted, handle_todo_completed)
+
+    change_feed = get_change_feed()
+    for event_type in (TodoCreated, TodoUpdated, TodoCompleted, TodoDeleted, TodosImported):
+        event_bus.subscribe(event_type, change_feed.handle_event)
+
+    title_cache = get_title_suggestion_cache()
+    for event_type in (TodoCreated, TodoUpdated, TodoDeleted, TodosImported):
+        event_bus.subscribe(event_type, title_cache.handle_event)
+
+    next_todos_cache = get_next_todos_cache()
+    if next_todos_cache is not None:
+        for event_type in (
+            TodoCreated,
+            TodoUpdated,
+            TodoCompleted,
+            TodoDeleted,
+            TodosImported,
+        ):
+            event_bus.subscribe(event_type, next_todos_cache.handle_event)
+
+    if get_settings().reminders_enabled:
+        notifications.subscribe(TodoDueSoon, handle_todo_due_soon)
+        notifications.subscribe(TodoOverdue, handle_todo_overdue)
+        reminder_scheduler = get_reminder_scheduler()
+        for event_type in (
+            TodoCreated,
+            TodoUpdated,
+            TodoCompleted,
+            TodoDeleted,
+            TodosImported,
+        ):
+            event_bus.subscribe(event_type, reminder_scheduler.handle_event)
+
+    if notifications is not event_bus:
+        for event_type in (TodoCreated, TodoCompleted, TodoDueSoon, TodoOverdue):
+            event_bus.subscribe(event_type, notifications.publish)
+
+
+def build_event_consumer(bus: BrokerEventBus) -> PartitionedConsumer:
+    """Consumer that runs the handlers subscribed on `bus` for events read from its broker"""
+    settings = get_settings()
+
+    return PartitionedConsumer(
+        bus.broker,
+        bus.dispatcher,
+        concurrency=settings.consumer_concurrency,
+        fetch_batch_size=settings.consumer_fetch_batch_size,
+        lane_buffer_size=settings.consumer_lane_buffer_size,
+        ack_batch_size=settings.consumer_ack_batch_size,
+        ack_interval_seconds=settings.consumer_ack_interval_seconds,
+        max_retries=settings.consumer_max_retries,
+        retry_backoff_seconds=settings.consumer_retry_backoff_seconds,
+    )
@@ -0,0 +1,32 @@
+from typing import Dict, List, Optional
+
+from domain.entities.todo import Todo
+from domain.value_objects.todo_id import TodoId
+
+from .store import InMemoryTodoStore
+
+
+class InMemoryTodoImporter:
+    """Bulk importer over the in-memory store; existing ids are skipped"""
+
+    def __init__(self, store: InMemoryTodoStore):
+        self.store = store
+        self._staged: Dict[TodoId, Optional[Todo]] = {}
+
+    async def __aenter__(self):
+        self._staged = {}
+        return self
+
+    async def stage(self, todos: List[Todo]) -> None:
+        for todo in todos:
+            if todo.id not in self.store.todos:
+                self._staged.setdefault(todo.id, todo)
+
+    async def commit(self) -> int:
+        imported = len(self._staged)
+        self.store.apply(self._staged)
+        self._staged = {}
+        return imported
+
+    async def __aexit__(self, *args):
+        self._staged = {}
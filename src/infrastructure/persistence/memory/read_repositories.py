@@ -0,0 +1,437 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from application.use_cases.queries.get_analytics import DURATION_BUCKETS, duration_bucket
+from application.use_cases.queries.get_next_todos import next_up_key
+from domain.entities.project import Project
+from domain.entities.todo import Todo
+from domain.entities.todo_history import TodoSnapshot, TodoVersion
+from domain.value_objects.priority import Priority
+from domain.value_objects.project_id import ProjectId
+from domain.value_objects.todo_id import TodoId
+from domain.value_objects.todo_status import TodoStatus
+
+from .store import InMemoryTodoStore, UserIndex, copy_todo
+
+
+def _to_projection(todo: Todo, fields: List[str]) -> dict:
+    values = {
+        "id": lambda: str(todo.id),
+        "title": lambda: todo.title,
+        "description": lambda: todo.description,
+        "status": lambda: todo.status.value,
+        "priority": lambda: int(todo.priority),
+        "created_at": lambda: todo.created_at,
+        "updated_at": lambda: todo.updated_at,
+        "completed_at": lambda: todo.completed_at,
+        "due_date": lambda: todo.due_date,
+        "tags": lambda: list(todo.tags),
+        "is_overdue": todo.is_overdue,
+        "recurrence": lambda: str(todo.recurrence) if todo.recurrence else None,
+        "parent_id": lambda: str(todo.parent_id) if todo.parent_id else None,
+        "project_id": lambda: str(todo.project_id) if todo.project_id else None,
+    }
+    return {field: values[field]() for field in fields}
+
+
+class InMemoryTodoReadRepository:
+    """Query side over the committed in-memory store.
+
+    Filters are answered from the per-user bitmaps and ordering from the
+    per-field sorted lists, so a page costs roughly offset + limit steps
+    rather than a scan of every todo; only free-text search scans, and only
+    the candidates left after the other filters.
+    """
+
+    def __init__(self, store: InMemoryTodoStore):
+        self.store = store
+
+    async def find_by_id(self, todo_id: TodoId, user_id: str) -> Optional[Todo]:
+        todo = self.store.todos.get(todo_id)
+        if todo is None or todo.user_id != user_id:
+            return None
+        return copy_todo(todo)
+
+    async def find_by_ids(self, todo_ids: List[TodoId], user_id: str) -> List[Todo]:
+        todos = []
+        for todo_id in todo_ids:
+            todo = await self.find_by_id(todo_id, user_id)
+            if todo is not None:
+                todos.append(todo)
+        return todos
+
+    async def find_fields_by_id(
+        self, todo_id: TodoId, user_id: str, fields: List[str]
+    ) -> Optional[dict]:
+        todo = self.store.todos.get(todo_id)
+        if todo is None or todo.user_id != user_id:
+            return None
+        return _to_projection(todo, fields)
+
+    async def find_with_filters(
+        self,
+        user_id: str,
+        status: Optional[TodoStatus],
+        priority: Optional[Priority],
+        tags: Optional[List[str]],
+        search: Optional[str],
+        sort_by: str,
+        sort_order: str,
+        limit: int,
+        offset: int,
+        ids: Optional[List[str]] = None,
+        project_id: Optional[str] = None,
+    ) -> Tuple[List[Todo], int]:
+        todos, total = self._query(
+            user_id,
+            status,
+            priority,
+            tags,
+            search,
+            sort_by,
+            sort_order,
+            limit,
+            offset,
+            ids,
+            project_id,
+        )
+        return [copy_todo(todo) for todo in todos], total
+
+    async def find_fields_with_filters(
+        self,
+        fields: List[str],
+        user_id: str,
+        status: Optional[TodoStatus],
+        priority: Optional[Priority],
+        tags: Optional[List[str]],
+        search: Optional[str],
+        sort_by: str,
+        sort_order: str,
+        limit: int,
+        offset: int,
+        ids: Optional[List[str]] = None,
+        project_id: Optional[str] = None,
+    ) -> Tuple[List[dict], int]:
+        todos, total = self._query(
+            user_id,
+            status,
+            priority,
+            tags,
+            search,
+            sort_by,
+            sort_order,
+            limit,
+            offset,
+            ids,
+            project_id,
+        )
+        return [_to_projection(todo, fields) for todo in todos], total
+
+    async def find_changes_since(
+        self, user_id: str, since: Tuple[int, int], limit: int
+    ) -> Tuple[List[Tuple[Tuple[int, int], Todo]], List[Tuple[Tuple[int, int], str]]]:
+        # Changes are applied a whole commit at a time, so the store's
+        # sequence is already in commit order and stands in for both halves
+        # of the (transaction, sequence) position the Postgres backend uses.
+        todos, tombstones = self.store.changes_since(user_id, since[1], limit)
+        return (
+            [((seq, seq), todo) for seq, todo in todos],
+            [((seq, seq), todo_id) for seq, todo_id in tombstones],
+        )
+
+    async def find_titles(self, user_id: str, limit: int) -> List[Tuple[str, str]]:
+        index = self.store.users.get(user_id)
+        if index is None:
+            return []
+        titles = [
+            (str(todo_id), index.todos[slot].title)
+            for todo_id, slot in index.slots.items()
+        ]
+        return titles[:limit]
+
+    async def suggest_titles(
+        self, user_id: str, prefix: str, limit: int
+    ) -> List[Tuple[str, str]]:
+        titles = await self.find_titles(user_id, len(self.store.todos))
+        prefix = prefix.lower()
+        matches = sorted(
+            (title.lower(), todo_id, title)
+            for todo_id, title in titles
+            if title.lower().startswith(prefix)
+        )
+        return [(todo_id, title) for _, todo_id, title in matches[:limit]]
+
+    async def find_next(self, user_id: str, limit: int) -> List[Todo]:
+        index = self.store.users.get(user_id)
+        if index is None:
+            return []
+        open_mask = index.by_status.get(TodoStatus.PENDING.value, 0) | index.by_status.get(
+            TodoStatus.IN_PROGRESS.value, 0
+        )
+        todos = heapq.nsmallest(
+            limit, (index.todos[slot] for slot in _slots(open_mask)), key=next_up_key
+        )
+        return [copy_todo(todo) for todo in todos]
+
+    async def find_recurring(self, user_id: str) -> List[Todo]:
+        index = self.store.users.get(user_id)
+        if index is None:
+            return []
+        closed = index.by_status.get(TodoStatus.COMPLETED.value, 0) | index.by_status.get(
+            TodoStatus.CANCELLED.value, 0
+        )
+        return [copy_todo(index.todos[slot]) for slot in _slots(index.recurring & ~closed)]
+
+    async def find_due_between(
+        self, start: datetime, end: datetime, limit: int
+    ) -> List[Todo]:
+        closed = (TodoStatus.COMPLETED.value, TodoStatus.CANCELLED.value)
+        due = []
+        for index in self.store.users.values():
+            entries = index.sorted["due_date"]
+            low = bisect_left(entries, ((0, start),))
+            high = bisect_left(entries, ((0, end),))
+            due.extend(
+                todo
+                for todo in (index.todos[slot] for _, slot in entries[low:high])
+                if todo.status.value not in closed
+            )
+        todos = heapq.nsmallest(limit, due, key=lambda todo: todo.due_date)
+        return [copy_todo(todo) for todo in todos]
+
+    async def find_subtree(self, todo_id: TodoId, user_id: str) -> List[Todo]:
+        index = self.store.users.get(user_id)
+        root = index.todos[index.slots[todo_id]] if index and todo_id in index.slots else None
+        if root is None:
+            return []
+        return [copy_todo(todo) for todo in self._descendants(index, root.path, True)]
+
+    async def count_subtrees(
+        self, todo_ids: List[TodoId], user_id: str
+    ) -> Dict[TodoId, Tuple[int, int]]:
+        index = self.store.users.get(user_id)
+        counts = {}
+        for todo_id in todo_ids:
+            if index is None or todo_id not in index.slots:
+                continue
+            root = index.todos[index.slots[todo_id]]
+            descendants = list(self._descendants(index, root.path, False))
+            done = sum(todo.status == TodoStatus.COMPLETED for todo in descendants)
+            counts[todo_id] = (done, len(descendants))
+        return counts
+
+    def _descendants(self, index: UserIndex, path: str, include_root: bool):
+        for todo in index.iter_subtree(path):
+            if include_root or todo.path != path:
+                yield todo
+
+    async def get_sync_horizon(self, user_id: str) -> int:
+        return 0
+
+    def _query(
+        self,
+        user_id: str,
+        status: Optional[TodoStatus],
+        priority: Optional[Priority],
+        tags: Optional[List[str]],
+        search: Optional[str],
+        sort_by: str,
+        sort_order: str,
+        limit: int,
+        offset: int,
+        ids: Optional[List[str]],
+        project_id: Optional[str] = None,
+    ) -> Tuple[List[Todo], int]:
+        index = self.store.users.get(user_id)
+        if index is None:
+            return [], 0
+
+        mask = index.live
+        if ids:
+            mask &= index.mask_for(ids)
+        if project_id:
+            mask &= index.by_project.get(project_id, 0)
+        if status:
+            mask &= index.by_status.get(status.value, 0)
+        if priority:
+            mask &= index.by_priority.get(int(priority), 0)
+        if tags:
+            tag_mask = 0
+            for tag in tags:
+                tag_mask |= index.by_tag.get(tag, 0)
+            mask &= tag_mask
+        if search:
+            mask = self._search(index, mask, search.lower())
+
+        total = mask.bit_count()
+        if total == 0:
+            return [], 0
+
+        return self._page(index, mask, total, sort_by, sort_order == "desc", limit, offset), total
+
+    def _search(self, index: UserIndex, mask: int, term: str) -> int:
+        matched = 0
+        for slot in _slots(mask):
+            todo = index.todos[slot]
+            if term in todo.title.lower() or term in (todo.description or "").lower():
+                matched |= 1 << slot
+        return matched
+
+    def _page(
+        self,
+        index: UserIndex,
+        mask: int,
+        total: int,
+        sort_by: str,
+        descending: bool,
+        limit: int,
+        offset: int,
+    ) -> List[Todo]:
+        entries = index.sorted[sort_by]
+        if total * 8 < len(entries):
+            # Selective filter: sorting the few matches beats walking the
+            # sorted list past everything that was filtered out.
+            slots = sorted(
+                _slots(mask),
+                key=lambda slot: (index.sort_keys[slot][sort_by], slot),
+                reverse=descending,
+            )
+            return [index.todos[slot] for slot in slots[offset : offset + limit]]
+
+        page = []
+        for position, todo in enumerate(index.iter_sorted(sort_by, descending, mask)):
+            if position < offset:
+                continue
+            page.append(todo)
+            if len(page) == limit:
+                break
+        return page
+
+
+class InMemoryProjectReadRepository:
+    def __init__(self, store: InMemoryTodoStore):
+        self.store = store
+
+    async def find_by_id(self, project_id: ProjectId) -> Optional[Project]:
+        project = self.store.projects.get(project_id)
+        return replace(project) if project else None
+
+    async def find_by_user(self, user_id: str) -> List[Project]:
+        projects = [p for p in self.store.projects.values() if p.user_id == user_id]
+        return [replace(project) for project in sorted(projects, key=lambda p: p.name)]
+
+
+class InMemoryTodoHistoryReadRepository:
+    def __init__(self, store: InMemoryTodoStore):
+        self.store = store
+
+    def _history(self, todo_id: TodoId, user_id: str) -> List[TodoVersion]:
+        history = self.store.history.get(todo_id, [])
+        if history and history[0].user_id != user_id:
+            return []
+        return history
+
+    async def find_versions(
+        self, todo_id: TodoId, user_id: str, before: Optional[int], limit: int
+    ) -> List[TodoVersion]:
+        history = self._history(todo_id, user_id)
+        # Versions are dense from 1, so version v sits at index v - 1.
+        end = len(history) if before is None else max(min(before - 1, len(history)), 0)
+        return history[max(end - limit, 0) : end][::-1]
+
+    async def find_snapshot(
+        self, todo_id: TodoId, user_id: str, at: datetime
+    ) -> Optional[TodoSnapshot]:
+        if not self._history(todo_id, user_id):
+            return None
+        snapshots = self.store.snapshots.get(todo_id, [])
+        index = bisect_right(snapshots, at, key=lambda snapshot: snapshot.recorded_at)
+        return snapshots[index - 1] if index else None
+
+    async def find_versions_after(
+        self, todo_id: TodoId, user_id: str, version: int, at: datetime, limit: int
+    ) -> List[TodoVersion]:
+        versions = []
+        for entry in self._history(todo_id, user_id)[version:]:
+            if entry.recorded_at > at or len(versions) == limit:
+                break
+            versions.append(entry)
+        return versions
+
+
+def _bucket_start(day: date, bucket: str) -> date:
+    # Weeks start on Monday, as with date_trunc('week', ...).
+    return day - timedelta(days=day.weekday()) if bucket == "week" else day
+
+
+class InMemoryAnalyticsReadRepository:
+    """Computes what the Postgres backend reads from its daily rollup, live"""
+
+    def __init__(self, store: InMemoryTodoStore):
+        self.store = store
+
+    def _todos(self, user_id: str) -> List[Todo]:
+        index = self.store.users.get(user_id)
+        return [todo for todo in index.todos if todo is not None] if index else []
+
+    async def find_trend(
+        self, user_id: str, since: date, until: date, bucket: str
+    ) -> List[Tuple[date, int, int, int]]:
+        counts: Dict[date, List[int]] = defaultdict(lambda: [0, 0])
+        for todo in self._todos(user_id):
+            if since <= todo.created_at.date() <= until:
+                counts[_bucket_start(todo.created_at.date(), bucket)][0] += 1
+            if todo.status == TodoStatus.COMPLETED and todo.completed_at is not None:
+                if since <= todo.completed_at.date() <= until:
+                    counts[_bucket_start(todo.completed_at.date(), bucket)][1] += 1
+
+        trend, net_open = [], 0
+        for start in sorted(counts):
+            created, completed = counts[start]
+            net_open += created - completed
+            trend.append((start, created, completed, net_open))
+        return trend
+
+    async def find_completions(
+        self, user_id: str, since: date, until: date
+    ) -> List[Tuple[int, int, int, int, List[int]]]:
+        rows: Dict[Tuple[date, int], list] = {}
+        for todo in self._todos(user_id):
+            if todo.status != TodoStatus.COMPLETED or todo.completed_at is None:
+                continue
+            day = todo.completed_at.date()
+            if not since <= day <= until:
+                continue
+            row = rows.setdefault(
+                (day, int(todo.priority)),
+                [int(todo.priority), 0, 0, 0, [0] * DURATION_BUCKETS],
+            )
+            row[1] += 1
+            if todo.due_date is not None:
+                row[2] += 1
+                row[3] += todo.completed_at > todo.due_date
+            hours = (todo.completed_at - todo.created_at).total_seconds() / 3600
+            row[4][duration_bucket(hours)] += 1
+        return [tuple(row) for row in rows.values()]
+
+    async def count_open_overdue(self, user_id: str, now: datetime) -> Dict[int, int]:
+        counts: Dict[int, int] = defaultdict(int)
+        for todo in self._todos(user_id):
+            if (
+                todo.status in (TodoStatus.PENDING, TodoStatus.IN_PROGRESS)
+                and todo.due_date is not None
+                and todo.due_date < now
+            ):
+                counts[int(todo.priority)] += 1
+        return dict(counts)
+
+
+def _slots(mask: int):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
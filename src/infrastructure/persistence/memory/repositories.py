@@ -0,0 +1,169 @@
+from dataclasses import replace
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from domain.entities.project import Project
+from domain.entities.todo import Todo
+from domain.repositories.project_repository import ProjectRepository
+from domain.repositories.todo_repository import TodoRepository
+from domain.value_objects.project_id import ProjectId
+from domain.value_objects.todo_id import TodoId
+from domain.value_objects.todo_status import TodoStatus
+
+from .store import InMemoryTodoStore, copy_todo
+
+
+class InMemoryTodoRepository(TodoRepository):
+    """Write-side repository that stages changes until the unit of work commits"""
+
+    def __init__(self, store: InMemoryTodoStore, pending: Dict[TodoId, Optional[Todo]]):
+        self.store = store
+        self.pending = pending
+
+    async def save(self, todo: Todo) -> None:
+        self.pending[todo.id] = copy_todo(todo)
+
+    async def find_by_id(self, todo_id: TodoId) -> Optional[Todo]:
+        if todo_id in self.pending:
+            todo = self.pending[todo_id]
+            return copy_todo(todo) if todo else None
+        return self.store.get(todo_id)
+
+    async def find_by_id_for_update(self, todo_id: TodoId) -> Optional[Todo]:
+        # Handlers never suspend between reading and committing here, so the
+        # store already serializes them.
+        return await self.find_by_id(todo_id)
+
+    async def find_all(self) -> List[Todo]:
+        todos = {todo_id: todo for todo_id, todo in self.store.todos.items()}
+        todos.update(self.pending)
+        return [copy_todo(todo) for todo in todos.values() if todo is not None]
+
+    async def find_by_status(self, status: TodoStatus) -> List[Todo]:
+        return [todo for todo in await self.find_all() if todo.status == status]
+
+    async def delete(self, todo_id: TodoId) -> None:
+        if await self.find_by_id(todo_id) is not None:
+            self.pending[todo_id] = None
+
+    async def delete_many(self, todo_ids: List[TodoId], user_id: str) -> List[Todo]:
+        deleted = []
+        for todo_id in todo_ids:
+            todo = await self.find_by_id(todo_id)
+            if todo is not None and todo.user_id == user_id:
+                self.pending[todo_id] = None
+                deleted.append(todo)
+        return deleted
+
+    async def exists(self, todo_id: TodoId) -> bool:
+        return await self.find_by_id(todo_id) is not None
+
+    async def complete_descendants(self, todo: Todo) -> List[Todo]:
+        index = self.store.users.get(todo.user_id or "")
+        subtree = index.iter_subtree(todo.path) if index else ()
+        completed = []
+        for child in self._with_pending(
+            todo.user_id, subtree, lambda child: child.path.startswith(todo.path)
+        ):
+            if child.id == todo.id or child.status in (
+                TodoStatus.COMPLETED,
+                TodoStatus.CANCELLED,
+            ):
+                continue
+            child.status = TodoStatus.COMPLETED
+            child.completed_at = todo.completed_at
+            child.updated_at = todo.completed_at
+            self.pending[child.id] = copy_todo(child)
+            completed.append(child)
+        return completed
+
+    async def delete_descendants(self, todo: Todo) -> List[Todo]:
+        index = self.store.users.get(todo.user_id or "")
+        subtree = index.iter_subtree(todo.path) if index else ()
+        deleted = [
+            child
+            for child in self._with_pending(
+                todo.user_id, subtree, lambda child: child.path.startswith(todo.path)
+            )
+            if child.id != todo.id
+        ]
+        for child in deleted:
+            self.pending[child.id] = None
+        return deleted
+
+    async def unassign_project(self, project_id: ProjectId, user_id: str) -> List[TodoId]:
+        index = self.store.users.get(user_id)
+        members = index.iter_mask(index.by_project.get(str(project_id), 0)) if index else ()
+        unassigned = []
+        for todo in self._with_pending(
+            user_id, members, lambda todo: todo.project_id == project_id
+        ):
+            todo.project_id = None
+            todo.updated_at = datetime.utcnow()
+            self.pending[todo.id] = copy_todo(todo)
+            unassigned.append(todo.id)
+        return unassigned
+
+    def _with_pending(
+        self, user_id: Optional[str], committed: Iterable[Todo], matches: Callable[[Todo], bool]
+    ) -> List[Todo]:
+        """Copies of the committed index hits, overlaid with this unit of work's staged todos"""
+        todos = {todo.id: todo for todo in committed if todo.id not in self.pending}
+        for todo_id, todo in self.pending.items():
+            if todo is not None and todo.user_id == user_id and matches(todo):
+                todos[todo_id] = todo
+        return [copy_todo(todo) for todo in todos.values()]
+
+
+class InMemoryProjectRepository(ProjectRepository):
+    """Stages projects and counter deltas until the unit of work commits"""
+
+    def __init__(
+        self,
+        store: InMemoryTodoStore,
+        pending: Dict[ProjectId, Optional[Project]],
+        deltas: Dict[ProjectId, Tuple[int, int]],
+    ):
+        self.store = store
+        self.pending = pending
+        self.deltas = deltas
+
+    async def save(self, project: Project) -> None:
+        self.pending[project.id] = replace(project)
+
+    async def find_by_id(self, project_id: ProjectId) -> Optional[Project]:
+        if project_id in self.pending:
+            project = self.pending[project_id]
+        else:
+            project = self.store.projects.get(project_id)
+        if project is None:
+            return None
+        project = replace(project)
+        open_delta, completed_delta = self.deltas.get(project_id, (0, 0))
+        project.open_count += open_delta
+        project.completed_count += completed_delta
+        return project
+
+    async def delete(self, project_id: ProjectId, user_id: str) -> bool:
+        project = await self.find_by_id(project_id)
+        if project is None or project.user_id != user_id:
+            return False
+        self.pending[project_id] = None
+        self.deltas.pop(project_id, None)
+        return True
+
+    async def adjust_counts(
+        self, user_id: str, deltas: Dict[ProjectId, Tuple[int, int]]
+    ) -> Set[ProjectId]:
+        existing = set()
+        for project_id, (open_delta, completed_delta) in deltas.items():
+            project = await self.find_by_id(project_id)
+            if project is None or project.user_id != user_id:
+                continue
+            staged_open, staged_completed = self.deltas.get(project_id, (0, 0))
+            self.deltas[project_id] = (
+                staged_open + open_delta,
+                staged_completed + completed_delta,
+            )
+            existing.add(project_id)
+        return existing
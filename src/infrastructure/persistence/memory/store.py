@@ -0,0 +1,242 @@
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from dataclasses import replace
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from domain.entities.project import Project
+from domain.entities.todo import Todo
+from domain.entities.todo_history import (
+    TodoSnapshot,
+    TodoVersion,
+    diff_states,
+    record_version,
+    todo_state,
+)
+from domain.value_objects.project_id import ProjectId
+from domain.value_objects.todo_id import TodoId
+
+# "path" is not a list order: it keeps each subtree a contiguous bisect range.
+SORT_FIELDS = ("created_at", "updated_at", "due_date", "priority", "path")
+
+
+def _seq(entry: tuple) -> int:
+    return entry[0]
+
+
+def copy_todo(todo: Todo) -> Todo:
+    return replace(todo, tags=list(todo.tags))
+
+
+def _sort_key(todo: Todo, field: str) -> tuple:
+    value = getattr(todo, field)
+    if field == "priority":
+        return (0, int(value))
+    # NULLs sort last ascending and first descending, as in Postgres.
+    return (1, None) if value is None else (0, value)
+
+
+class UserIndex:
+    """Secondary indexes over one user's todos.
+
+    Each todo gets a slot number; status, priority, tag and project indexes are
+    bitmaps over slots, so filters combine with integer AND/OR, and each
+    sortable field keeps a bisect-maintained list of (key, slot).
+    """
+
+    def __init__(self):
+        self.slots: Dict[TodoId, int] = {}
+        self.todos: List[Optional[Todo]] = []
+        self.free_slots: List[int] = []
+        self.live = 0
+        self.by_status: Dict[str, int] = defaultdict(int)
+        self.by_priority: Dict[int, int] = defaultdict(int)
+        self.by_tag: Dict[str, int] = defaultdict(int)
+        self.by_project: Dict[str, int] = defaultdict(int)
+        self.recurring = 0
+        self.sorted: Dict[str, List[tuple]] = {field: [] for field in SORT_FIELDS}
+        self.sort_keys: Dict[int, Dict[str, tuple]] = {}
+
+    def add(self, todo: Todo) -> None:
+        if todo.id in self.slots:
+            self.remove(todo.id)
+
+        slot = self.free_slots.pop() if self.free_slots else len(self.todos)
+        if slot == len(self.todos):
+            self.todos.append(None)
+        self.todos[slot] = todo
+        self.slots[todo.id] = slot
+
+        bit = 1 << slot
+        self.live |= bit
+        self.by_status[todo.status.value] |= bit
+        self.by_priority[int(todo.priority)] |= bit
+        for tag in set(todo.tags or ()):
+            self.by_tag[tag] |= bit
+        if todo.project_id is not None:
+            self.by_project[str(todo.project_id)] |= bit
+        if todo.recurrence is not None:
+            self.recurring |= bit
+
+        keys = {field: _sort_key(todo, field) for field in SORT_FIELDS}
+        for field, key in keys.items():
+            insort(self.sorted[field], (key, slot))
+        self.sort_keys[slot] = keys
+
+    def remove(self, todo_id: TodoId) -> None:
+        slot = self.slots.pop(todo_id, None)
+        if slot is None:
+            return
+        todo = self.todos[slot]
+
+        mask = ~(1 << slot)
+        self.live &= mask
+        self.by_status[todo.status.value] &= mask
+        self.by_priority[int(todo.priority)] &= mask
+        self.recurring &= mask
+        if todo.project_id is not None:
+            project_id = str(todo.project_id)
+            self.by_project[project_id] &= mask
+            if not self.by_project[project_id]:
+                del self.by_project[project_id]
+        for tag in set(todo.tags or ()):
+            self.by_tag[tag] &= mask
+            if not self.by_tag[tag]:
+                del self.by_tag[tag]
+
+        for field, key in self.sort_keys.pop(slot).items():
+            entries = self.sorted[field]
+            del entries[bisect_left(entries, (key, slot))]
+
+        self.todos[slot] = None
+        self.free_slots.append(slot)
+
+    def mask_for(self, todo_ids: List[str]) -> int:
+        mask = 0
+        for todo_id in todo_ids:
+            slot = self.slots.get(TodoId(todo_id))
+            if slot is not None:
+                mask |= 1 << slot
+        return mask
+
+    def iter_sorted(self, field: str, descending: bool, mask: int) -> Iterator[Todo]:
+        entries = self.sorted[field]
+        ordered = reversed(entries) if descending else iter(entries)
+        for _, slot in ordered:
+            if mask >> slot & 1:
+                yield self.todos[slot]
+
+    def iter_mask(self, mask: int) -> Iterator[Todo]:
+        while mask:
+            low = mask & -mask
+            yield self.todos[low.bit_length() - 1]
+            mask ^= low
+
+    def iter_subtree(self, path: str) -> Iterator[Todo]:
+        """Todos whose path starts with `path`, found as one bisect range"""
+        entries = self.sorted["path"]
+        low = bisect_left(entries, ((0, path),))
+        high = bisect_left(entries, ((0, path[:-1] + "0"),))
+        for _, slot in entries[low:high]:
+            yield self.todos[slot]
+
+
+class InMemoryTodoStore:
+    """Committed state shared by the in-memory repositories.
+
+    Writes only arrive through apply(), which runs without awaiting, so a
+    unit of work's changes become visible to other readers all at once.
+    """
+
+    def __init__(self):
+        self.todos: Dict[TodoId, Todo] = {}
+        self.users: Dict[str, UserIndex] = defaultdict(UserIndex)
+        self.change_seq = 0
+        self.changes: Dict[str, List[Tuple[int, TodoId]]] = defaultdict(list)
+        self.last_change: Dict[TodoId, int] = {}
+        self.tombstones: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+        self.projects: Dict[ProjectId, Project] = {}
+        # Append-only; kept after the todo itself is deleted.
+        self.history: Dict[TodoId, List[TodoVersion]] = defaultdict(list)
+        self.snapshots: Dict[TodoId, List[TodoSnapshot]] = defaultdict(list)
+
+    def get(self, todo_id: TodoId) -> Optional[Todo]:
+        todo = self.todos.get(todo_id)
+        return copy_todo(todo) if todo else None
+
+    def apply(self, pending: Dict[TodoId, Optional[Todo]]) -> None:
+        now = datetime.utcnow()
+        for todo_id, todo in pending.items():
+            previous = self.todos.get(todo_id)
+            self.change_seq += 1
+
+            if todo is None:
+                if previous is None:
+                    continue
+                del self.todos[todo_id]
+                self.last_change.pop(todo_id, None)
+                user_id = previous.user_id or ""
+                self.users[user_id].remove(todo_id)
+                self.tombstones[user_id].append((self.change_seq, str(todo_id)))
+                self._record(previous, {}, now, deleted=True)
+                continue
+
+            before = todo_state(previous) if previous is not None else None
+            changes = diff_states(before, todo_state(todo))
+            if changes:
+                self._record(todo, changes, now)
+
+            stored = copy_todo(todo)
+            user_id = stored.user_id or ""
+            if previous is not None and (previous.user_id or "") != user_id:
+                self.users[previous.user_id or ""].remove(todo_id)
+            self.todos[todo_id] = stored
+            self.users[user_id].add(stored)
+            self.last_change[todo_id] = self.change_seq
+            self.changes[user_id].append((self.change_seq, todo_id))
+
+    def _record(self, todo: Todo, changes: dict, now: datetime, deleted: bool = False) -> None:
+        history = self.history[todo.id]
+        version = history[-1].version + 1 if history else 1
+        entry, snapshot = record_version(todo, version, changes, now, deleted=deleted)
+        history.append(entry)
+        if snapshot is not None:
+            self.snapshots[todo.id].append(snapshot)
+
+    def apply_projects(
+        self,
+        pending: Dict[ProjectId, Optional[Project]],
+        deltas: Dict[ProjectId, Tuple[int, int]],
+    ) -> None:
+        """Stage projects as apply() does todos; counters move by delta, not by value"""
+        for project_id, project in pending.items():
+            current = self.projects.get(project_id)
+            if project is None:
+                self.projects.pop(project_id, None)
+            elif current is None:
+                self.projects[project_id] = replace(project)
+            else:
+                current.name = project.name
+                current.updated_at = project.updated_at
+        for project_id, (open_delta, completed_delta) in deltas.items():
+            project = self.projects.get(project_id)
+            if project is not None:
+                project.open_count += open_delta
+                project.completed_count += completed_delta
+
+    def changes_since(
+        self, user_id: str, since: int, limit: int
+    ) -> Tuple[List[Tuple[int, Todo]], List[Tuple[int, str]]]:
+        todos = []
+        log = self.changes.get(user_id, [])
+        for seq, todo_id in log[bisect_right(log, since, key=_seq) :]:
+            if self.last_change.get(todo_id) != seq:
+                continue
+            todos.append((seq, copy_todo(self.todos[todo_id])))
+            if len(todos) > limit:
+                break
+
+        tombstones = self.tombstones.get(user_id, [])
+        start = bisect_right(tombstones, since, key=_seq)
+        return todos, tombstones[start : start + limit + 1]
+
@@ -0,0 +1,41 @@
+from typing import Dict, Optional, Tuple
+
+from application.interfaces.unit_of_work import UnitOfWork
+from domain.entities.project import Project
+from domain.entities.todo import Todo
+from domain.value_objects.project_id import ProjectId
+from domain.value_objects.todo_id import TodoId
+
+from .repositories import InMemoryProjectRepository, InMemoryTodoRepository
+from .store import InMemoryTodoStore
+
+
+class InMemoryUnitOfWork(UnitOfWork):
+    def __init__(self, store: InMemoryTodoStore):
+        self.store = store
+        self._pending: Dict[TodoId, Optional[Todo]] = {}
+        self._pending_projects: Dict[ProjectId, Optional[Project]] = {}
+        self._project_deltas: Dict[ProjectId, Tuple[int, int]] = {}
+
+    async def __aenter__(self):
+        self._pending = {}
+        self._pending_projects = {}
+        self._project_deltas = {}
+        self.todos = InMemoryTodoRepository(self.store, self._pending)
+        self.projects = InMemoryProjectRepository(
+            self.store, self._pending_projects, self._project_deltas
+        )
+        return self
+
+    async def __aexit__(self, *args):
+        await self.rollback()
+
+    async def commit(self):
+        self.store.apply_projects(self._pending_projects, self._project_deltas)
+        self.store.apply(self._pending)
+        await self.rollback()
+
+    async def rollback(self):
+        self._pending.clear()
+        self._pending_projects.clear()
+        self._project_deltas.clear()
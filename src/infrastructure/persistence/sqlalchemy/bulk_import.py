@@ -0,0 +1,129 @@
+import json
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from domain.entities.todo import Todo
+
+STAGING_TABLE = "todo_import_staging"
+
+STAGING_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "created_at",
+    "updated_at",
+    "completed_at",
+    "due_date",
+    "tags",
+    "user_id",
+)
+
+CREATE_STAGING = f"""
+CREATE TEMP TABLE {STAGING_TABLE} (
+    id uuid,
+    title varchar(200),
+    description text,
+    status varchar(20),
+    priority integer,
+    created_at timestamp,
+    updated_at timestamp,
+    completed_at timestamp,
+    due_date timestamp,
+    tags json,
+    user_id varchar(100)
+) ON COMMIT DROP
+"""
+
+# One set-based merge for the whole upload; ids that already exist are
+# skipped, so re-running an interrupted import is safe. The rows actually
+# inserted get their "created" history entry in the same statement, with the
+# keys of domain.entities.todo_history.todo_state.
+MERGE_STAGING = f"""
+WITH inserted AS (
+    INSERT INTO todos ({", ".join(STAGING_COLUMNS)}, change_seq, occurrence_index, path, version)
+    SELECT {", ".join(STAGING_COLUMNS)}, nextval('todo_change_seq'), 1, id::text || '/', 1
+    FROM {STAGING_TABLE}
+    ON CONFLICT (id) DO NOTHING
+    RETURNING *
+)
+INSERT INTO todo_events (todo_id, version, user_id, kind, changes, recorded_at)
+SELECT id, 1, user_id, 'created', jsonb_build_object(
+    'title', title,
+    'description', description,
+    'status', status,
+    'priority', priority,
+    'created_at', created_at,
+    'completed_at', completed_at,
+    'due_date', due_date,
+    'tags', tags,
+    'recurrence', NULL,
+    'parent_id', NULL,
+    'project_id', NULL
+), now() AT TIME ZONE 'utc'
+FROM inserted
+"""
+
+
+def _record(todo: Todo) -> tuple:
+    return (
+        todo.id.value,
+        todo.title,
+        todo.description,
+        todo.status.value,
+        int(todo.priority),
+        todo.created_at,
+        todo.updated_at,
+        todo.completed_at,
+        todo.due_date,
+        json.dumps(todo.tags),
+        todo.user_id,
+    )
+
+
+class CopyTodoImporter:
+    """Bulk loads todos with binary COPY into a temp staging table.
+
+    Everything runs on one pooled connection in one transaction: batches are
+    streamed into the staging table as they arrive, and commit() merges the
+    staging table into todos with a single INSERT ... SELECT.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self._connection = None
+        self._transaction = None
+        self._driver = None
+
+    async def __aenter__(self):
+        self._connection = await self.engine.connect()
+        raw = await self._connection.get_raw_connection()
+        # asyncpg's own connection; COPY is not available through SQLAlchemy.
+        self._driver = raw.driver_connection
+        self._transaction = self._driver.transaction()
+        await self._transaction.start()
+        await self._driver.execute(CREATE_STAGING)
+        return self
+
+    async def stage(self, todos: List[Todo]) -> None:
+        await self._driver.copy_records_to_table(
+            STAGING_TABLE, records=[_record(todo) for todo in todos], columns=STAGING_COLUMNS
+        )
+
+    async def commit(self) -> int:
+        status = await self._driver.execute(MERGE_STAGING)
+        await self._transaction.commit()
+        self._transaction = None
+        # Command tag is "INSERT 0 <rows>".
+        return int(status.split()[-1])
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            if self._transaction is not None:
+                await self._transaction.rollback()
+        finally:
+            self._transaction = None
+            self._driver = None
+            await self._connection.close()
@@ -0,0 +1,257 @@
+import asyncio
+import logging
+from typing import Optional, Tuple
+
+from sqlalchemy import (
+    Date,
+    Float,
+    Integer,
+    and_,
+    bindparam,
+    cast,
+    delete,
+    extract,
+    func,
+    select,
+    tuple_,
+    union,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, array, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.use_cases.queries.get_analytics import (
+    DURATION_BUCKETS,
+    DURATION_EDGES_HOURS,
+)
+from domain.value_objects.todo_status import TodoStatus
+
+from .database import async_session_maker
+from .models import (
+    DailyStatsWatermarkModel,
+    TodoDailyStatsModel,
+    TodoModel,
+    position_param,
+    snapshot_xmin,
+)
+
+logger = logging.getLogger(__name__)
+
+
+Position = Tuple[int, int]
+
+POSITION = tuple_(TodoModel.change_xid, TodoModel.change_seq)
+
+
+def _dirty_days(low: Position, high: Position):
+    """(user_id, day) pairs whose counts writes positioned in (low, high] may have changed"""
+    written = and_(POSITION > position_param(low), POSITION <= position_param(high))
+    return union(
+        select(TodoModel.user_id, cast(TodoModel.created_at, Date).label("day")).where(written),
+        select(TodoModel.user_id, cast(TodoModel.completed_at, Date)).where(
+            written, TodoModel.completed_at.is_not(None)
+        ),
+    ).subquery("dirty")
+
+
+def _daily_rows(dirty):
+    """Fresh todo_daily_stats rows for every dirty (user_id, day)"""
+    day = dirty.c.day
+    created = (
+        select(
+            TodoModel.user_id,
+            day.label("day"),
+            TodoModel.priority,
+            func.count().label("created"),
+        )
+        .join_from(
+            dirty,
+            TodoModel,
+            and_(
+                TodoModel.user_id == dirty.c.user_id,
+                TodoModel.created_at >= day,
+                TodoModel.created_at < day + 1,
+            ),
+        )
+        .where(TodoModel.deleted_at.is_(None))
+        .group_by(TodoModel.user_id, day, TodoModel.priority)
+        .subquery("created")
+    )
+
+    hours = cast(extract("epoch", TodoModel.completed_at - TodoModel.created_at), Float) / 3600
+    edges = bindparam("edges", list(DURATION_EDGES_HOURS), type_=ARRAY(Float))
+    done = (
+        select(
+            TodoModel.user_id,
+            day.label("day"),
+            TodoModel.priority,
+            TodoModel.completed_at,
+            TodoModel.due_date,
+            func.width_bucket(hours, edges).label("bucket"),
+        )
+        .join_from(
+            dirty,
+            TodoModel,
+            and_(
+                TodoModel.user_id == dirty.c.user_id,
+                TodoModel.completed_at >= day,
+                TodoModel.completed_at < day + 1,
+            ),
+        )
+        .where(
+            TodoModel.deleted_at.is_(None),
+            TodoModel.status == TodoStatus.COMPLETED.value,
+        )
+        .subquery("done")
+    )
+    completed = (
+        select(
+            done.c.user_id,
+            done.c.day,
+            done.c.priority,
+            func.count().label("completed"),
+            func.count(done.c.due_date).label("completed_with_due_date"),
+            func.count().filter(done.c.completed_at > done.c.due_date).label("completed_late"),
+            cast(
+                array([func.count().filter(done.c.bucket == i) for i in range(DURATION_BUCKETS)]),
+                ARRAY(Integer),
+            ).label("durations"),
+        )
+        .group_by(done.c.user_id, done.c.day, done.c.priority)
+        .subquery("completed")
+    )
+
+    def key(name: str):
+        return func.coalesce(created.c[name], completed.c[name])
+
+    no_durations = bindparam("no_durations", [0] * DURATION_BUCKETS, type_=ARRAY(Integer))
+    return select(
+        key("user_id"),
+        key("day"),
+        key("priority"),
+        func.coalesce(created.c.created, 0),
+        func.coalesce(completed.c.completed, 0),
+        func.coalesce(completed.c.completed_with_due_date, 0),
+        func.coalesce(completed.c.completed_late, 0),
+        func.coalesce(completed.c.durations, no_durations),
+    ).select_from(
+        created.outerjoin(
+            completed,
+            and_(
+                created.c.user_id == completed.c.user_id,
+                created.c.day == completed.c.day,
+                created.c.priority == completed.c.priority,
+            ),
+            full=True,
+        )
+    )
+
+
+async def _refresh_range(session: AsyncSession, low: Position, high: Position) -> int:
+    dirty = _dirty_days(low, high)
+    await session.execute(
+        delete(TodoDailyStatsModel).where(
+            TodoDailyStatsModel.user_id == dirty.c.user_id,
+            TodoDailyStatsModel.day == dirty.c.day,
+        )
+    )
+    result = await session.execute(
+        insert(TodoDailyStatsModel).from_select(
+            [
+                TodoDailyStatsModel.user_id,
+                TodoDailyStatsModel.day,
+                TodoDailyStatsModel.priority,
+                TodoDailyStatsModel.created,
+                TodoDailyStatsModel.completed,
+                TodoDailyStatsModel.completed_with_due_date,
+                TodoDailyStatsModel.completed_late,
+                TodoDailyStatsModel.durations,
+            ],
+            _daily_rows(dirty),
+        )
+    )
+    return result.rowcount
+
+
+async def _next_batch_end(
+    session: AsyncSession, low: Position, settled: int, batch_size: int
+) -> Optional[Position]:
+    """Position of the batch_size-th settled write after low, or of the last one"""
+    batch = (
+        select(TodoModel.change_xid, TodoModel.change_seq)
+        .where(POSITION > position_param(low), TodoModel.change_xid < settled)
+        .order_by(TodoModel.change_xid, TodoModel.change_seq)
+        .limit(batch_size)
+        .subquery("batch")
+    )
+    row = (
+        await session.execute(
+            select(batch.c.change_xid, batch.c.change_seq)
+            .order_by(batch.c.change_xid.desc(), batch.c.change_seq.desc())
+            .limit(1)
+        )
+    ).first()
+    return tuple(row) if row is not None else None
+
+
+async def refresh_daily_stats(batch_size: int) -> int:
+    """Bring todo_daily_stats up to date with the writes made so far.
+
+    Writes are found by their (change_xid, change_seq) position, as in the
+    change feed, and only the (user, day) pairs they touch are recomputed.
+    Only transactions below the snapshot's xmin are read: they have all
+    ended, and anything still running gets a larger position, so a write
+    that commits late is aggregated by a later refresh rather than skipped.
+    Each batch of up to batch_size writes is aggregated in its own
+    transaction, which also advances the watermark. Returns the number of
+    rollup rows written.
+    """
+    async with async_session_maker() as session:
+        async with session.begin():
+            await session.execute(
+                insert(DailyStatsWatermarkModel)
+                .values(id=1, change_xid=0, change_seq=0)
+                .on_conflict_do_nothing(index_elements=[DailyStatsWatermarkModel.id])
+            )
+            low = tuple(
+                (
+                    await session.execute(
+                        select(
+                            DailyStatsWatermarkModel.change_xid,
+                            DailyStatsWatermarkModel.change_seq,
+                        ).where(DailyStatsWatermarkModel.id == 1)
+                    )
+                ).one()
+            )
+            settled = (await session.execute(select(snapshot_xmin))).scalar()
+
+    written = 0
+    while True:
+        async with async_session_maker() as session:
+            async with session.begin():
+                high = await _next_batch_end(session, low, settled, batch_size)
+                if high is None:
+                    return written
+                written += await _refresh_range(session, low, high)
+                await session.execute(
+                    update(DailyStatsWatermarkModel)
+                    .where(DailyStatsWatermarkModel.id == 1)
+                    .values(change_xid=high[0], change_seq=high[1])
+                )
+        low = high
+
+
+async def run_daily_stats_refresh(leadership, interval_seconds: float, batch_size: int) -> None:
+    """Refresh loop; only the worker holding `leadership` refreshes"""
+    try:
+        while True:
+            try:
+                if await leadership.ensure():
+                    written = await refresh_daily_stats(batch_size)
+                    if written:
+                        logger.info("Refreshed %d daily stats rows", written)
+            except Exception:
+                logger.exception("Daily stats refresh failed")
+            await asyncio.sleep(interval_seconds)
+    finally:
+        await leadership.release()
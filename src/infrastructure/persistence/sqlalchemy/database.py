@@ -1,3 +1,5 @@
+from typing import Optional
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
@@ -25,3 +27,64 @@ Base = declarative_base()
 async def get_session() -> AsyncSession:
     async with async_session_maker() as session:
         yield session
+
+
+class ReadSession:
+    """Session stand-in for query-side repositories.
+
+    The session is opened at the first statement, so requests that fail
+    before querying never check out a pooled connection. From then on every
+    statement runs in one read-only REPEATABLE READ transaction, so the
+    reads of a request (a count and its page, changes and their tombstones)
+    all see the same snapshot; close() ends it, and for request-scoped
+    instances the dependency teardown calls it.
+
+    App-scoped readers pass per_statement=True instead: each statement then
+    gets its own short-lived session and never holds a snapshot open.
+    Loaded ORM objects come back detached with their attributes intact.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = async_session_maker,
+        per_statement: bool = False,
+    ):
+        self.session_factory = session_factory
+        self.per_statement = per_statement
+        self._session: Optional[AsyncSession] = None
+
+    async def _open(self) -> AsyncSession:
+        if self._session is None:
+            session = self.session_factory()
+            try:
+                await session.connection(
+                    execution_options={
+                        "isolation_level": "REPEATABLE READ",
+                        "postgresql_readonly": True,
+                    }
+                )
+            except BaseException:
+                await session.close()
+                raise
+            self._session = session
+        return self._session
+
+    async def execute(self, statement, *args, **kwargs):
+        if self.per_statement:
+            async with self.session_factory() as session:
+                result = await session.execute(statement, *args, **kwargs)
+                return result.freeze()()
+        session = await self._open()
+        return await session.execute(statement, *args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        if self.per_statement:
+            async with self.session_factory() as session:
+                return await session.get(*args, **kwargs)
+        session = await self._open()
+        return await session.get(*args, **kwargs)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
@@ -0,0 +1,91 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from domain.entities.todo import Todo
+from domain.value_objects.todo_id import TodoId
+
+from .read_repositories import TodoReadRepository
+
+
+class TodoDataLoader:
+    """Request-scoped loader that batches and dedupes find_by_id calls.
+
+    Lookups issued in the same event loop iteration are collected and
+    resolved with one find_by_ids query per user; results are cached for
+    the lifetime of the loader, so repeated lookups never hit the database.
+    """
+
+    def __init__(self, read_repository: TodoReadRepository, max_batch_size: int = 100):
+        self.read_repository = read_repository
+        self.max_batch_size = max_batch_size
+        self._cache: Dict[Tuple[str, TodoId], asyncio.Future] = {}
+        self._pending: Dict[str, Dict[TodoId, asyncio.Future]] = {}
+        self._dispatch_scheduled = False
+
+    async def find_by_id(self, todo_id: TodoId, user_id: str) -> Optional[Todo]:
+        key = (user_id, todo_id)
+        future = self._cache.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._cache[key] = future
+            self._pending.setdefault(user_id, {})[todo_id] = future
+            self._schedule_dispatch()
+        return await future
+
+    async def find_by_ids(self, todo_ids: List[TodoId], user_id: str) -> List[Todo]:
+        todos = await asyncio.gather(
+            *(self.find_by_id(todo_id, user_id) for todo_id in todo_ids)
+        )
+        return [todo for todo in todos if todo is not None]
+
+    async def find_fields_by_id(
+        self, todo_id: TodoId, user_id: str, fields: List[str]
+    ) -> Optional[dict]:
+        return await self.read_repository.find_fields_by_id(todo_id, user_id, fields)
+
+    def prime(self, todo: Todo, user_id: str) -> None:
+        key = (user_id, todo.id)
+        if key not in self._cache:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(todo)
+            self._cache[key] = future
+
+    def clear(self, todo_id: TodoId, user_id: str) -> None:
+        self._cache.pop((user_id, todo_id), None)
+
+    def _schedule_dispatch(self) -> None:
+        if self._dispatch_scheduled:
+            return
+        self._dispatch_scheduled = True
+        asyncio.get_running_loop().call_soon(
+            lambda: asyncio.ensure_future(self._dispatch())
+        )
+
+    async def _dispatch(self) -> None:
+        self._dispatch_scheduled = False
+        pending, self._pending = self._pending, {}
+        for user_id, futures in pending.items():
+            todo_ids = list(futures)
+            for start in range(0, len(todo_ids), self.max_batch_size):
+                chunk = todo_ids[start : start + self.max_batch_size]
+                await self._load_chunk(user_id, chunk, futures)
+
+    async def _load_chunk(
+        self,
+        user_id: str,
+        todo_ids: List[TodoId],
+        futures: Dict[TodoId, asyncio.Future],
+    ) -> None:
+        try:
+            todos = await self.read_repository.find_by_ids(todo_ids, user_id)
+        except Exception as exc:
+            for todo_id in todo_ids:
+                self._cache.pop((user_id, todo_id), None)
+                if not futures[todo_id].done():
+                    futures[todo_id].set_exception(exc)
+            return
+
+        found = {todo.id: todo for todo in todos}
+        for todo_id in todo_ids:
+            if not futures[todo_id].done():
+                futures[todo_id].set_result(found.get(todo_id))
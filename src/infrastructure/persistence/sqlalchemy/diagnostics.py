@@ -0,0 +1,58 @@
+import json
+import logging
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ...diagnostics import QueryDiagnostics
+
+logger = logging.getLogger(__name__)
+
+
+def install_query_diagnostics(engine: AsyncEngine, diagnostics: QueryDiagnostics) -> None:
+    """Time every statement on the engine and feed it to the diagnostics"""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        if diagnostics.config.enabled:
+            context.diagnostics_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _stop_timer(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "diagnostics_started", None)
+        if started is None:
+            return
+        duration_ms = (time.perf_counter() - started) * 1000
+        if diagnostics.record(statement, parameters, duration_ms) and not executemany:
+            _capture_plan(conn, statement, parameters, diagnostics)
+
+
+def _capture_plan(conn, statement: str, parameters, diagnostics: QueryDiagnostics) -> None:
+    # A separate DBAPI cursor, so the original statement's rows are untouched;
+    # EXPLAIN ANALYZE runs the SELECT again, which is why only a sample of
+    # slow statement shapes is captured. It runs inside a savepoint that is
+    # always rolled back, so neither its side effects (row locks, volatile
+    # functions) nor a failure leak into the request's transaction.
+    if conn.get_execution_options().get("isolation_level") == "AUTOCOMMIT":
+        # No transaction to protect, and nothing to undo the re-run with.
+        return
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT diagnostics_explain")
+        try:
+            cursor.execute(
+                "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + statement, parameters
+            )
+            plan = cursor.fetchone()[0]
+            diagnostics.record_plan(
+                statement, json.loads(plan) if isinstance(plan, str) else plan
+            )
+        finally:
+            cursor.execute("ROLLBACK TO SAVEPOINT diagnostics_explain")
+            cursor.execute("RELEASE SAVEPOINT diagnostics_explain")
+    except Exception:
+        logger.exception("Could not capture plan for slow query")
+    finally:
+        cursor.close()
@@ -0,0 +1,308 @@
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from sqlalchemy import any_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from application.interfaces.event_bus import EventBus
+from application.use_cases.commands.complete_todo import (
+    CompleteTodoCommand,
+    CompleteTodoHandler,
+)
+from application.use_cases.commands.create_todo import (
+    CreateTodoCommand,
+    CreateTodoHandler,
+    build_todo,
+)
+from domain.entities.project import ProjectCounterDeltas
+from domain.entities.todo import Todo
+from domain.entities.todo_history import record_version, todo_state
+from domain.events.base import DomainEvent
+from domain.events.todo_events import TodoCompleted, TodoCreated
+from domain.exceptions import TodoNotFoundError
+from domain.value_objects.todo_id import TodoId
+from domain.value_objects.todo_status import TodoStatus
+
+from .models import TodoModel, todo_change_seq
+from .repositories import (
+    SQLAlchemyProjectRepository,
+    SQLAlchemyTodoRepository,
+    _ids_param,
+    append_history,
+    changed_fields,
+)
+
+logger = logging.getLogger(__name__)
+
+WriteCommand = Union[CreateTodoCommand, CompleteTodoCommand]
+
+
+@dataclass
+class _PendingWrite:
+    command: WriteCommand
+    future: asyncio.Future
+
+
+def _insert_row(todo: Todo) -> dict:
+    return {
+        "id": str(todo.id),
+        "title": todo.title,
+        "description": todo.description,
+        "status": todo.status.value,
+        "priority": todo.priority.value,
+        "created_at": todo.created_at,
+        "updated_at": todo.updated_at,
+        "completed_at": todo.completed_at,
+        "due_date": todo.due_date,
+        "tags": todo.tags,
+        "user_id": todo.user_id,
+        "change_seq": todo_change_seq.next_value(),
+        "recurrence": str(todo.recurrence) if todo.recurrence else None,
+        "series_id": str(todo.series_id) if todo.series_id else None,
+        "occurrence_index": todo.occurrence_index,
+        "parent_id": str(todo.parent_id) if todo.parent_id else None,
+        "path": todo.path,
+        "project_id": str(todo.project_id) if todo.project_id else None,
+        "version": 1,
+    }
+
+
+class WriteCoalescer:
+    """Group commit for concurrent single-todo creates and completes.
+
+    Commands submitted within window_seconds of each other (or until
+    max_batch_size are waiting) are applied in one transaction: a single
+    SELECT ... FOR UPDATE of the todos being completed, one multi-row INSERT,
+    one UPDATE, one history INSERT and one project counter UPDATE per user,
+    then a single commit. Each caller's future gets its own
+    result or its own domain error. If the shared transaction itself fails,
+    its commands are retried one per transaction so that only the offending
+    caller sees the failure.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        event_bus: EventBus,
+        window_seconds: float = 0.002,
+        max_batch_size: int = 64,
+    ):
+        self.session_factory = session_factory
+        self.event_bus = event_bus
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self.commits = 0
+        self.writes = 0
+        self._pending: List[_PendingWrite] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+
+    async def submit(self, command: WriteCommand) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(_PendingWrite(command, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.window_seconds, self._flush
+            )
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[_PendingWrite]) -> None:
+        try:
+            outcomes, events = await self._apply(batch)
+        except Exception as exc:
+            if len(batch) == 1:
+                outcomes, events = [exc], []
+            else:
+                logger.warning(
+                    "Group commit of %d writes failed, retrying singly", len(batch)
+                )
+                for write in batch:
+                    await self._run([write])
+                return
+
+        for write, outcome in zip(batch, outcomes):
+            if write.future.done():
+                continue
+            if isinstance(outcome, Exception):
+                write.future.set_exception(outcome)
+            else:
+                write.future.set_result(outcome)
+
+        for event in events:
+            await self.event_bus.publish(event)
+
+    async def _apply(self, batch: List[_PendingWrite]) -> Tuple[list, List[DomainEvent]]:
+        async with self.session_factory() as session:
+            async with session.begin():
+                completing = await self._lock_for_completion(session, batch)
+
+                now = datetime.utcnow()
+                outcomes: list = []
+                events: List[DomainEvent] = []
+                inserts: List[Todo] = []
+                completed: List[Todo] = []
+                deltas: Dict[str, ProjectCounterDeltas] = defaultdict(ProjectCounterDeltas)
+                for write in batch:
+                    user_id = write.command.user_id
+                    try:
+                        new_todos, done = self._decide(
+                            write.command, completing, deltas[user_id]
+                        )
+                    except Exception as exc:
+                        outcomes.append(exc)
+                        continue
+
+                    inserts.extend(new_todos)
+                    if done is not None:
+                        completed.append(done)
+                        events.append(TodoCompleted(todo_id=done.id, user_id=user_id))
+                        outcomes.append(None)
+                    else:
+                        outcomes.append(str(new_todos[0].id))
+                    events.extend(
+                        TodoCreated(todo_id=todo.id, title=todo.title, user_id=user_id)
+                        for todo in new_todos
+                    )
+
+                history = []
+                if inserts:
+                    await session.execute(
+                        insert(TodoModel).values([_insert_row(todo) for todo in inserts])
+                    )
+                    history.extend(
+                        record_version(todo, 1, todo_state(todo), now) for todo in inserts
+                    )
+                if completed:
+                    completed_ids = [str(todo.id) for todo in completed]
+                    result = await session.execute(
+                        update(TodoModel)
+                        .where(TodoModel.id == any_(_ids_param(completed_ids)))
+                        .values(
+                            status=TodoStatus.COMPLETED.value,
+                            completed_at=now,
+                            updated_at=now,
+                            change_seq=todo_change_seq.next_value(),
+                            version=TodoModel.version + 1,
+                        )
+                        .returning(TodoModel.id, TodoModel.version)
+                        .execution_options(synchronize_session=False)
+                    )
+                    versions = {TodoId(str(todo_id)): version for todo_id, version in result}
+                    for todo in completed:
+                        todo.completed_at = todo.updated_at = now
+                        history.append(
+                            record_version(
+                                todo,
+                                versions[todo.id],
+                                changed_fields(todo, ("status", "completed_at")),
+                                now,
+                            )
+                        )
+                await append_history(session, history)
+                projects = SQLAlchemyProjectRepository(session)
+                for user_id in sorted(deltas):
+                    changes = deltas[user_id].changes()
+                    if changes:
+                        await projects.adjust_counts(user_id, changes)
+
+        self.commits += 1
+        self.writes += len(batch)
+        return outcomes, events
+
+    async def _lock_for_completion(
+        self, session: AsyncSession, batch: List[_PendingWrite]
+    ) -> Dict[TodoId, Todo]:
+        ids = set()
+        for write in batch:
+            if isinstance(write.command, CompleteTodoCommand):
+                try:
+                    ids.add(str(TodoId(write.command.todo_id)))
+                except ValueError:
+                    continue
+        if not ids:
+            return {}
+
+        result = await session.execute(
+            select(TodoModel)
+            .where(
+                TodoModel.id == any_(_ids_param(sorted(ids))),
+                TodoModel.deleted_at.is_(None),
+            )
+            # Rows are locked in id order, so batches cannot deadlock each other.
+            .order_by(TodoModel.id)
+            .with_for_update()
+        )
+        to_entity = SQLAlchemyTodoRepository(session)._to_entity
+        return {TodoId(str(model.id)): to_entity(model) for model in result.scalars()}
+
+    def _decide(
+        self,
+        command: WriteCommand,
+        completing: Dict[TodoId, Todo],
+        deltas: ProjectCounterDeltas,
+    ) -> Tuple[List[Todo], Optional[Todo]]:
+        """Todos to insert and the todo completed (if any) for one command"""
+        if isinstance(command, CreateTodoCommand):
+            return [build_todo(command)], None
+
+        todo = completing.get(TodoId(command.todo_id))
+        if todo is None or todo.user_id != command.user_id:
+            raise TodoNotFoundError(f"Todo {command.todo_id} not found")
+        # Mutates the shared entity, so a second complete of the same todo
+        # in this batch fails exactly as it would have sequentially.
+        before = replace(todo)
+        todo.complete()
+        deltas.remove(before)
+        deltas.add(todo)
+        next_todo = todo.next_occurrence()
+        if next_todo is not None:
+            deltas.add(next_todo)
+        return ([next_todo] if next_todo is not None else []), todo
+
+
+class CoalescedCreateTodoHandler:
+    """Coalesces plain creates.
+
+    Subtasks need their parent, and creates into a project need the
+    project's existence check, so both go to `fallback`.
+    """
+
+    def __init__(self, coalescer: WriteCoalescer, fallback: CreateTodoHandler):
+        self.coalescer = coalescer
+        self.fallback = fallback
+
+    async def handle(self, command: CreateTodoCommand) -> str:
+        if command.parent_id is not None or command.project_id is not None:
+            return await self.fallback.handle(command)
+        return await self.coalescer.submit(command)
+
+
+class CoalescedCompleteTodoHandler:
+    """Coalesces single completes; cascading ones go to `fallback`"""
+
+    def __init__(self, coalescer: WriteCoalescer, fallback: CompleteTodoHandler):
+        self.coalescer = coalescer
+        self.fallback = fallback
+
+    async def handle(self, command: CompleteTodoCommand) -> None:
+        if command.cascade:
+            await self.fallback.handle(command)
+            return
+        await self.coalescer.submit(command)
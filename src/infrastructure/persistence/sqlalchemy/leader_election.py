@@ -0,0 +1,70 @@
+import logging
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+class AdvisoryLockLeadership:
+    """Leadership held as a session-level Postgres advisory lock.
+
+    The lock lives on one dedicated autocommit connection for as long as
+    this worker leads. If that connection drops, Postgres releases the lock
+    and whichever worker calls ensure() next takes over; ensure() pings the
+    connection first, so a leader notices the loss on its next call.
+    """
+
+    def __init__(self, engine: AsyncEngine, lock_key: int):
+        self.engine = engine
+        self.lock_key = lock_key
+        self._connection: Optional[AsyncConnection] = None
+
+    async def ensure(self) -> bool:
+        """Whether this worker leads, trying to take the lock if it does not"""
+        if self._connection is not None:
+            try:
+                await self._connection.execute(select(1))
+                return True
+            except Exception:
+                logger.warning("Lost the leader connection for lock %d", self.lock_key)
+                await self._discard()
+
+        connection = await self.engine.connect()
+        try:
+            connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+            acquired = (
+                await connection.execute(select(func.pg_try_advisory_lock(self.lock_key)))
+            ).scalar()
+        except Exception:
+            await connection.close()
+            raise
+        if not acquired:
+            await connection.close()
+            return False
+
+        logger.info("Acquired leadership (advisory lock %d)", self.lock_key)
+        self._connection = connection
+        return True
+
+    async def release(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            await self._connection.execute(select(func.pg_advisory_unlock(self.lock_key)))
+        except Exception:
+            logger.exception("Could not release advisory lock %d", self.lock_key)
+            await self._discard()
+            return
+        connection, self._connection = self._connection, None
+        await connection.close()
+
+    async def _discard(self) -> None:
+        # Invalidated rather than returned to the pool, so the lock cannot
+        # outlive leadership on a pooled connection.
+        connection, self._connection = self._connection, None
+        try:
+            await connection.invalidate()
+        except Exception:
+            pass
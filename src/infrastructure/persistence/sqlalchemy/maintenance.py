@@ -0,0 +1,131 @@
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from .database import async_session_maker
+from .models import SyncHorizonModel, TodoModel, TodoTombstoneModel
+
+logger = logging.getLogger(__name__)
+
+
+async def compact_tombstones(older_than: datetime, batch_size: int) -> int:
+    """Delete tombstones older than the cutoff, in batches of batch_size.
+
+    The highest purged change_xid of each user is recorded as their sync
+    horizon, so clients holding an older token are told to resync instead of
+    silently missing deletions.
+    """
+    purged = 0
+    while True:
+        async with async_session_maker() as session:
+            batch = (
+                select(TodoTombstoneModel.todo_id)
+                .where(TodoTombstoneModel.deleted_at < older_than)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = await session.execute(
+                delete(TodoTombstoneModel)
+                .where(TodoTombstoneModel.todo_id.in_(batch))
+                .returning(TodoTombstoneModel.user_id, TodoTombstoneModel.change_xid)
+            )
+            rows = result.all()
+            if not rows:
+                return purged
+
+            horizons = defaultdict(int)
+            for user_id, change_xid in rows:
+                horizons[user_id] = max(horizons[user_id], change_xid)
+
+            stmt = insert(SyncHorizonModel).values(
+                [
+                    {"user_id": user_id, "compacted_through": xid}
+                    for user_id, xid in horizons.items()
+                ]
+            )
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[SyncHorizonModel.user_id],
+                    set_={
+                        "compacted_through": func.greatest(
+                            SyncHorizonModel.compacted_through,
+                            stmt.excluded.compacted_through,
+                        )
+                    },
+                )
+            )
+            await session.commit()
+
+        purged += len(rows)
+        if len(rows) < batch_size:
+            return purged
+
+
+async def run_tombstone_compaction(
+    retention: timedelta, interval_seconds: float, batch_size: int
+) -> None:
+    while True:
+        try:
+            purged = await compact_tombstones(datetime.utcnow() - retention, batch_size)
+            if purged:
+                logger.info("Compacted %d todo tombstones", purged)
+        except Exception:
+            logger.exception("Tombstone compaction failed")
+        await asyncio.sleep(interval_seconds)
+
+
+async def purge_deleted_todos(
+    older_than: datetime, batch_size: int, pause_seconds: float
+) -> int:
+    """Physically remove soft-deleted todos in small, throttled batches.
+
+    Each batch is its own short transaction and skips rows locked by
+    concurrent writers; the pause between batches keeps the purge from
+    competing with foreground traffic for I/O and vacuum.
+    """
+    purged = 0
+    while True:
+        async with async_session_maker() as session:
+            batch = (
+                select(TodoModel.id)
+                .where(
+                    TodoModel.deleted_at.is_not(None),
+                    TodoModel.deleted_at < older_than,
+                )
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            result = await session.execute(
+                delete(TodoModel)
+                .where(TodoModel.id.in_(batch))
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+
+        purged += result.rowcount
+        if result.rowcount < batch_size:
+            return purged
+        await asyncio.sleep(pause_seconds)
+
+
+async def run_deleted_todo_purge(
+    grace_period: timedelta,
+    interval_seconds: float,
+    batch_size: int,
+    pause_seconds: float,
+) -> None:
+    while True:
+        try:
+            purged = await purge_deleted_todos(
+                datetime.utcnow() - grace_period, batch_size, pause_seconds
+            )
+            if purged:
+                logger.info("Purged %d soft-deleted todos", purged)
+        except Exception:
+            logger.exception("Soft-deleted todo purge failed")
+        await asyncio.sleep(interval_seconds)
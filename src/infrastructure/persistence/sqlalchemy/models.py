@@ -1,10 +1,46 @@
 import uuid
+from typing import Tuple
 
-from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    Date,
+    DateTime,
+    Index,
+    Integer,
+    Sequence,
+    String,
+    Text,
+    cast,
+    func,
+    literal,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 
 from .database import Base
 
+# Single monotonic sequence stamped on every todo write and tombstone.
+todo_change_seq = Sequence("todo_change_seq", metadata=Base.metadata)
+
+# The writing transaction's 64-bit id, stamped next to change_seq. Sequence
+# values are taken before commit, so on their own they can commit out of
+# order; ordering changes by (change_xid, change_seq) and reading only
+# transactions below the snapshot's xmin gives syncing clients positions
+# that a later commit can never land behind.
+CURRENT_XID = "pg_current_xact_id()::text::bigint"
+current_xid = cast(cast(func.pg_current_xact_id(), Text), BigInteger)
+# Every transaction with a smaller id had ended when the current snapshot was
+# taken; positions below it are settled.
+snapshot_xmin = cast(cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text), BigInteger)
+
+
+def position_param(position: Tuple[int, int]):
+    """A (change_xid, change_seq) position as a bigint row value to compare against"""
+    return tuple_(*(literal(part, BigInteger) for part in position))
+
 
 class TodoModel(Base):
     __tablename__ = "todos"
@@ -20,9 +56,228 @@ class TodoModel(Base):
     due_date = Column(DateTime, nullable=True)
     tags = Column(JSON, default=list)
     user_id = Column(String(100), nullable=False, index=True)
+    change_seq = Column(BigInteger, todo_change_seq, nullable=False)
+    change_xid = Column(
+        BigInteger,
+        nullable=False,
+        server_default=text(CURRENT_XID),
+        onupdate=current_xid,
+    )
+    deleted_at = Column(DateTime, nullable=True)
+    # Only the next occurrence of a recurring todo is stored; it carries the
+    # rule, and completing it materializes the one after.
+    recurrence = Column(String(200), nullable=True)
+    series_id = Column(UUID(as_uuid=True), nullable=True)
+    occurrence_index = Column(Integer, nullable=False, default=1)
+    # Subtasks: "<root id>/.../<own id>/". The C collation orders paths
+    # bytewise, so a subtree is one plain btree range even under generic
+    # plans, where a parameterized LIKE prefix could not use the index.
+    parent_id = Column(UUID(as_uuid=True), nullable=True)
+    path = Column(String(400, collation="C"), nullable=False)
+    project_id = Column(UUID(as_uuid=True), nullable=True)
+    # Number of the todo's latest entry in todo_events.
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    # Soft-deleted rows wait for the background purge; the read indexes are
+    # partial so they never carry them.
+    __table_args__ = (
+        Index(
+            "idx_user_status",
+            "user_id",
+            "status",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_user_priority",
+            "user_id",
+            "priority",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index("idx_due_date", "due_date", postgresql_where=text("deleted_at IS NULL")),
+        # "Next up" order, so each open status is one bounded range scan.
+        Index(
+            "idx_user_next",
+            "user_id",
+            "status",
+            text("priority DESC"),
+            text("due_date NULLS LAST"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Covers the compact list shape (id, title, status, priority,
+        # due_date) in the default created_at order as an index-only scan.
+        Index(
+            "idx_user_created_compact",
+            "user_id",
+            "created_at",
+            postgresql_include=["id", "title", "status", "priority", "due_date"],
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_user_change_position",
+            "user_id",
+            "change_xid",
+            "change_seq",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Prefix LIKE on lower(title) for autocomplete; text_pattern_ops keeps
+        # the index usable for LIKE 'abc%' under any collation.
+        Index(
+            "idx_user_title_prefix",
+            "user_id",
+            text("lower(title) text_pattern_ops"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_user_recurring",
+            "user_id",
+            postgresql_where=text(
+                "recurrence IS NOT NULL AND deleted_at IS NULL"
+                " AND status NOT IN ('completed', 'cancelled')"
+            ),
+        ),
+        # Each occurrence of a series is materialized once; a second
+        # completion of the same occurrence cannot insert its successor again.
+        Index(
+            "uq_series_occurrence",
+            "series_id",
+            "occurrence_index",
+            unique=True,
+            postgresql_where=text("series_id IS NOT NULL"),
+        ),
+        Index(
+            "idx_user_path",
+            "user_id",
+            "path",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "idx_user_project_status",
+            "user_id",
+            "project_id",
+            "status",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Completions of a user by day, for the daily stats rollup.
+        Index(
+            "idx_user_completed_at",
+            "user_id",
+            "completed_at",
+            postgresql_where=text("completed_at IS NOT NULL AND deleted_at IS NULL"),
+        ),
+        # Every write, soft deletes included, across users, in position
+        # order: what the daily stats refresh has not aggregated yet.
+        Index("idx_todos_change_position", "change_xid", "change_seq"),
+        Index(
+            "idx_todos_purge",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
+
+
+class ProjectModel(Base):
+    """A user's project; open/completed counts are kept in step by the todo writes"""
+
+    __tablename__ = "projects"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(String(100), nullable=False)
+    name = Column(String(100), nullable=False)
+    open_count = Column(Integer, nullable=False, default=0)
+    completed_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (Index("idx_project_user_name", "user_id", "name"),)
+
+
+class TodoEventModel(Base):
+    """Append-only change history: the fields each todo version changed.
+
+    Rows are only ever inserted, in the transaction of the write they
+    describe, and outlive the purge of the todo itself.
+    """
+
+    __tablename__ = "todo_events"
+
+    todo_id = Column(UUID(as_uuid=True), primary_key=True)
+    version = Column(Integer, primary_key=True)
+    user_id = Column(String(100), nullable=False)
+    kind = Column(String(16), nullable=False)
+    changes = Column(JSONB, nullable=False)
+    recorded_at = Column(DateTime, nullable=False)
+
+
+class TodoSnapshotModel(Base):
+    """Full todo state at every SNAPSHOT_INTERVAL-th version, to bound replays"""
+
+    __tablename__ = "todo_snapshots"
+
+    todo_id = Column(UUID(as_uuid=True), primary_key=True)
+    version = Column(Integer, primary_key=True)
+    user_id = Column(String(100), nullable=False)
+    state = Column(JSONB, nullable=False)
+    recorded_at = Column(DateTime, nullable=False)
+
+
+class TodoDailyStatsModel(Base):
+    """Per user, day and priority: todos created and completed that day.
+
+    durations is a histogram of the completed todos' time to complete, over
+    the buckets of application.use_cases.queries.get_analytics. Rows are
+    recomputed for the (user, day) pairs touched by new writes.
+    """
+
+    __tablename__ = "todo_daily_stats"
+
+    user_id = Column(String(100), primary_key=True)
+    day = Column(Date, primary_key=True)
+    priority = Column(Integer, primary_key=True)
+    created = Column(Integer, nullable=False)
+    completed = Column(Integer, nullable=False)
+    completed_with_due_date = Column(Integer, nullable=False)
+    completed_late = Column(Integer, nullable=False)
+    durations = Column(ARRAY(Integer), nullable=False)
+
+
+class DailyStatsWatermarkModel(Base):
+    """Position (change_xid, change_seq) the todo_daily_stats rollup is caught up through"""
+
+    __tablename__ = "daily_stats_watermark"
+
+    id = Column(Integer, primary_key=True)
+    change_xid = Column(BigInteger, nullable=False)
+    change_seq = Column(BigInteger, nullable=False)
+
+
+class TodoTombstoneModel(Base):
+    __tablename__ = "todo_tombstones"
+
+    todo_id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(String(100), nullable=False)
+    change_seq = Column(BigInteger, nullable=False)
+    change_xid = Column(BigInteger, nullable=False, server_default=text(CURRENT_XID))
+    deleted_at = Column(DateTime, nullable=False)
 
     __table_args__ = (
-        Index("idx_user_status", "user_id", "status"),
-        Index("idx_user_priority", "user_id", "priority"),
-        Index("idx_due_date", "due_date"),
+        Index("idx_tombstone_user_position", "user_id", "change_xid", "change_seq"),
+        Index("idx_tombstone_deleted_at", "deleted_at"),
     )
+
+
+class SyncHorizonModel(Base):
+    """Highest change_xid per user whose tombstones have been compacted away"""
+
+    __tablename__ = "sync_horizons"
+
+    user_id = Column(String(100), primary_key=True)
+    compacted_through = Column(BigInteger, nullable=False)
+
+
+class SchemaVersionModel(Base):
+    """Fingerprint of the metadata the schema was last created from"""
+
+    __tablename__ = "schema_version"
+
+    id = Column(Integer, primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
@@ -1,28 +1,145 @@
-from typing import List, Optional, Tuple
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, func, or_, select, text
+from sqlalchemy import (
+    DateTime,
+    String,
+    and_,
+    any_,
+    bindparam,
+    case,
+    cast,
+    func,
+    or_,
+    select,
+    text,
+    tuple_,
+    union_all,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import literal
 
+from domain.entities.project import Project
 from domain.entities.todo import Todo
+from domain.entities.todo_history import TodoSnapshot, TodoVersion
 from domain.value_objects.priority import Priority
 from domain.value_objects.todo_id import TodoId
 from domain.value_objects.todo_status import TodoStatus
 
-from .models import TodoModel
-from .repositories import SQLAlchemyTodoRepository
+from .models import (
+    ProjectModel,
+    SyncHorizonModel,
+    TodoDailyStatsModel,
+    TodoEventModel,
+    TodoModel,
+    TodoSnapshotModel,
+    TodoTombstoneModel,
+    position_param,
+    snapshot_xmin,
+)
+from .repositories import SQLAlchemyProjectRepository, SQLAlchemyTodoRepository, _ids_param
+
+
+def _is_overdue_column():
+    # Same rule as Todo.is_overdue, evaluated in SQL so that projections that
+    # ask only for is_overdue don't need to read due_date and status.
+    return case(
+        (
+            and_(
+                TodoModel.due_date.is_not(None),
+                TodoModel.status != TodoStatus.COMPLETED.value,
+                TodoModel.due_date < func.timezone("utc", func.now()),
+            ),
+            True,
+        ),
+        else_=False,
+    )
+
+
+def _subtree_join(root, include_root: bool):
+    # subtree_range() in SQL, so the root's path never leaves the database.
+    upper = (func.left(root.path, -1, type_=String) + "0").collate("C")
+    return and_(
+        TodoModel.user_id == root.user_id,
+        TodoModel.path >= root.path if include_root else TodoModel.path > root.path,
+        TodoModel.path < upper,
+    )
+
+
+_FIELD_COLUMNS = {
+    "id": lambda: TodoModel.id,
+    "title": lambda: TodoModel.title,
+    "description": lambda: TodoModel.description,
+    "status": lambda: TodoModel.status,
+    "priority": lambda: TodoModel.priority,
+    "created_at": lambda: TodoModel.created_at,
+    "updated_at": lambda: TodoModel.updated_at,
+    "completed_at": lambda: TodoModel.completed_at,
+    "due_date": lambda: TodoModel.due_date,
+    "tags": lambda: TodoModel.tags,
+    "is_overdue": _is_overdue_column,
+    "recurrence": lambda: TodoModel.recurrence,
+    "parent_id": lambda: TodoModel.parent_id,
+    "project_id": lambda: TodoModel.project_id,
+}
+
+
+def _columns_for(fields: List[str]) -> list:
+    return [_FIELD_COLUMNS[field]().label(field) for field in fields]
+
+
+def _to_projection(row) -> dict:
+    projection = dict(row)
+    for field in ("id", "parent_id", "project_id"):
+        if projection.get(field) is not None:
+            projection[field] = str(projection[field])
+    return projection
 
 
 class TodoReadRepository(SQLAlchemyTodoRepository):
     async def find_by_id(self, todo_id: TodoId, user_id: str) -> Optional[Todo]:
         result = await self.session.execute(
             select(TodoModel).where(
-                and_(TodoModel.id == str(todo_id), TodoModel.user_id == user_id)
+                and_(
+                    TodoModel.id == str(todo_id),
+                    TodoModel.user_id == user_id,
+                    TodoModel.deleted_at.is_(None),
+                )
             )
         )
         model = result.scalar()
         return self._to_entity(model) if model else None
 
+    async def find_by_ids(self, todo_ids: List[TodoId], user_id: str) -> List[Todo]:
+        if not todo_ids:
+            return []
+        result = await self.session.execute(
+            select(TodoModel).where(
+                and_(
+                    TodoModel.id == any_(_ids_param([str(i) for i in todo_ids])),
+                    TodoModel.user_id == user_id,
+                    TodoModel.deleted_at.is_(None),
+                )
+            )
+        )
+        return [self._to_entity(model) for model in result.scalars().all()]
+
+    async def find_fields_by_id(
+        self, todo_id: TodoId, user_id: str, fields: List[str]
+    ) -> Optional[dict]:
+        result = await self.session.execute(
+            select(*_columns_for(fields)).where(
+                and_(
+                    TodoModel.id == str(todo_id),
+                    TodoModel.user_id == user_id,
+                    TodoModel.deleted_at.is_(None),
+                )
+            )
+        )
+        row = result.mappings().first()
+        return _to_projection(row) if row else None
+
     async def find_with_filters(
         self,
         user_id: str,
@@ -34,31 +151,442 @@ class TodoReadRepository(SQLAlchemyTodoRepository):
         sort_order: str,
         limit: int,
         offset: int,
+        ids: Optional[List[str]] = None,
+        project_id: Optional[str] = None,
     ) -> Tuple[List[Todo], int]:
-        base_query = select(TodoModel).where(TodoModel.user_id == user_id)
+        base_query = select(TodoModel).where(
+            *self._filter_conditions(
+                user_id, status, priority, tags, search, ids, project_id
+            )
+        )
+
+        total = await self._count(base_query)
+
+        order_clause = text(f"{sort_by} {sort_order}")
+        result = await self.session.execute(
+            base_query.order_by(order_clause).limit(limit).offset(offset)
+        )
+        models = result.scalars().all()
+
+        return [self._to_entity(model) for model in models], total
+
+    async def find_fields_with_filters(
+        self,
+        fields: List[str],
+        user_id: str,
+        status: Optional[TodoStatus],
+        priority: Optional[Priority],
+        tags: Optional[List[str]],
+        search: Optional[str],
+        sort_by: str,
+        sort_order: str,
+        limit: int,
+        offset: int,
+        ids: Optional[List[str]] = None,
+        project_id: Optional[str] = None,
+    ) -> Tuple[List[dict], int]:
+        """Like find_with_filters, but only the columns behind `fields` are read"""
+        conditions = self._filter_conditions(
+            user_id, status, priority, tags, search, ids, project_id
+        )
+
+        total = await self._count(select(TodoModel.id).where(*conditions))
+
+        order_clause = text(f"todos.{sort_by} {sort_order}")
+        result = await self.session.execute(
+            select(*_columns_for(fields))
+            .where(*conditions)
+            .order_by(order_clause)
+            .limit(limit)
+            .offset(offset)
+        )
+
+        return [_to_projection(row) for row in result.mappings().all()], total
+
+    async def find_changes_since(
+        self, user_id: str, since: Tuple[int, int], limit: int
+    ) -> Tuple[List[Tuple[Tuple[int, int], Todo]], List[Tuple[Tuple[int, int], str]]]:
+        """Todos and tombstones positioned after since, oldest first.
+
+        A change's position is (change_xid, change_seq). Only transactions
+        that had ended before this read's snapshot (ids below its xmin) are
+        returned: one still running has a larger id than anything returned,
+        so when it commits its changes land after the caller's new token
+        rather than behind it. A long transaction holds the feed back until
+        it ends. Each side is capped at limit + 1 rows so the caller can
+        merge them by position and tell whether more changes remain.
+        """
+        # Statements of a ReadSession share one snapshot, so this xmin is the
+        # one the two reads below are taken under.
+        settled = (await self.session.execute(select(snapshot_xmin))).scalar()
+
+        position = tuple_(TodoModel.change_xid, TodoModel.change_seq)
+        todos = await self.session.execute(
+            select(TodoModel)
+            .where(
+                TodoModel.user_id == user_id,
+                position > position_param(since),
+                TodoModel.change_xid < settled,
+                TodoModel.deleted_at.is_(None),
+            )
+            .order_by(TodoModel.change_xid, TodoModel.change_seq)
+            .limit(limit + 1)
+        )
+        tombstone_position = tuple_(TodoTombstoneModel.change_xid, TodoTombstoneModel.change_seq)
+        tombstones = await self.session.execute(
+            select(
+                TodoTombstoneModel.change_xid,
+                TodoTombstoneModel.change_seq,
+                TodoTombstoneModel.todo_id,
+            )
+            .where(
+                TodoTombstoneModel.user_id == user_id,
+                tombstone_position > position_param(since),
+                TodoTombstoneModel.change_xid < settled,
+            )
+            .order_by(TodoTombstoneModel.change_xid, TodoTombstoneModel.change_seq)
+            .limit(limit + 1)
+        )
+        return (
+            [
+                ((model.change_xid, model.change_seq), self._to_entity(model))
+                for model in todos.scalars()
+            ],
+            [((xid, seq), str(todo_id)) for xid, seq, todo_id in tombstones.all()],
+        )
+
+    async def find_titles(self, user_id: str, limit: int) -> List[Tuple[str, str]]:
+        result = await self.session.execute(
+            select(TodoModel.id, TodoModel.title)
+            .where(TodoModel.user_id == user_id, TodoModel.deleted_at.is_(None))
+            .limit(limit)
+        )
+        return [(str(todo_id), title) for todo_id, title in result.all()]
+
+    async def suggest_titles(
+        self, user_id: str, prefix: str, limit: int
+    ) -> List[Tuple[str, str]]:
+        """Titles starting with prefix (case-insensitive), via idx_user_title_prefix"""
+        pattern = (
+            prefix.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            + "%"
+        )
+        result = await self.session.execute(
+            select(TodoModel.id, TodoModel.title)
+            .where(
+                TodoModel.user_id == user_id,
+                TodoModel.deleted_at.is_(None),
+                func.lower(TodoModel.title).like(pattern, escape="\\"),
+            )
+            .order_by(func.lower(TodoModel.title))
+            .limit(limit)
+        )
+        return [(str(todo_id), title) for todo_id, title in result.all()]
+
+    async def find_next(self, user_id: str, limit: int) -> List[Todo]:
+        """Open todos by priority, then earliest due date, as a bounded top-K scan.
+
+        Each open status is read as its own LIMIT-ed range of idx_user_next,
+        already in order, and the two short runs are merged; nothing is
+        counted and the rest of the user's todos are never sorted.
+        """
+        branches = [
+            select(TodoModel)
+            .where(
+                TodoModel.user_id == user_id,
+                TodoModel.status == status.value,
+                TodoModel.deleted_at.is_(None),
+            )
+            .order_by(TodoModel.priority.desc(), TodoModel.due_date.asc().nulls_last())
+            .limit(limit)
+            for status in (TodoStatus.PENDING, TodoStatus.IN_PROGRESS)
+        ]
+        candidates = aliased(TodoModel, union_all(*branches).subquery())
+        result = await self.session.execute(
+            select(candidates)
+            .order_by(candidates.priority.desc(), candidates.due_date.asc().nulls_last())
+            .limit(limit)
+        )
+        return [self._to_entity(model) for model in result.scalars()]
+
+    async def find_recurring(self, user_id: str) -> List[Todo]:
+        """Open todos that carry a recurrence rule (served by idx_user_recurring)"""
+        result = await self.session.execute(
+            select(TodoModel).where(
+                TodoModel.user_id == user_id,
+                TodoModel.recurrence.is_not(None),
+                TodoModel.deleted_at.is_(None),
+                TodoModel.status.not_in(
+                    [TodoStatus.COMPLETED.value, TodoStatus.CANCELLED.value]
+                ),
+            )
+        )
+        return [self._to_entity(model) for model in result.scalars()]
+
+    async def find_due_between(
+        self, start: datetime, end: datetime, limit: int
+    ) -> List[Todo]:
+        """Open todos of every user due in [start, end), earliest first (idx_due_date)"""
+        result = await self.session.execute(
+            select(TodoModel)
+            .where(
+                TodoModel.due_date >= start,
+                TodoModel.due_date < end,
+                TodoModel.deleted_at.is_(None),
+                TodoModel.status.not_in(
+                    [TodoStatus.COMPLETED.value, TodoStatus.CANCELLED.value]
+                ),
+            )
+            .order_by(TodoModel.due_date)
+            .limit(limit)
+        )
+        return [self._to_entity(model) for model in result.scalars()]
+
+    async def find_subtree(self, todo_id: TodoId, user_id: str) -> List[Todo]:
+        """The todo and all of its descendants in path (depth-first) order.
+
+        One statement: the root's primary-key row drives a single
+        idx_user_path range scan.
+        """
+        root = aliased(TodoModel)
+        result = await self.session.execute(
+            select(TodoModel)
+            .join(root, _subtree_join(root, include_root=True))
+            .where(
+                root.id == str(todo_id),
+                root.user_id == user_id,
+                root.deleted_at.is_(None),
+                TodoModel.deleted_at.is_(None),
+            )
+            .order_by(TodoModel.path)
+        )
+        return [self._to_entity(model) for model in result.scalars()]
+
+    async def count_subtrees(
+        self, todo_ids: List[TodoId], user_id: str
+    ) -> Dict[TodoId, Tuple[int, int]]:
+        """(completed, total) descendants of each todo, in one grouped range scan"""
+        root = aliased(TodoModel)
+        result = await self.session.execute(
+            select(
+                root.id,
+                func.count(TodoModel.id).filter(
+                    TodoModel.status == TodoStatus.COMPLETED.value
+                ),
+                func.count(TodoModel.id),
+            )
+            .select_from(root)
+            .outerjoin(
+                TodoModel,
+                and_(
+                    _subtree_join(root, include_root=False),
+                    TodoModel.deleted_at.is_(None),
+                ),
+            )
+            .where(
+                root.id == any_(_ids_param([str(todo_id) for todo_id in todo_ids])),
+                root.user_id == user_id,
+                root.deleted_at.is_(None),
+            )
+            .group_by(root.id)
+        )
+        return {TodoId(str(root_id)): (done, total) for root_id, done, total in result.all()}
+
+    async def get_sync_horizon(self, user_id: str) -> int:
+        result = await self.session.execute(
+            select(SyncHorizonModel.compacted_through).where(
+                SyncHorizonModel.user_id == user_id
+            )
+        )
+        return result.scalar() or 0
+
+    def _filter_conditions(
+        self,
+        user_id: str,
+        status: Optional[TodoStatus],
+        priority: Optional[Priority],
+        tags: Optional[List[str]],
+        search: Optional[str],
+        ids: Optional[List[str]],
+        project_id: Optional[str] = None,
+    ) -> list:
+        conditions = [TodoModel.user_id == user_id, TodoModel.deleted_at.is_(None)]
 
+        if ids:
+            conditions.append(TodoModel.id == any_(_ids_param(ids)))
+        if project_id:
+            conditions.append(TodoModel.project_id == project_id)
         if status:
-            base_query = base_query.where(TodoModel.status == status.value)
+            conditions.append(TodoModel.status == status.value)
         if priority:
-            base_query = base_query.where(TodoModel.priority == priority.value)
+            conditions.append(TodoModel.priority == priority.value)
         if tags:
-            base_query = base_query.where(TodoModel.tags.overlap(literal(tags)))
+            conditions.append(TodoModel.tags.overlap(literal(tags)))
         if search:
             search_term = f"%{search}%"
-            base_query = base_query.where(
+            conditions.append(
                 or_(
                     TodoModel.title.ilike(search_term),
                     TodoModel.description.ilike(search_term),
                 )
             )
 
-        count_query = select(func.count()).select_from(base_query.subquery())
-        total = (await self.session.execute(count_query)).scalar()
+        return conditions
 
-        order_clause = text(f"{sort_by} {sort_order}")
+    async def _count(self, query) -> int:
+        count_query = select(func.count()).select_from(query.subquery())
+        return (await self.session.execute(count_query)).scalar()
+
+
+class ProjectReadRepository(SQLAlchemyProjectRepository):
+    async def find_by_user(self, user_id: str) -> List[Project]:
+        """The sidebar read: one idx_project_user_name range, counters included"""
         result = await self.session.execute(
-            base_query.order_by(order_clause).limit(limit).offset(offset)
+            select(ProjectModel)
+            .where(ProjectModel.user_id == user_id)
+            .order_by(ProjectModel.name)
         )
-        models = result.scalars().all()
+        return [self._to_entity(model) for model in result.scalars()]
 
-        return [self._to_entity(model) for model in models], total
+
+class TodoHistoryReadRepository:
+    """Reads of todo_events and todo_snapshots, each one primary key range scan"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_versions(
+        self, todo_id: TodoId, user_id: str, before: Optional[int], limit: int
+    ) -> List[TodoVersion]:
+        statement = select(TodoEventModel).where(
+            TodoEventModel.todo_id == str(todo_id), TodoEventModel.user_id == user_id
+        )
+        if before is not None:
+            statement = statement.where(TodoEventModel.version < before)
+        result = await self.session.execute(
+            statement.order_by(TodoEventModel.version.desc()).limit(limit)
+        )
+        return [self._to_version(model) for model in result.scalars()]
+
+    async def find_snapshot(
+        self, todo_id: TodoId, user_id: str, at: datetime
+    ) -> Optional[TodoSnapshot]:
+        """The latest snapshot taken at or before `at`"""
+        result = await self.session.execute(
+            select(TodoSnapshotModel)
+            .where(
+                TodoSnapshotModel.todo_id == str(todo_id),
+                TodoSnapshotModel.user_id == user_id,
+                TodoSnapshotModel.recorded_at <= at,
+            )
+            .order_by(TodoSnapshotModel.version.desc())
+            .limit(1)
+        )
+        model = result.scalars().first()
+        if model is None:
+            return None
+        return TodoSnapshot(
+            todo_id=TodoId(str(model.todo_id)),
+            user_id=model.user_id,
+            version=model.version,
+            state=model.state,
+            recorded_at=model.recorded_at,
+        )
+
+    async def find_versions_after(
+        self, todo_id: TodoId, user_id: str, version: int, at: datetime, limit: int
+    ) -> List[TodoVersion]:
+        """Versions after `version` recorded at or before `at`, oldest first"""
+        result = await self.session.execute(
+            select(TodoEventModel)
+            .where(
+                TodoEventModel.todo_id == str(todo_id),
+                TodoEventModel.user_id == user_id,
+                TodoEventModel.version > version,
+                TodoEventModel.recorded_at <= at,
+            )
+            .order_by(TodoEventModel.version)
+            .limit(limit)
+        )
+        return [self._to_version(model) for model in result.scalars()]
+
+    def _to_version(self, model: TodoEventModel) -> TodoVersion:
+        return TodoVersion(
+            todo_id=TodoId(str(model.todo_id)),
+            user_id=model.user_id,
+            version=model.version,
+            kind=model.kind,
+            changes=model.changes,
+            recorded_at=model.recorded_at,
+        )
+
+
+class AnalyticsReadRepository:
+    """Reads of the todo_daily_stats rollup, plus the live open-overdue counts"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_trend(
+        self, user_id: str, since: date, until: date, bucket: str
+    ) -> List[Tuple[date, int, int, int]]:
+        """(bucket_start, created, completed, running created - completed) per bucket"""
+        stats = TodoDailyStatsModel
+        # Inlined, so the SELECT, GROUP BY and window share one expression;
+        # the cast keeps date_trunc on timestamp, away from the session time zone.
+        bucket_start = func.date_trunc(
+            bindparam("bucket", bucket, literal_execute=True), cast(stats.day, DateTime)
+        )
+        created = func.sum(stats.created)
+        completed = func.sum(stats.completed)
+        result = await self.session.execute(
+            select(
+                bucket_start,
+                created,
+                completed,
+                func.sum(created - completed).over(order_by=bucket_start),
+            )
+            .where(stats.user_id == user_id, stats.day >= since, stats.day <= until)
+            .group_by(bucket_start)
+            .order_by(bucket_start)
+        )
+        return [
+            (start.date(), int(created), int(completed), int(net_open))
+            for start, created, completed, net_open in result
+        ]
+
+    async def find_completions(
+        self, user_id: str, since: date, until: date
+    ) -> List[Tuple[int, int, int, int, List[int]]]:
+        """Columns of the days with completions: priority, counts and duration histogram"""
+        stats = TodoDailyStatsModel
+        result = await self.session.execute(
+            select(
+                stats.priority,
+                stats.completed,
+                stats.completed_with_due_date,
+                stats.completed_late,
+                stats.durations,
+            ).where(
+                stats.user_id == user_id,
+                stats.day >= since,
+                stats.day <= until,
+                stats.completed > 0,
+            )
+        )
+        return [tuple(row) for row in result]
+
+    async def count_open_overdue(self, user_id: str, now: datetime) -> Dict[int, int]:
+        result = await self.session.execute(
+            select(TodoModel.priority, func.count())
+            .where(
+                TodoModel.user_id == user_id,
+                TodoModel.status.in_(
+                    [TodoStatus.PENDING.value, TodoStatus.IN_PROGRESS.value]
+                ),
+                TodoModel.due_date < now,
+                TodoModel.deleted_at.is_(None),
+            )
+            .group_by(TodoModel.priority)
+        )
+        return {priority: count for priority, count in result}
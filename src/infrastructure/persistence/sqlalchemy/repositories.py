@@ -1,15 +1,102 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Integer,
+    any_,
+    bindparam,
+    column,
+    delete,
+    func,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from domain.entities.project import Project
 from domain.entities.todo import Todo
+from domain.entities.todo_history import (
+    TodoSnapshot,
+    TodoVersion,
+    diff_states,
+    record_version,
+    todo_state,
+)
+from domain.repositories.project_repository import ProjectRepository
 from domain.repositories.todo_repository import TodoRepository
 from domain.value_objects.priority import Priority
+from domain.value_objects.project_id import ProjectId
+from domain.value_objects.recurrence_rule import RecurrenceRule
 from domain.value_objects.todo_id import TodoId
 from domain.value_objects.todo_status import TodoStatus
 
-from .models import TodoModel
+from .models import (
+    ProjectModel,
+    TodoEventModel,
+    TodoModel,
+    TodoSnapshotModel,
+    TodoTombstoneModel,
+    todo_change_seq,
+)
+
+HistoryRecord = Tuple[TodoVersion, Optional[TodoSnapshot]]
+
+
+def subtree_range(path: str) -> Tuple[str, str]:
+    # Descendant paths extend `path`, so under the C collation they sort
+    # after it and before `path` with its final "/" bumped to "0".
+    return path, path[:-1] + "0"
+
+
+def _ids_param(ids: List[str]):
+    # A single array parameter keeps the statement text identical for any
+    # number of ids, unlike an expanding IN list.
+    return bindparam("ids", ids, type_=ARRAY(UUID(as_uuid=False)))
+
+
+def changed_fields(todo: Todo, fields: Tuple[str, ...]) -> dict:
+    """History changes of a set-based UPDATE: the new values of the fields it set"""
+    state = todo_state(todo)
+    return {field: state[field] for field in fields}
+
+
+async def append_history(session: AsyncSession, records: List[HistoryRecord]) -> None:
+    """One multi-row INSERT per history table for every version a statement wrote"""
+    if not records:
+        return
+    await session.execute(
+        insert(TodoEventModel).values(
+            [
+                {
+                    "todo_id": str(entry.todo_id),
+                    "version": entry.version,
+                    "user_id": entry.user_id,
+                    "kind": entry.kind,
+                    "changes": entry.changes,
+                    "recorded_at": entry.recorded_at,
+                }
+                for entry, _ in records
+            ]
+        )
+    )
+    snapshots = [snapshot for _, snapshot in records if snapshot is not None]
+    if snapshots:
+        await session.execute(
+            insert(TodoSnapshotModel).values(
+                [
+                    {
+                        "todo_id": str(snapshot.todo_id),
+                        "version": snapshot.version,
+                        "user_id": snapshot.user_id,
+                        "state": snapshot.state,
+                        "recorded_at": snapshot.recorded_at,
+                    }
+                    for snapshot in snapshots
+                ]
+            )
+        )
 
 
 class SQLAlchemyTodoRepository(TodoRepository):
@@ -17,10 +104,16 @@ class SQLAlchemyTodoRepository(TodoRepository):
         self.session = session
 
     async def save(self, todo: Todo) -> None:
-        model = await self.session.get(TodoModel, str(todo.id))
+        # Locked and re-read, so the history diff and version number are
+        # taken against the committed row rather than a stale identity map.
+        model = await self.session.get(
+            TodoModel, str(todo.id), with_for_update=True, populate_existing=True
+        )
+        before = todo_state(self._to_entity(model)) if model is not None else None
+        changes = diff_states(before, todo_state(todo))
 
         if model is None:
-            model = TodoModel()
+            model = TodoModel(version=0)
 
         model.id = str(todo.id)
         model.title = todo.title
@@ -32,40 +125,198 @@ class SQLAlchemyTodoRepository(TodoRepository):
         model.completed_at = todo.completed_at
         model.due_date = todo.due_date
         model.tags = todo.tags
+        model.recurrence = str(todo.recurrence) if todo.recurrence else None
+        model.series_id = str(todo.series_id) if todo.series_id else None
+        model.occurrence_index = todo.occurrence_index
+        model.parent_id = str(todo.parent_id) if todo.parent_id else None
+        model.path = todo.path
+        model.project_id = str(todo.project_id) if todo.project_id else None
+        if todo.user_id is not None:
+            model.user_id = todo.user_id
+        model.change_seq = todo_change_seq.next_value()
+        if changes:
+            model.version += 1
 
         self.session.add(model)
         await self.session.flush()
+        if changes:
+            await append_history(
+                self.session,
+                [record_version(todo, model.version, changes, datetime.utcnow())],
+            )
 
     async def find_by_id(self, todo_id: TodoId) -> Optional[Todo]:
         model = await self.session.get(TodoModel, str(todo_id))
-        return self._to_entity(model) if model else None
+        if model is None or model.deleted_at is not None:
+            return None
+        return self._to_entity(model)
+
+    async def find_by_id_for_update(self, todo_id: TodoId) -> Optional[Todo]:
+        model = await self.session.get(
+            TodoModel, str(todo_id), with_for_update=True, populate_existing=True
+        )
+        if model is None or model.deleted_at is not None:
+            return None
+        return self._to_entity(model)
 
     async def find_all(self) -> List[Todo]:
-        result = await self.session.execute(select(TodoModel))
+        result = await self.session.execute(
+            select(TodoModel).where(TodoModel.deleted_at.is_(None))
+        )
         models = result.scalars().all()
         return [self._to_entity(model) for model in models]
 
     async def find_by_status(self, status: TodoStatus) -> List[Todo]:
         result = await self.session.execute(
-            select(TodoModel).where(TodoModel.status == status.value)
+            select(TodoModel).where(
+                TodoModel.status == status.value, TodoModel.deleted_at.is_(None)
+            )
         )
         models = result.scalars().all()
         return [self._to_entity(model) for model in models]
 
     async def delete(self, todo_id: TodoId) -> None:
         model = await self.session.get(TodoModel, str(todo_id))
-        if model:
-            await self.session.delete(model)
-            await self.session.flush()
+        if model is None or model.deleted_at is not None:
+            return
+        await self.delete_many([todo_id], model.user_id)
+
+    async def delete_many(self, todo_ids: List[TodoId], user_id: str) -> List[Todo]:
+        """Soft delete: rows are only marked here and purged in the background"""
+        if not todo_ids:
+            return []
+        return await self._soft_delete(
+            user_id, TodoModel.id == any_(_ids_param([str(i) for i in todo_ids]))
+        )
+
+    async def delete_descendants(self, todo: Todo) -> List[Todo]:
+        """Soft delete over the idx_user_path range below the todo"""
+        low, high = subtree_range(todo.path)
+        return await self._soft_delete(todo.user_id, TodoModel.path > low, TodoModel.path < high)
+
+    async def _soft_delete(self, user_id: str, *criteria) -> List[Todo]:
+        now = datetime.utcnow()
+        result = await self.session.execute(
+            update(TodoModel)
+            .where(*criteria, TodoModel.user_id == user_id, TodoModel.deleted_at.is_(None))
+            .values(
+                deleted_at=now,
+                updated_at=now,
+                version=TodoModel.version + 1,
+                # Syncing clients learn of deletes from the tombstone; this
+                # stamp is for the daily stats refresh.
+                change_seq=todo_change_seq.next_value(),
+            )
+            .returning(TodoModel)
+            # Fresh values even for rows already in the identity map.
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        models = result.scalars().all()
+        if not models:
+            return []
+        deleted = [self._to_entity(model) for model in models]
+        await append_history(
+            self.session,
+            [
+                record_version(todo, model.version, {}, now, deleted=True)
+                for todo, model in zip(deleted, models)
+            ],
+        )
+
+        await self.session.execute(
+            insert(TodoTombstoneModel)
+            .values(
+                [
+                    {
+                        "todo_id": str(todo.id),
+                        "user_id": user_id,
+                        "change_seq": todo_change_seq.next_value(),
+                        "deleted_at": now,
+                    }
+                    for todo in deleted
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[TodoTombstoneModel.todo_id])
+        )
+        return deleted
 
     async def exists(self, todo_id: TodoId) -> bool:
         result = await self.session.execute(
             select(func.count())
             .select_from(TodoModel)
-            .where(TodoModel.id == str(todo_id))
+            .where(TodoModel.id == str(todo_id), TodoModel.deleted_at.is_(None))
         )
         return result.scalar() > 0
 
+    async def complete_descendants(self, todo: Todo) -> List[Todo]:
+        """One UPDATE over the idx_user_path range below the todo"""
+        low, high = subtree_range(todo.path)
+        now = todo.completed_at or datetime.utcnow()
+        result = await self.session.execute(
+            update(TodoModel)
+            .where(
+                TodoModel.user_id == todo.user_id,
+                TodoModel.path > low,
+                TodoModel.path < high,
+                TodoModel.deleted_at.is_(None),
+                TodoModel.status.not_in(
+                    [TodoStatus.COMPLETED.value, TodoStatus.CANCELLED.value]
+                ),
+            )
+            .values(
+                status=TodoStatus.COMPLETED.value,
+                completed_at=now,
+                updated_at=now,
+                change_seq=todo_change_seq.next_value(),
+                version=TodoModel.version + 1,
+            )
+            .returning(TodoModel)
+            # Fresh values even for rows already in the identity map.
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        models = result.scalars().all()
+        completed = [self._to_entity(model) for model in models]
+        await append_history(
+            self.session,
+            [
+                record_version(
+                    todo, model.version, changed_fields(todo, ("status", "completed_at")), now
+                )
+                for todo, model in zip(completed, models)
+            ],
+        )
+        return completed
+
+    async def unassign_project(self, project_id: ProjectId, user_id: str) -> List[TodoId]:
+        """One UPDATE over the project's idx_user_project_status range"""
+        now = datetime.utcnow()
+        result = await self.session.execute(
+            update(TodoModel)
+            .where(
+                TodoModel.user_id == user_id,
+                TodoModel.project_id == str(project_id),
+                TodoModel.deleted_at.is_(None),
+            )
+            .values(
+                project_id=None,
+                updated_at=now,
+                change_seq=todo_change_seq.next_value(),
+                version=TodoModel.version + 1,
+            )
+            .returning(TodoModel)
+            # Fresh values even for rows already in the identity map.
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        models = result.scalars().all()
+        await append_history(
+            self.session,
+            [
+                record_version(self._to_entity(model), model.version, {"project_id": None}, now)
+                for model in models
+            ],
+        )
+        return [TodoId(str(model.id)) for model in models]
+
     def _to_entity(self, model: TodoModel) -> Todo:
         return Todo(
             id=TodoId(str(model.id)),
@@ -78,4 +329,102 @@ class SQLAlchemyTodoRepository(TodoRepository):
             completed_at=model.completed_at,
             due_date=model.due_date,
             tags=model.tags,
+            user_id=model.user_id,
+            recurrence=RecurrenceRule.parse(model.recurrence) if model.recurrence else None,
+            series_id=TodoId(str(model.series_id)) if model.series_id else None,
+            occurrence_index=model.occurrence_index or 1,
+            parent_id=TodoId(str(model.parent_id)) if model.parent_id else None,
+            path=model.path or "",
+            project_id=ProjectId(str(model.project_id)) if model.project_id else None,
+        )
+
+
+class SQLAlchemyProjectRepository(ProjectRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def save(self, project: Project) -> None:
+        model = await self.session.get(ProjectModel, str(project.id))
+
+        if model is None:
+            model = ProjectModel(
+                id=str(project.id),
+                user_id=project.user_id,
+                created_at=project.created_at,
+                open_count=project.open_count,
+                completed_count=project.completed_count,
+            )
+
+        model.name = project.name
+        model.updated_at = project.updated_at
+
+        self.session.add(model)
+        await self.session.flush()
+
+    async def find_by_id(self, project_id: ProjectId) -> Optional[Project]:
+        model = await self.session.get(ProjectModel, str(project_id))
+        return self._to_entity(model) if model is not None else None
+
+    async def delete(self, project_id: ProjectId, user_id: str) -> bool:
+        result = await self.session.execute(
+            delete(ProjectModel)
+            .where(ProjectModel.id == str(project_id), ProjectModel.user_id == user_id)
+            .returning(ProjectModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar() is not None
+
+    async def adjust_counts(
+        self, user_id: str, deltas: Dict[ProjectId, Tuple[int, int]]
+    ) -> Set[ProjectId]:
+        """All deltas in one UPDATE ... FROM (VALUES ...), as relative increments.
+
+        Increments commute, so concurrent writers only queue on the row
+        lock of a project they share and never overwrite each other's counts.
+        The rows are locked in id order first: the UPDATE's join may visit
+        them in any order, and writers touching several projects would
+        otherwise deadlock.
+        """
+        if not deltas:
+            return set()
+
+        ids = sorted(str(project_id) for project_id in deltas)
+        await self.session.execute(
+            select(ProjectModel.id)
+            .where(ProjectModel.id == any_(_ids_param(ids)), ProjectModel.user_id == user_id)
+            .order_by(ProjectModel.id)
+            .with_for_update()
+        )
+        changes = values(
+            column("id", UUID(as_uuid=False)),
+            column("open_delta", Integer),
+            column("completed_delta", Integer),
+            name="changes",
+        ).data(
+            [
+                (str(project_id), open_delta, completed_delta)
+                for project_id, (open_delta, completed_delta) in deltas.items()
+            ]
+        )
+        result = await self.session.execute(
+            update(ProjectModel)
+            .where(ProjectModel.id == changes.c.id, ProjectModel.user_id == user_id)
+            .values(
+                open_count=ProjectModel.open_count + changes.c.open_delta,
+                completed_count=ProjectModel.completed_count + changes.c.completed_delta,
+            )
+            .returning(ProjectModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        return {ProjectId(str(project_id)) for project_id in result.scalars()}
+
+    def _to_entity(self, model: ProjectModel) -> Project:
+        return Project(
+            id=ProjectId(str(model.id)),
+            name=model.name,
+            user_id=model.user_id,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            open_count=model.open_count,
+            completed_count=model.completed_count,
         )
@@ -0,0 +1,180 @@
+import hashlib
+from typing import List
+
+from sqlalchemy import Sequence, inspect, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.schema import CreateIndex, CreateSequence, CreateTable
+
+from .database import Base
+from .models import SchemaVersionModel
+
+
+def schema_fingerprint() -> str:
+    """Hash of the DDL the current models would create"""
+    dialect = postgresql.dialect()
+    sequences = {
+        column.default.name: column.default
+        for table in Base.metadata.sorted_tables
+        for column in table.columns
+        if isinstance(column.default, Sequence)
+    }
+    statements = [
+        str(CreateSequence(sequences[name]).compile(dialect=dialect))
+        for name in sorted(sequences)
+    ]
+    for table in Base.metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=dialect)))
+        for index in sorted(table.indexes, key=lambda i: i.name):
+            statements.append(str(CreateIndex(index).compile(dialect=dialect)))
+    return hashlib.sha256("\n".join(statements).encode("utf-8")).hexdigest()
+
+
+STAMP_COMMAND = "python -m infrastructure.persistence.sqlalchemy.schema stamp"
+
+
+class SchemaMismatchError(RuntimeError):
+    """The database holds a schema other than the one the models describe"""
+
+
+def missing_objects(sync_conn) -> List[str]:
+    """Sequences, tables, columns and indexes of the models the database lacks.
+
+    Only presence is compared, not types or definitions; the fingerprint is
+    what proves a schema current, this only recognises one that predates it.
+    """
+    inspector = inspect(sync_conn)
+    missing = []
+    sequences = set(inspector.get_sequence_names())
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            if isinstance(column.default, Sequence) and column.default.name not in sequences:
+                missing.append(f"sequence {column.default.name}")
+    tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in tables:
+            missing.append(f"table {table.name}")
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        missing.extend(
+            f"column {table.name}.{column.name}"
+            for column in table.columns
+            if column.name not in columns
+        )
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        missing.extend(
+            f"index {index.name}" for index in table.indexes if index.name not in indexes
+        )
+    return missing
+
+
+async def ensure_schema(engine: AsyncEngine) -> bool:
+    """Create the schema on a fresh database; True if it was created.
+
+    An existing schema is never altered, since create_all would only add
+    missing tables and leave changed columns and indexes behind. One without
+    a fingerprint (created before fingerprints were stored) is stamped if it
+    has every table, column and index of the models; otherwise, or if its
+    fingerprint does not match, this raises SchemaMismatchError. Apply the
+    migration, then record it with STAMP_COMMAND.
+    """
+    fingerprint = schema_fingerprint()
+
+    async with engine.begin() as conn:
+        existing = set(await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names()))
+        ours = existing.intersection(Base.metadata.tables)
+        if not ours:
+            await conn.run_sync(Base.metadata.create_all)
+            await _stamp(conn, fingerprint)
+            return True
+
+        current = None
+        if SchemaVersionModel.__tablename__ in existing:
+            current = (
+                await conn.execute(
+                    select(SchemaVersionModel.fingerprint).where(SchemaVersionModel.id == 1)
+                )
+            ).scalar()
+        if current == fingerprint:
+            return False
+
+        if current is None:
+            missing = await conn.run_sync(missing_objects)
+            if not missing:
+                await conn.run_sync(Base.metadata.create_all)
+                await _stamp(conn, fingerprint)
+                return False
+            raise SchemaMismatchError(
+                "schema has no fingerprint and lacks " + ", ".join(missing)
+                + f". Migrate the database, then run `{STAMP_COMMAND}` from src/."
+            )
+
+        raise SchemaMismatchError(
+            f"schema fingerprint is {current}, models expect {fingerprint}. "
+            f"Migrate the database, then run `{STAMP_COMMAND}` from src/, "
+            "or set skip_schema_setup."
+        )
+
+
+async def stamp_schema(engine: AsyncEngine) -> List[str]:
+    """Record that the database now matches the models, e.g. after a migration.
+
+    Nothing is stamped while objects of the models are missing; those are
+    returned instead.
+    """
+    async with engine.begin() as conn:
+        missing = await conn.run_sync(missing_objects)
+        # schema_version itself is created here if the migration did not.
+        if missing and missing != [f"table {SchemaVersionModel.__tablename__}"]:
+            return missing
+        await conn.run_sync(
+            lambda sync_conn: SchemaVersionModel.__table__.create(sync_conn, checkfirst=True)
+        )
+        await _stamp(conn, schema_fingerprint())
+    return []
+
+
+async def _stamp(conn, fingerprint: str) -> None:
+    stmt = insert(SchemaVersionModel).values(id=1, fingerprint=fingerprint)
+    await conn.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[SchemaVersionModel.id],
+            set_={"fingerprint": stmt.excluded.fingerprint},
+        )
+    )
+
+
+async def _main(command: str) -> int:
+    from .database import engine
+
+    try:
+        if command == "stamp":
+            missing = await stamp_schema(engine)
+            if missing:
+                print("Not stamped; the database lacks " + ", ".join(missing))
+                return 1
+            print(f"Stamped schema fingerprint {schema_fingerprint()}")
+            return 0
+
+        async with engine.connect() as conn:
+            missing = await conn.run_sync(missing_objects)
+        print(f"models fingerprint: {schema_fingerprint()}")
+        for item in missing:
+            print(f"  missing {item}")
+        return 1 if missing else 0
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+    import sys
+
+    parser = argparse.ArgumentParser(
+        prog="schema",
+        description="Check the database against the models, or stamp it after a migration",
+    )
+    parser.add_argument("command", choices=["check", "stamp"])
+    sys.exit(asyncio.run(_main(parser.parse_args().command)))
@@ -1,20 +1,33 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from application.interfaces.unit_of_work import UnitOfWork
 
-from .repositories import SQLAlchemyTodoRepository
+from .repositories import SQLAlchemyProjectRepository, SQLAlchemyTodoRepository
 
 
 class SQLAlchemyUnitOfWork(UnitOfWork):
-    def __init__(self, session: AsyncSession):
-        self.session = session
+    """Opens its session on entry and closes it on exit.
+
+    The connection is checked out at the first statement and returned when
+    the block ends, rather than when the request finishes.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker):
+        self.session_factory = session_factory
+        self.session = None
 
     async def __aenter__(self):
+        self.session = self.session_factory()
         self.todos = SQLAlchemyTodoRepository(self.session)
+        self.projects = SQLAlchemyProjectRepository(self.session)
         return self
 
     async def __aexit__(self, *args):
-        await self.rollback()
+        try:
+            await self.rollback()
+        finally:
+            await self.session.close()
+            self.session = None
 
     async def commit(self):
         await self.session.commit()
@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from application.interfaces.event_bus import EventBus
+from domain.entities.todo import Todo
+from domain.events.todo_events import (
+    TodoCompleted,
+    TodoCreated,
+    TodoDeleted,
+    TodoDueSoon,
+    TodoOverdue,
+    TodosImported,
+    TodoUpdated,
+)
+from domain.value_objects.todo_id import TodoId
+from domain.value_objects.todo_status import TodoStatus
+
+from .timing_wheel import TimingWheel
+
+logger = logging.getLogger(__name__)
+
+EPOCH = datetime(1970, 1, 1)
+DUE_SOON = "due_soon"
+OVERDUE = "overdue"
+
+_Reminder = Tuple[str, TodoId, str, datetime]
+
+
+def _seconds(moment: datetime) -> float:
+    return (moment - EPOCH).total_seconds()
+
+
+def _is_open(todo: Todo) -> bool:
+    return todo.status not in (TodoStatus.COMPLETED, TodoStatus.CANCELLED)
+
+
+class LocalLeadership:
+    """Single-process leadership, for the in-memory backend"""
+
+    async def ensure(self) -> bool:
+        return True
+
+    async def release(self) -> None:
+        pass
+
+
+class ReminderScheduler:
+    """Fires TodoDueSoon lead_time before a todo's due date and TodoOverdue at it.
+
+    Only the leader schedules. Every refresh it loads the open todos due in
+    the next lead_time + window (one idx_due_date range scan, at most
+    max_loaded rows) into a timing wheel and drops timers for todos that
+    left the range. Between refreshes, this worker's own creates, due date
+    changes, completions and deletes reschedule just the todos involved;
+    writes on other workers are picked up by the next refresh. Before an
+    event is published the todo is re-read, so a reminder for a todo that
+    has since been completed, deleted or moved is dropped.
+    """
+
+    def __init__(
+        self,
+        todos,
+        event_bus: EventBus,
+        lead_time: timedelta = timedelta(minutes=15),
+        window: timedelta = timedelta(minutes=10),
+        tick_seconds: float = 1.0,
+        max_loaded: int = 100_000,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ):
+        self.todos = todos
+        self.event_bus = event_bus
+        self.lead_time = lead_time
+        self.window = window
+        self.tick_seconds = tick_seconds
+        self.max_loaded = max_loaded
+        self.clock = clock
+        self.active = False
+        self._wheel: Optional[TimingWheel] = None
+        # Todos with timers, and the due date they were scheduled for.
+        self._scheduled: Dict[TodoId, datetime] = {}
+        # Only todos due before the horizon are held; later ones wait for a refresh.
+        self._horizon = datetime.min
+        self._dirty: Dict[TodoId, str] = {}
+        self._refresh_requested = False
+
+    async def run(self, leadership, refresh_seconds: float) -> None:
+        next_refresh = 0.0
+        try:
+            while True:
+                try:
+                    if time.monotonic() >= next_refresh:
+                        next_refresh = time.monotonic() + refresh_seconds
+                        await self._check_leadership(leadership)
+                    if self.active:
+                        await self.tick()
+                except Exception:
+                    logger.exception("Reminder scheduler iteration failed")
+                await asyncio.sleep(self.tick_seconds)
+        finally:
+            self.deactivate()
+            await leadership.release()
+
+    async def _check_leadership(self, leadership) -> None:
+        try:
+            leader = await leadership.ensure()
+        except Exception:
+            logger.exception("Reminder leader election failed")
+            leader = False
+        if leader:
+            await self.refresh()
+        else:
+            self.deactivate()
+
+    def deactivate(self) -> None:
+        self.active = False
+        self._wheel = None
+        self._scheduled.clear()
+        self._dirty.clear()
+        self._horizon = datetime.min
+
+    async def refresh(self) -> None:
+        """Re-sync the wheel with the todos due in the next lead_time + window"""
+        self._refresh_requested = False
+        now = self.clock()
+        horizon = now + self.lead_time + self.window
+        todos = await self.todos.find_due_between(now, horizon, self.max_loaded)
+        if len(todos) >= self.max_loaded:
+            horizon = todos[-1].due_date
+            logger.warning(
+                "Reminder window truncated to %s by max_loaded=%d", horizon, self.max_loaded
+            )
+
+        if not self.active:
+            self._wheel = TimingWheel(self.tick_seconds, start=_seconds(now))
+            self.active = True
+        self._horizon = horizon
+
+        loaded = {todo.id: todo for todo in todos}
+        for todo_id in [todo_id for todo_id in self._scheduled if todo_id not in loaded]:
+            self.cancel(todo_id)
+        for todo in todos:
+            if self._scheduled.get(todo.id) != todo.due_date:
+                self._schedule(todo, now, catch_up=False)
+
+    async def tick(self) -> None:
+        if self._refresh_requested:
+            await self.refresh()
+        if self._dirty:
+            await self._reschedule_dirty()
+        expired = self._wheel.advance(_seconds(self.clock()))
+        if expired:
+            await self._fire(expired)
+
+    async def handle_event(self, event) -> None:
+        if not self.active:
+            return
+        if isinstance(event, (TodoCompleted, TodoDeleted)):
+            self.cancel(event.todo_id)
+            self._dirty.pop(event.todo_id, None)
+        elif isinstance(event, TodoCreated):
+            self._dirty[event.todo_id] = event.user_id
+        elif isinstance(event, TodoUpdated):
+            if "due_date" in event.changed_fields:
+                self._dirty[event.todo_id] = event.user_id
+        elif isinstance(event, TodosImported):
+            self._refresh_requested = True
+
+    def cancel(self, todo_id: TodoId) -> None:
+        if self._scheduled.pop(todo_id, None) is None:
+            return
+        self._wheel.cancel((todo_id, DUE_SOON))
+        self._wheel.cancel((todo_id, OVERDUE))
+
+    def _schedule(self, todo: Todo, now: datetime, catch_up: bool) -> None:
+        """Timers for one todo; catch_up fires a due-soon already inside lead_time now"""
+        self.cancel(todo.id)
+        due_date = todo.due_date
+        if due_date is None or not _is_open(todo) or not now < due_date < self._horizon:
+            return
+
+        reminder_at = due_date - self.lead_time
+        if reminder_at > now or catch_up:
+            self._wheel.schedule(
+                (todo.id, DUE_SOON),
+                _seconds(max(reminder_at, now)),
+                (DUE_SOON, todo.id, todo.user_id, due_date),
+            )
+        self._wheel.schedule(
+            (todo.id, OVERDUE), _seconds(due_date), (OVERDUE, todo.id, todo.user_id, due_date)
+        )
+        self._scheduled[todo.id] = due_date
+
+    async def _reschedule_dirty(self) -> None:
+        # Todos are read here, once per user and tick, rather than once per
+        # event in handle_event.
+        dirty, self._dirty = self._dirty, {}
+        by_user: Dict[str, List[TodoId]] = defaultdict(list)
+        for todo_id, user_id in dirty.items():
+            by_user[user_id].append(todo_id)
+
+        now = self.clock()
+        for user_id, todo_ids in by_user.items():
+            found = {todo.id: todo for todo in await self.todos.find_by_ids(todo_ids, user_id)}
+            for todo_id in todo_ids:
+                todo = found.get(todo_id)
+                if todo is None:
+                    self.cancel(todo_id)
+                else:
+                    self._schedule(todo, now, catch_up=True)
+
+    async def _fire(self, expired: List[_Reminder]) -> None:
+        by_user: Dict[str, List[TodoId]] = defaultdict(list)
+        for _, todo_id, user_id, _ in expired:
+            by_user[user_id].append(todo_id)
+        current: Dict[TodoId, Todo] = {}
+        for user_id, todo_ids in by_user.items():
+            for todo in await self.todos.find_by_ids(list(dict.fromkeys(todo_ids)), user_id):
+                current[todo.id] = todo
+
+        for kind, todo_id, user_id, due_date in expired:
+            if kind == OVERDUE:
+                self._scheduled.pop(todo_id, None)
+            todo = current.get(todo_id)
+            if todo is None or not _is_open(todo) or todo.due_date != due_date:
+                continue
+            event_type = TodoDueSoon if kind == DUE_SOON else TodoOverdue
+            await self.event_bus.publish(
+                event_type(todo_id=todo_id, user_id=user_id, due_date=due_date)
+            )
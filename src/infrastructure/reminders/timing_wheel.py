@@ -0,0 +1,100 @@
+import math
+from typing import Any, Dict, Hashable, List, Tuple
+
+_Bucket = Dict[Hashable, Tuple[int, Any]]
+
+
+class TimingWheel:
+    """Hierarchical timing wheel of keyed timers.
+
+    Level 0 has `slots` buckets of one tick each, and a bucket on level n
+    spans a full turn of level n - 1. A timer is filed on the lowest level
+    that reaches its deadline and drops a level each time the wheel turns
+    onto its bucket, so schedule and cancel are O(1) and a timer is moved at
+    most `levels` times before it fires. Deadlines beyond the top level wait
+    in an overflow bucket that is re-checked once per top-level bucket.
+    """
+
+    def __init__(
+        self,
+        tick_seconds: float = 1.0,
+        slots: int = 64,
+        levels: int = 4,
+        start: float = 0.0,
+    ):
+        self.tick_seconds = tick_seconds
+        self.slots = slots
+        self.levels = levels
+        self._tick = math.floor(start / tick_seconds)
+        self._buckets: List[List[_Bucket]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._overflow: _Bucket = {}
+        self._where: Dict[Hashable, _Bucket] = {}
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    def schedule(self, key: Hashable, deadline: float, payload: Any) -> None:
+        """(Re)schedule `key`; deadlines already past fire on the next tick"""
+        self.cancel(key)
+        due_tick = max(math.ceil(deadline / self.tick_seconds), self._tick + 1)
+        self._place(key, due_tick, payload)
+
+    def cancel(self, key: Hashable) -> bool:
+        bucket = self._where.pop(key, None)
+        if bucket is None:
+            return False
+        del bucket[key]
+        return True
+
+    def advance(self, now: float) -> List[Any]:
+        """Turn the wheel to `now`, returning the payloads of the timers that fell due"""
+        target = math.floor(now / self.tick_seconds)
+        expired = []
+        while self._tick < target:
+            if not self._where:
+                self._tick = target
+                break
+            self._tick += 1
+            self._cascade()
+            bucket = self._buckets[0][self._tick % self.slots]
+            for key, (_, payload) in bucket.items():
+                del self._where[key]
+                expired.append(payload)
+            bucket.clear()
+        return expired
+
+    def _place(self, key: Hashable, due_tick: int, payload: Any) -> None:
+        delta = due_tick - self._tick
+        width = 1
+        for level in range(self.levels):
+            if delta < width * self.slots:
+                bucket = self._buckets[level][(due_tick // width) % self.slots]
+                break
+            width *= self.slots
+        else:
+            bucket = self._overflow
+        bucket[key] = (due_tick, payload)
+        self._where[key] = bucket
+
+    def _cascade(self) -> None:
+        # Higher levels first: a timer may drop several levels in one tick,
+        # down to the level 0 bucket that is about to fire.
+        top_width = self.slots ** (self.levels - 1)
+        if self._overflow and self._tick % top_width == 0:
+            self._refile(self._overflow)
+
+        for level in range(self.levels - 1, 0, -1):
+            width = self.slots**level
+            if self._tick % width == 0:
+                self._refile(self._buckets[level][(self._tick // width) % self.slots])
+
+    def _refile(self, bucket: _Bucket) -> None:
+        entries = list(bucket.items())
+        bucket.clear()
+        for key, (due_tick, payload) in entries:
+            self._place(key, due_tick, payload)
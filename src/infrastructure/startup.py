@@ -0,0 +1,18 @@
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+
+class StartupPhases:
+    """Wall-clock duration of each named lifespan phase, in milliseconds"""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, phase: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = (time.perf_counter() - started) * 1000
@@ -1,35 +1,141 @@
+import asyncio
 from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import Optional
 
-import uvicorn
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 from pydantic import ValidationError
 
 from config.settings import get_settings
 from domain.exceptions import DomainException
+from infrastructure.api.compression import CompressionMiddleware
+from infrastructure.api.diagnostics import DiagnosticsMiddleware
 from infrastructure.api.exception_handlers import (
     domain_exception_handler,
     validation_exception_handler,
 )
+from infrastructure.api.v1.dependencies import (
+    get_broker_event_bus,
+    get_query_diagnostics,
+    get_reminder_scheduler,
+    memory_backend_overrides,
+)
+from infrastructure.api.v1.endpoints.diagnostics import router as diagnostics_router
+from infrastructure.api.v1.endpoints.projects import router as projects_router
 from infrastructure.api.v1.endpoints.todos import router as todos_router
-from infrastructure.events.handlers import register_event_handlers
-from infrastructure.persistence.sqlalchemy.database import Base, engine
+from infrastructure.events.consumer import PartitionedConsumer
+from infrastructure.events.handlers import build_event_consumer, register_event_handlers
+from infrastructure.persistence.sqlalchemy.database import engine
+from infrastructure.reminders.scheduler import LocalLeadership
+from infrastructure.startup import StartupPhases
 
 settings = get_settings()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    register_event_handlers()
+    phases = StartupPhases()
+    app.state.startup_phases = phases.timings
+
+    with phases.measure("event_handlers"):
+        register_event_handlers()
+        consumer = await start_event_consumer()
+        # Read by GET /diagnostics/event-consumer for partition lag.
+        app.state.event_consumer = consumer
+
+    if settings.persistence_backend == "memory":
+        reminders = start_reminder_scheduler(LocalLeadership())
+        yield
+        await stop_background_tasks(reminders)
+        await stop_event_consumer(consumer)
+        return
+
+    # Only needed by the Postgres backend; kept out of the import path.
+    from infrastructure.persistence.sqlalchemy.daily_stats import run_daily_stats_refresh
+    from infrastructure.persistence.sqlalchemy.leader_election import (
+        AdvisoryLockLeadership,
+    )
+    from infrastructure.persistence.sqlalchemy.maintenance import (
+        run_deleted_todo_purge,
+        run_tombstone_compaction,
+    )
+    from infrastructure.persistence.sqlalchemy.schema import ensure_schema
+
+    with phases.measure("schema"):
+        if not settings.skip_schema_setup:
+            await ensure_schema(engine)
+
+    background_tasks = [
+        asyncio.create_task(
+            run_tombstone_compaction(
+                retention=timedelta(days=settings.tombstone_retention_days),
+                interval_seconds=settings.tombstone_compaction_interval_seconds,
+                batch_size=settings.tombstone_compaction_batch_size,
+            )
+        ),
+        asyncio.create_task(
+            run_deleted_todo_purge(
+                grace_period=timedelta(hours=settings.todo_purge_grace_hours),
+                interval_seconds=settings.todo_purge_interval_seconds,
+                batch_size=settings.todo_purge_batch_size,
+                pause_seconds=settings.todo_purge_batch_pause_seconds,
+            )
+        ),
+        *start_reminder_scheduler(
+            AdvisoryLockLeadership(engine, settings.reminder_lock_key)
+        ),
+    ]
+    if settings.daily_stats_refresh_enabled:
+        background_tasks.append(
+            asyncio.create_task(
+                run_daily_stats_refresh(
+                    AdvisoryLockLeadership(engine, settings.daily_stats_lock_key),
+                    interval_seconds=settings.daily_stats_refresh_interval_seconds,
+                    batch_size=settings.daily_stats_batch_size,
+                )
+            )
+        )
 
     yield
 
+    # Awaited before dispose() so the reminder leader can release its lock.
+    await stop_background_tasks(background_tasks)
+    await stop_event_consumer(consumer)
     await engine.dispose()
 
 
+async def start_event_consumer() -> Optional[PartitionedConsumer]:
+    bus = get_broker_event_bus()
+    if bus is None:
+        return None
+    consumer = build_event_consumer(bus)
+    await consumer.start()
+    return consumer
+
+
+async def stop_event_consumer(consumer: Optional[PartitionedConsumer]) -> None:
+    # Stopped after the reminder scheduler, which can still publish.
+    if consumer is not None:
+        await consumer.stop()
+
+
+def start_reminder_scheduler(leadership) -> list[asyncio.Task]:
+    if not settings.reminders_enabled:
+        return []
+    scheduler = get_reminder_scheduler()
+    return [
+        asyncio.create_task(
+            scheduler.run(leadership, refresh_seconds=settings.reminder_refresh_seconds)
+        )
+    ]
+
+
+async def stop_background_tasks(tasks: list[asyncio.Task]) -> None:
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
@@ -38,18 +144,45 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+if settings.cors_origins:
+    from fastapi.middleware.cors import CORSMiddleware
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_level=settings.compression_brotli_level,
+        zstd_level=settings.compression_zstd_level,
+    )
+
+# Hooks are always installed; each checks the runtime switch, so diagnostics
+# can be turned on through the API without a restart.
+app.add_middleware(DiagnosticsMiddleware, diagnostics=get_query_diagnostics())
+
+if settings.persistence_backend == "memory":
+    app.dependency_overrides.update(memory_backend_overrides())
+else:
+    from infrastructure.persistence.sqlalchemy.diagnostics import (
+        install_query_diagnostics,
+    )
+
+    install_query_diagnostics(engine, get_query_diagnostics())
 
 app.add_exception_handler(DomainException, domain_exception_handler)
 app.add_exception_handler(ValidationError, validation_exception_handler)
 
 app.include_router(todos_router, prefix=settings.api_v1_prefix)
+app.include_router(projects_router, prefix=settings.api_v1_prefix)
+app.include_router(diagnostics_router, prefix=settings.api_v1_prefix)
 
 
 @app.get("/health")
@@ -58,4 +191,6 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=settings.debug)
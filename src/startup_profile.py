@@ -0,0 +1,87 @@
+"""startup-profile: import-time and lifespan phase timings of the app.
+
+Usage (from src/):
+    python -m startup_profile [--top 15] [--budget-ms N] [--skip-lifespan]
+
+Exits with status 1 when importing `main` takes longer than the budget
+(settings.startup_import_budget_ms unless --budget-ms is given), so CI can
+fail on cold-start regressions.
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def measure_imports(module: str = "main") -> Tuple[float, List[Tuple[str, float]]]:
+    """Import `module` in a fresh interpreter; return total ms and ms per top-level package"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total_us = 0
+    per_package: Dict[str, int] = defaultdict(int)
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        per_package[name.split(".")[0]] += int(self_us)
+        if name == module and len(indent) == 1:
+            total_us = int(cumulative_us)
+
+    ranked = sorted(per_package.items(), key=lambda item: item[1], reverse=True)
+    return total_us / 1000, [(name, us / 1000) for name, us in ranked]
+
+
+async def measure_lifespan() -> Dict[str, float]:
+    from main import app, lifespan
+
+    async with lifespan(app):
+        pass
+    return dict(app.state.startup_phases)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="startup-profile")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--skip-lifespan", action="store_true")
+    args = parser.parse_args()
+
+    total_ms, packages = measure_imports()
+    print(f"import main: {total_ms:.1f} ms")
+    for name, ms in packages[: args.top]:
+        print(f"  {name:<30} {ms:8.1f} ms")
+
+    if not args.skip_lifespan:
+        print("lifespan phases:")
+        for phase, ms in asyncio.run(measure_lifespan()).items():
+            print(f"  {phase:<30} {ms:8.1f} ms")
+
+    budget = args.budget_ms
+    if budget is None:
+        from config.settings import get_settings
+
+        budget = get_settings().startup_import_budget_ms
+
+    if total_ms > budget:
+        print(f"FAIL: import time {total_ms:.1f} ms exceeds budget {budget:.1f} ms")
+        return 1
+    print(f"OK: import time within budget {budget:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
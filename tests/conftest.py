@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The app is imported from src/, as uvicorn runs it, against the in-memory
+# backend so that no database is needed.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("PERSISTENCE_BACKEND", "memory")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
@@ -0,0 +1,41 @@
+from fastapi.testclient import TestClient
+
+from config.settings import get_settings
+from main import app
+
+AUTH = {"Authorization": "Bearer test"}
+
+
+def test_deleting_a_todo_deletes_its_subtasks():
+    client = TestClient(app)
+    prefix = get_settings().api_v1_prefix + "/todos"
+
+    def create(title, parent_id=None):
+        body = {"title": title, "parent_id": parent_id}
+        return client.post(prefix + "/", json=body, headers=AUTH).json()["id"]
+
+    parent = create("Parent")
+    child = create("Child", parent)
+    grandchild = create("Grandchild", child)
+    sibling = create("Sibling")
+
+    assert client.delete(f"{prefix}/{parent}", headers=AUTH).status_code == 204
+
+    for todo_id in (parent, child, grandchild):
+        assert client.get(f"{prefix}/{todo_id}", headers=AUTH).status_code == 404
+    assert client.get(f"{prefix}/{sibling}", headers=AUTH).status_code == 200
+
+
+def test_batch_delete_reports_only_requested_ids():
+    client = TestClient(app)
+    prefix = get_settings().api_v1_prefix + "/todos"
+
+    parent = client.post(prefix + "/", json={"title": "Parent"}, headers=AUTH).json()["id"]
+    child = client.post(
+        prefix + "/", json={"title": "Child", "parent_id": parent}, headers=AUTH
+    ).json()["id"]
+
+    response = client.post(prefix + ":batchDelete", json={"ids": [parent]}, headers=AUTH)
+
+    assert response.json() == {"deleted": [parent], "missing": []}
+    assert client.get(f"{prefix}/{child}", headers=AUTH).status_code == 404
@@ -0,0 +1,23 @@
+from fastapi.testclient import TestClient
+
+from config.settings import get_settings
+from main import app
+
+AUTH = {"Authorization": "Bearer test"}
+
+
+def test_diagnostics_are_closed_to_users_who_are_not_admins():
+    client = TestClient(app)
+    path = get_settings().api_v1_prefix + "/diagnostics/"
+
+    assert client.get(path, headers=AUTH).status_code == 403
+    assert client.patch(path, json={"enabled": True}, headers=AUTH).status_code == 403
+
+
+def test_diagnostics_admins_can_read_them(monkeypatch):
+    monkeypatch.setattr(get_settings(), "diagnostics_admin_user_ids", ["user123"])
+    client = TestClient(app)
+
+    response = client.get(get_settings().api_v1_prefix + "/diagnostics/", headers=AUTH)
+
+    assert response.status_code == 200
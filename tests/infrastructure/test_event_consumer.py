@@ -0,0 +1,101 @@
+import asyncio
+import random
+from collections import defaultdict
+
+from domain.events.todo_events import TodoCreated
+from domain.value_objects.todo_id import TodoId
+from infrastructure.events.broker import BrokerEventBus, InProcessBroker
+from infrastructure.events.consumer import PartitionedConsumer
+
+
+def created(user_id: str, title: str) -> TodoCreated:
+    return TodoCreated(todo_id=TodoId.generate(), title=title, user_id=user_id)
+
+
+async def consume(bus: BrokerEventBus, events, until, concurrency: int = 4):
+    consumer = PartitionedConsumer(
+        bus.broker,
+        bus.dispatcher,
+        concurrency=concurrency,
+        max_retries=2,
+        retry_backoff_seconds=0,
+        ack_interval_seconds=0.01,
+    )
+    await consumer.start()
+    for event in events:
+        await bus.publish(event)
+    await asyncio.wait_for(_wait_for(until), timeout=5)
+    await consumer.stop()
+    return consumer
+
+
+async def _wait_for(condition) -> None:
+    while not condition():
+        await asyncio.sleep(0.001)
+
+
+def test_each_users_events_are_handled_in_publish_order():
+    rng = random.Random(3)
+    events = [created(f"user-{rng.randrange(10)}", str(i)) for i in range(300)]
+    handled = defaultdict(list)
+
+    async def handler(event):
+        await asyncio.sleep(rng.random() / 1000)
+        handled[event.user_id].append(int(event.title))
+
+    bus = BrokerEventBus(InProcessBroker(partitions=4))
+    bus.subscribe(TodoCreated, handler)
+    asyncio.run(
+        consume(bus, events, lambda: sum(map(len, handled.values())) == len(events))
+    )
+
+    published = defaultdict(list)
+    for event in events:
+        published[event.user_id].append(int(event.title))
+    assert handled == published
+
+
+def test_a_failing_handler_is_retried_without_rerunning_the_others():
+    calls = defaultdict(int)
+
+    async def succeeds(event):
+        calls["succeeds"] += 1
+
+    async def fails_once(event):
+        calls["fails_once"] += 1
+        if calls["fails_once"] == 1:
+            raise RuntimeError("transient")
+
+    bus = BrokerEventBus(InProcessBroker(partitions=2))
+    bus.subscribe(TodoCreated, succeeds)
+    bus.subscribe(TodoCreated, fails_once)
+    asyncio.run(consume(bus, [created("user-1", "0")], lambda: calls["fails_once"] == 2))
+
+    assert calls == {"succeeds": 1, "fails_once": 2}
+    assert bus.broker.dead_letters == []
+
+
+def test_a_handler_that_keeps_failing_is_dead_lettered_and_its_offset_committed():
+    handled = []
+
+    async def poison(event):
+        if event.title == "poison":
+            raise RuntimeError("always fails")
+        handled.append(event.title)
+
+    bus = BrokerEventBus(InProcessBroker(partitions=2))
+    bus.subscribe(TodoCreated, poison)
+    events = [created("user-1", "poison"), created("user-1", "after")]
+
+    async def run():
+        consumer = await consume(bus, events, lambda: handled == ["after"])
+        return await consumer.metrics()
+
+    metrics = asyncio.run(run())
+
+    [letter] = bus.broker.dead_letters
+    assert letter.message.event.title == "poison"
+    assert letter.message.attempts == 3
+    assert "always fails" in letter.error
+    assert all(partition["lag"] == 0 for partition in metrics["partitions"].values())
+    assert sum(partition["dead_lettered"] for partition in metrics["partitions"].values()) == 1
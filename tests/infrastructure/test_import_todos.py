@@ -0,0 +1,94 @@
+"""POST /todos:import through the ASGI app, on the in-memory backend.
+
+The app is driven the way uvicorn drives it under ASGI spec 2.3: the body
+arrives in several http.request messages and, once it has been read,
+receive() blocks until the client disconnects. Starlette's streaming
+response listens for that disconnect by calling receive() itself, so an
+endpoint still reading the body from its response would hang here.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+from config.settings import get_settings
+from infrastructure.api.v1.dependencies import get_todo_store
+from main import app
+
+CHUNK_SIZE = 1024
+
+
+async def post_import(body: bytes, content_type: str):
+    chunks = [body[start : start + CHUNK_SIZE] for start in range(0, len(body), CHUNK_SIZE)]
+    response_sent = asyncio.Event()
+    messages = []
+
+    async def receive():
+        if chunks:
+            return {"type": "http.request", "body": chunks.pop(0), "more_body": bool(chunks)}
+        await response_sent.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+        if message["type"] == "http.response.body" and not message.get("more_body"):
+            response_sent.set()
+
+    path = get_settings().api_v1_prefix + "/todos:import"
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"content-type", content_type.encode()),
+            (b"authorization", b"Bearer test"),
+        ],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    await asyncio.wait_for(app(scope, receive, send), timeout=10)
+
+    status = messages[0]["status"]
+    body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+    return status, [json.loads(line) for line in body.decode().splitlines()]
+
+
+def test_import_reads_a_multi_chunk_body_and_commits_every_row():
+    rows = [
+        {"title": f"imported {i}", "due_date": "2025-03-01T12:00:00+02:00", "tags": ["bulk"]}
+        for i in range(500)
+    ]
+    rows.append({"title": ""})
+    body = "".join(json.dumps(row) + "\n" for row in rows).encode()
+
+    status, records = asyncio.run(post_import(body, "application/x-ndjson"))
+
+    assert status == 200
+    assert records[-1] == {
+        "type": "summary",
+        "received": 501,
+        "imported": 500,
+        "rejected": 1,
+        "skipped": 0,
+    }
+    assert [r["line"] for r in records if r["type"] == "error"] == [501]
+    imported = [
+        todo
+        for todo in get_todo_store().todos.values()
+        if todo.title.startswith("imported ")
+    ]
+    assert len(imported) == 500
+    # The aware due date is stored as naive UTC.
+    assert {todo.due_date for todo in imported} == {datetime(2025, 3, 1, 10)}
+
+
+def test_import_rejects_unsupported_media_types():
+    status, _ = asyncio.run(post_import(b"{}", "application/json"))
+
+    assert status == 415
@@ -0,0 +1,18 @@
+from fastapi.testclient import TestClient
+
+from config.settings import get_settings
+from main import app
+
+AUTH = {"Authorization": "Bearer test"}
+
+
+def test_websocket_stream_sends_changes_as_json():
+    prefix = get_settings().api_v1_prefix + "/todos"
+    with TestClient(app) as client:
+        with client.websocket_connect(prefix + "/stream") as websocket:
+            created = client.post(prefix + "/", json={"title": 'Say "hi"'}, headers=AUTH)
+            message = websocket.receive_json()
+
+    assert message["event"] == "todo.created"
+    assert message["data"]["todo_id"] == created.json()["id"]
+    assert message["data"]["title"] == 'Say "hi"'
@@ -0,0 +1,18 @@
+import asyncio
+
+from config.settings import get_settings
+from startup_profile import measure_imports, measure_lifespan
+
+
+def test_importing_main_stays_within_the_startup_budget():
+    total_ms, packages = measure_imports()
+
+    budget = get_settings().startup_import_budget_ms
+    assert total_ms <= budget, f"import main took {total_ms:.1f} ms: {packages[:10]}"
+
+
+def test_lifespan_times_each_phase():
+    phases = asyncio.run(measure_lifespan())
+
+    assert "event_handlers" in phases
+    assert all(ms >= 0 for ms in phases.values())